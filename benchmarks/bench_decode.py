@@ -0,0 +1,65 @@
+"""
+Compare the old decode path (``response.json()`` then ``model_validate`` per
+item) with validating the raw bytes through a cached ``TypeAdapter``.
+
+Run with ``python -m benchmarks.bench_decode``.
+"""
+
+import functools
+import json
+import timeit
+import tracemalloc
+from typing import Any, Callable, Tuple
+
+import httpx
+
+from unsplash._parsing import parse_models
+from unsplash.models import Collection, Photo
+
+from .fixtures import collection_page, photo_page
+
+
+def dict_path(body: bytes, model: Any) -> Any:
+    return [
+        model.model_validate(item) for item in httpx.Response(200, content=body).json()
+    ]
+
+
+def bytes_path(body: bytes, model: Any) -> Any:
+    return parse_models(httpx.Response(200, content=body), model)
+
+
+def allocations(fn: Callable[[], Any]) -> Tuple[int, int]:
+    """Peak traced bytes during ``fn`` and live blocks held once it returns."""
+    tracemalloc.start()
+    result = fn()
+    _, peak = tracemalloc.get_traced_memory()
+    blocks = sum(
+        stat.count for stat in tracemalloc.take_snapshot().statistics("filename")
+    )
+    tracemalloc.stop()
+    del result
+    return peak, blocks
+
+
+def bench(label: str, model: Any, body: bytes, number: int = 200) -> None:
+    for name, path in (
+        ("dict + model_validate", dict_path),
+        ("bytes + TypeAdapter", bytes_path),
+    ):
+        call = functools.partial(path, body, model)
+        seconds = min(timeit.repeat(call, number=number, repeat=3)) / number
+        peak, blocks = allocations(call)
+        print(
+            f"{label:<22} {name:<22} {seconds * 1e3:7.3f} ms/page   "
+            f"peak {peak / 1024:8.1f} KiB   {blocks:6d} blocks"
+        )
+
+
+def main() -> None:
+    bench("Photo (30/page)", Photo, json.dumps(photo_page()).encode())
+    bench("Collection (30/page)", Collection, json.dumps(collection_page()).encode())
+
+
+if __name__ == "__main__":
+    main()
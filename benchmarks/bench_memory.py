@@ -0,0 +1,65 @@
+"""
+Retained memory per photo for ``Photo`` models versus ``CompactPhoto``.
+
+Run with ``python -m benchmarks.bench_memory``.
+"""
+
+import gc
+import json
+import tracemalloc
+from typing import Any, Callable, List
+
+import httpx
+
+from unsplash._parsing import parse_models
+from unsplash.models import Photo, compact
+
+from .fixtures import photo_page
+
+PAGES = 100
+AUTHORS = 50
+
+
+def pages() -> List[bytes]:
+    return [
+        json.dumps(photo_page(page, authors=AUTHORS)).encode()
+        for page in range(1, PAGES + 1)
+    ]
+
+
+def models(bodies: List[bytes]) -> List[Photo]:
+    photos: List[Photo] = []
+    for body in bodies:
+        photos.extend(parse_models(httpx.Response(200, content=body), Photo))
+    return photos
+
+
+def compacted(bodies: List[bytes]) -> Any:
+    return compact(models(bodies))
+
+
+def retained(build: Callable[[List[bytes]], Any], bodies: List[bytes]) -> int:
+    """Bytes still allocated by ``build`` once its temporaries are freed."""
+    gc.collect()
+    tracemalloc.start()
+    result = build(bodies)
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def main() -> None:
+    bodies = pages()
+    count = PAGES * 30
+    before = retained(models, bodies)
+    after = retained(compacted, bodies)
+    print(f"{count} photos by {AUTHORS} authors")
+    print(f"Photo         {before / count:8.0f} bytes/photo")
+    print(f"CompactPhoto  {after / count:8.0f} bytes/photo", end="   ")
+    print(f"x{before / after:.2f} smaller")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Compare validated and trusted (``validate_responses=False``) parsing.
+
+Trusted models are built lazily, so each page is measured three ways: parsed
+only, parsed with a few fields read from every item (a typical ingestion
+worker), and parsed with every nested object built.
+
+Run with ``python -m benchmarks.bench_parse``.
+"""
+
+import functools
+import json
+import timeit
+from typing import Any, Callable, List
+
+import httpx
+
+from unsplash._parsing import parse_models
+from unsplash.models import Collection, Photo
+from unsplash.models._construct import materialize
+
+from .fixtures import collection_page, photo_page
+
+
+def read_photo(photo: Any) -> Any:
+    return photo.id, photo.created_at, photo.urls.small, photo.user.username
+
+
+def read_collection(collection: Any) -> Any:
+    return (
+        collection.id,
+        collection.title,
+        collection.user.username,
+        read_photo(collection.cover_photo),
+    )
+
+
+WORKLOADS = (
+    ("parse", None),
+    ("parse + read", "read"),
+    ("parse + build all", "all"),
+)
+
+
+def bench(
+    label: str,
+    model: type,
+    body: bytes,
+    read: Callable[[Any], Any],
+    number: int = 200,
+) -> None:
+    for workload, touch in WORKLOADS:
+
+        def run(validate: bool, touch: Any = touch) -> None:
+            # a fresh response per call so the parse memo never short-circuits
+            items: List[Any] = parse_models(
+                httpx.Response(200, content=body), model, validate
+            )
+            for item in items:
+                if touch == "read":
+                    read(item)
+                elif touch == "all":
+                    materialize(item)
+
+        validated, trusted = (
+            min(
+                timeit.repeat(functools.partial(run, validate), number=number, repeat=5)
+            )
+            / number
+            for validate in (True, False)
+        )
+        print(
+            f"{label:<22} {workload:<18} validated {validated * 1e3:6.3f} ms/page   "
+            f"trusted {trusted * 1e3:6.3f} ms/page   x{validated / trusted:.2f}"
+        )
+
+
+def main() -> None:
+    bench("Photo (30/page)", Photo, json.dumps(photo_page()).encode(), read_photo)
+    bench(
+        "Collection (30/page)",
+        Collection,
+        json.dumps(collection_page()).encode(),
+        read_collection,
+    )
+
+
+if __name__ == "__main__":
+    main()
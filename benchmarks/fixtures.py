@@ -0,0 +1,155 @@
+"""Realistic Unsplash API payloads for benchmarks."""
+
+from typing import Any, Dict, List
+
+
+def user_payload(n: int = 0) -> Dict[str, Any]:
+    username = f"photographer{n}"
+    return {
+        "id": f"user{n:06d}",
+        "updated_at": "2024-03-01T10:15:00Z",
+        "username": username,
+        "name": f"Photographer {n}",
+        "first_name": "Photographer",
+        "last_name": str(n),
+        "twitter_username": username,
+        "portfolio_url": f"https://{username}.example.com/",
+        "bio": "Landscape and street photography. Available for commissions.",
+        "location": "Montreal, Canada",
+        "total_likes": 1024,
+        "total_photos": 312,
+        "total_collections": 12,
+        "profile_image": {
+            "small": f"https://images.unsplash.com/profile-{n}?ixlib=rb-4.0.3&crop=faces&fit=crop&w=32&h=32",
+            "medium": f"https://images.unsplash.com/profile-{n}?ixlib=rb-4.0.3&crop=faces&fit=crop&w=64&h=64",
+            "large": f"https://images.unsplash.com/profile-{n}?ixlib=rb-4.0.3&crop=faces&fit=crop&w=128&h=128",
+        },
+        "links": {
+            "self": f"https://api.unsplash.com/users/{username}",
+            "html": f"https://unsplash.com/@{username}",
+            "photos": f"https://api.unsplash.com/users/{username}/photos",
+            "likes": f"https://api.unsplash.com/users/{username}/likes",
+            "portfolio": f"https://api.unsplash.com/users/{username}/portfolio",
+            "following": f"https://api.unsplash.com/users/{username}/following",
+            "followers": f"https://api.unsplash.com/users/{username}/followers",
+        },
+    }
+
+
+def photo_payload(n: int = 0, author: int = 0) -> Dict[str, Any]:
+    photo_id = f"photo{n:07d}"
+    raw = f"https://images.unsplash.com/photo-1417325384643-{n:012d}?ixid=M3w1NjY5NzV8MHwxfGFsbHx8fHx8fHx8&ixlib=rb-4.0.3"
+    return {
+        "id": photo_id,
+        "slug": f"a-mountain-lake-at-dawn-{photo_id}",
+        "created_at": f"2024-02-{1 + n % 28:02d}T11:00:28-04:00",
+        "updated_at": f"2024-03-{1 + n % 28:02d}T11:00:01-05:00",
+        "promoted_at": None,
+        "width": 6000 - n % 100,
+        "height": 4000 + n % 100,
+        "color": "#6E633A",
+        "blur_hash": "LFC$yHwc8^$yIAS$%M%00KxukYht",
+        "description": "A mountain lake at dawn, mist rising over the water.",
+        "alt_description": "body of water surrounded by trees during daytime",
+        "urls": {
+            "raw": raw,
+            "full": f"{raw}&q=85&fm=jpg&crop=entropy&cs=srgb",
+            "regular": f"{raw}&q=80&fm=jpg&crop=entropy&cs=tinysrgb&w=1080",
+            "small": f"{raw}&q=80&fm=jpg&crop=entropy&cs=tinysrgb&w=400",
+            "thumb": f"{raw}&q=80&fm=jpg&crop=entropy&cs=tinysrgb&w=200",
+            "small_s3": f"https://s3.us-west-2.amazonaws.com/images.unsplash.com/small/photo-{n}",
+        },
+        "links": {
+            "self": f"https://api.unsplash.com/photos/{photo_id}",
+            "html": f"https://unsplash.com/photos/{photo_id}",
+            "download": f"https://unsplash.com/photos/{photo_id}/download",
+            "download_location": f"https://api.unsplash.com/photos/{photo_id}/download?ixid=M3w1NjY5NzV8MHwx",
+        },
+        "likes": 120 + n % 1000,
+        "liked_by_user": False,
+        "current_user_collections": [],
+        "sponsorship": None,
+        "topics": [
+            {
+                "id": "bo8jQKTaE0Y",
+                "title": "Wallpapers",
+                "slug": "wallpapers",
+                "visibility": "featured",
+            },
+            {
+                "id": "6sMVjTLSkeQ",
+                "title": "Nature",
+                "slug": "nature",
+                "visibility": "featured",
+            },
+        ],
+        "exif": {
+            "make": "Canon",
+            "model": "Canon EOS 5D Mark IV",
+            "name": "Canon, EOS 5D Mark IV",
+            "exposure_time": "1/125",
+            "aperture": "8.0",
+            "focal_length": "35.0",
+            "iso": 100,
+        },
+        "location": {
+            "name": "Lake Louise, Canada",
+            "city": "Lake Louise",
+            "country": "Canada",
+            "position": {"latitude": 51.4254, "longitude": -116.1773},
+        },
+        "views": 150000 + n,
+        "downloads": 1200 + n % 500,
+        "user": user_payload(author),
+    }
+
+
+def collection_payload(n: int = 0) -> Dict[str, Any]:
+    collection_id = f"coll{n:05d}"
+    return {
+        "id": collection_id,
+        "title": f"Mountains {n}",
+        "description": "Peaks, ridges and valleys.",
+        "published_at": "2023-06-01T12:00:00Z",
+        "last_collected_at": "2024-03-01T12:00:00Z",
+        "updated_at": "2024-03-01T12:00:00Z",
+        "curated": False,
+        "featured": True,
+        "total_photos": 240,
+        "private": False,
+        "share_key": "3b0fdb5d6a0c4b7c",
+        "tags": [
+            {"type": "landing_page", "title": "mountain"},
+            {"type": "search", "title": "peak"},
+        ],
+        "links": {
+            "self": f"https://api.unsplash.com/collections/{collection_id}",
+            "html": f"https://unsplash.com/collections/{collection_id}",
+            "photos": f"https://api.unsplash.com/collections/{collection_id}/photos",
+            "related": f"https://api.unsplash.com/collections/{collection_id}/related",
+        },
+        "user": user_payload(n),
+        "cover_photo": photo_payload(n),
+        "preview_photos": [
+            {
+                "id": f"prev{n}{i}",
+                "created_at": "2024-01-01T00:00:00Z",
+                "blur_hash": "LFC$yHwc8^$yIAS$%M%00KxukYht",
+            }
+            for i in range(4)
+        ],
+    }
+
+
+def photo_page(
+    page: int = 1, per_page: int = 30, authors: int = 10
+) -> List[Dict[str, Any]]:
+    start = (page - 1) * per_page
+    return [
+        photo_payload(n, author=n % authors) for n in range(start, start + per_page)
+    ]
+
+
+def collection_page(page: int = 1, per_page: int = 30) -> List[Dict[str, Any]]:
+    start = (page - 1) * per_page
+    return [collection_payload(n) for n in range(start, start + per_page)]
@@ -0,0 +1,138 @@
+"""
+In-process stand-in for the Unsplash API, served through ``httpx.MockTransport``.
+
+Bodies come from ``fixtures`` and are encoded once per page, so a benchmark
+measures the client rather than the fake server. An optional ``latency``
+simulates the network round trip (``time.sleep`` for sync transports,
+``asyncio.sleep`` for async ones).
+"""
+
+import asyncio
+import json
+import time
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+
+from .fixtures import collection_page, collection_payload, photo_page, photo_payload
+
+RATELIMIT_HEADERS = {"X-Ratelimit-Limit": "5000", "X-Ratelimit-Remaining": "4999"}
+
+
+@lru_cache(maxsize=None)
+def _encode(kind: str, key: Tuple[Any, ...]) -> bytes:
+    if kind == "photos":
+        page, per_page, authors = key
+        return json.dumps(photo_page(page, per_page, authors)).encode()
+    if kind == "collections":
+        page, per_page = key
+        return json.dumps(collection_page(page, per_page)).encode()
+    if kind == "photo":
+        n, authors = key
+        return json.dumps(photo_payload(n, author=n % authors)).encode()
+    if kind == "collection":
+        return json.dumps(collection_payload(key[0])).encode()
+    raise KeyError(kind)
+
+
+class MockUnsplash:
+    """
+    Serves ``/photos``, ``/photos/{id}``, ``/collections``, ``/collections/{id}``,
+    ``/users/{username}/photos`` and ``/search/photos`` from fixture payloads.
+
+    Args:
+        total_photos: Size of the photo feed (and of every user's and search listing).
+        total_collections: Size of the collection listing.
+        authors: Distinct photographers the photos are spread over.
+        latency: Seconds each response is delayed by.
+    """
+
+    def __init__(
+        self,
+        total_photos: int = 3000,
+        total_collections: int = 300,
+        authors: int = 50,
+        latency: float = 0.0,
+    ):
+        self.total_photos = total_photos
+        self.total_collections = total_collections
+        self.authors = authors
+        self.latency = latency
+        self.requests = 0
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self._sync_handler)
+
+    def async_transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self._async_handler)
+
+    def _sync_handler(self, request: httpx.Request) -> httpx.Response:
+        if self.latency:
+            time.sleep(self.latency)
+        return self.respond(request)
+
+    async def _async_handler(self, request: httpx.Request) -> httpx.Response:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self.respond(request)
+
+    def respond(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        parts = request.url.path.strip("/").split("/")
+        params = request.url.params
+        page = int(params.get("page", 1))
+        per_page = int(params.get("per_page", 10))
+
+        if parts == ["photos"] or (parts[0] == "users" and parts[2:] == ["photos"]):
+            return self._page("photos", page, per_page, self.total_photos)
+        if parts == ["collections"]:
+            return self._page("collections", page, per_page, self.total_collections)
+        if parts == ["search", "photos"]:
+            return self._search(page, per_page)
+        if len(parts) == 2 and parts[0] == "photos" and parts[1].startswith("photo"):
+            return self._json(_encode("photo", (int(parts[1][5:]), self.authors)))
+        if (
+            len(parts) == 2
+            and parts[0] == "collections"
+            and parts[1].startswith("coll")
+        ):
+            return self._json(_encode("collection", (int(parts[1][4:]),)))
+        return httpx.Response(404, json={"errors": ["Couldn't find that"]})
+
+    def _page(self, kind: str, page: int, per_page: int, total: int) -> httpx.Response:
+        start = (page - 1) * per_page
+        count = max(0, min(per_page, total - start))
+        if count == 0:
+            body = b"[]"
+        elif kind == "photos":
+            body = _encode(kind, (page, per_page, self.authors))
+        else:
+            body = _encode(kind, (page, per_page))
+        if count < per_page and count:
+            # the short last page: re-slice the cached full page
+            body = json.dumps(json.loads(body)[:count]).encode()
+        return self._json(body, {"X-Total": str(total), "X-Per-Page": str(per_page)})
+
+    def _search(self, page: int, per_page: int) -> httpx.Response:
+        results = json.loads(
+            self._page("photos", page, per_page, self.total_photos).content
+        )
+        body: Dict[str, Any] = {
+            "total": self.total_photos,
+            "total_pages": -(-self.total_photos // per_page),
+            "results": results,
+        }
+        return self._json(json.dumps(body).encode())
+
+    @staticmethod
+    def _json(body: bytes, headers: Optional[Dict[str, str]] = None) -> httpx.Response:
+        return httpx.Response(
+            200,
+            content=body,
+            headers={
+                "Content-Type": "application/json",
+                **RATELIMIT_HEADERS,
+                **(headers or {}),
+            },
+        )
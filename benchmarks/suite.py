@@ -0,0 +1,239 @@
+"""
+Offline benchmark suite, run against the in-process ``MockUnsplash`` server.
+
+Covers parse throughput, paginated crawl rate, sync versus async concurrency
+scaling and retained memory per 10k photos. Results are written as JSON so
+runs can be compared between releases::
+
+    python -m benchmarks.suite --output baseline.json
+    python -m benchmarks.suite --compare baseline.json --threshold 0.15
+
+``--compare`` exits with status 1 if any metric regressed by more than the
+threshold. ``--quick`` shrinks every workload for a smoke run.
+"""
+
+import argparse
+import asyncio
+import functools
+import json
+import platform
+import sys
+import time
+import timeit
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+import httpx
+
+from unsplash import AsyncUnsplashClient, UnsplashClient
+from unsplash._parsing import parse_models
+from unsplash.models import Collection, Photo, compact
+
+from .bench_memory import retained
+from .fixtures import collection_page, photo_page
+from .server import MockUnsplash
+
+Result = Dict[str, Any]
+
+CONCURRENCY = (1, 4, 16)
+
+
+def metric(name: str, value: float, unit: str, higher_is_better: bool = True) -> Result:
+    return {
+        "name": name,
+        "value": round(value, 3),
+        "unit": unit,
+        "higher_is_better": higher_is_better,
+    }
+
+
+def best_of(fn: Callable[[], Any], number: int, repeat: int = 3) -> float:
+    """Fastest mean seconds per call of ``fn`` over ``repeat`` runs, after a warm-up."""
+    fn()
+    return min(timeit.repeat(fn, number=number, repeat=repeat)) / number
+
+
+def parse_page(body: bytes, model: Any, validate: bool) -> Any:
+    return parse_models(httpx.Response(200, content=body), model, validate)
+
+
+def bench_parse(quick: bool) -> List[Result]:
+    number = 20 if quick else 200
+    results = []
+    for label, model, body in (
+        ("photo", Photo, json.dumps(photo_page()).encode()),
+        ("collection", Collection, json.dumps(collection_page()).encode()),
+    ):
+        for mode, validate in (("validated", True), ("trusted", False)):
+            # a fresh response per call so the parse memo never short-circuits
+            seconds = best_of(
+                functools.partial(parse_page, body, model, validate), number
+            )
+            results.append(metric(f"parse.{label}.{mode}", 30 / seconds, "items/s"))
+    return results
+
+
+def bench_crawl(quick: bool) -> List[Result]:
+    server = MockUnsplash(total_photos=600 if quick else 3000)
+    results = []
+    for mode, validate in (("validated", True), ("trusted", False)):
+        client = UnsplashClient(
+            "bench", transport=server.transport(), validate_responses=validate
+        )
+
+        def crawl(client: UnsplashClient = client) -> None:
+            assert (
+                sum(1 for _ in client.photos.iter_list(per_page=30))
+                == server.total_photos
+            )
+
+        seconds = best_of(crawl, number=1, repeat=2)
+        results.append(
+            metric(
+                f"crawl.photos.{mode}", server.total_photos / 30 / seconds, "pages/s"
+            )
+        )
+    return results
+
+
+def bench_concurrency(quick: bool) -> List[Result]:
+    """``get_many`` with a simulated 10 ms round trip: sync threads vs async tasks."""
+    latency = 0.01
+    count = 32 if quick else 128
+    ids = [f"photo{n:07d}" for n in range(count)]
+    results = []
+    for concurrency in CONCURRENCY:
+        server = MockUnsplash(latency=latency)
+        client = UnsplashClient("bench", transport=server.transport())
+        start = time.perf_counter()
+        assert client.photos.get_many(ids, concurrency=concurrency).ok
+        results.append(
+            metric(
+                f"concurrency.sync.{concurrency}",
+                count / (time.perf_counter() - start),
+                "requests/s",
+            )
+        )
+
+        async def run(concurrency: int = concurrency) -> float:
+            server = MockUnsplash(latency=latency)
+            async with AsyncUnsplashClient(
+                "bench", transport=server.async_transport()
+            ) as client:
+                start = time.perf_counter()
+                assert (await client.photos.get_many(ids, concurrency=concurrency)).ok
+                return time.perf_counter() - start
+
+        results.append(
+            metric(
+                f"concurrency.async.{concurrency}",
+                count / asyncio.run(run()),
+                "requests/s",
+            )
+        )
+    return results
+
+
+def bench_memory(quick: bool) -> List[Result]:
+    pages = 34 if quick else 334
+    bodies = [
+        json.dumps(photo_page(page, authors=50)).encode()
+        for page in range(1, pages + 1)
+    ]
+    count = pages * 30
+
+    def models(bodies: List[bytes]) -> List[Photo]:
+        photos: List[Photo] = []
+        for body in bodies:
+            photos.extend(parse_models(httpx.Response(200, content=body), Photo))
+        return photos
+
+    per_10k = 10_000 / count / 1024 / 1024
+    return [
+        metric("memory.photo", retained(models, bodies) * per_10k, "MiB/10k", False),
+        metric(
+            "memory.compact_photo",
+            retained(lambda b: compact(models(b)), bodies) * per_10k,
+            "MiB/10k",
+            False,
+        ),
+    ]
+
+
+SUITES: Dict[str, Callable[[bool], List[Result]]] = {
+    "parse": bench_parse,
+    "crawl": bench_crawl,
+    "concurrency": bench_concurrency,
+    "memory": bench_memory,
+}
+
+
+def run(only: Optional[List[str]] = None, quick: bool = False) -> Dict[str, Any]:
+    """Run the selected suites (all by default) and return the JSON report."""
+    results: List[Result] = []
+    for name, suite in SUITES.items():
+        if only is None or name in only:
+            results.extend(suite(quick))
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "httpx": httpx.__version__,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "quick": quick,
+        },
+        "results": results,
+    }
+
+
+def compare(
+    report: Dict[str, Any], baseline: Dict[str, Any], threshold: float
+) -> List[str]:
+    """Names of metrics that are worse than ``baseline`` by more than ``threshold``."""
+    before = {result["name"]: result for result in baseline["results"]}
+    regressions = []
+    for result in report["results"]:
+        old = before.get(result["name"])
+        if old is None or not old["value"]:
+            continue
+        change = result["value"] / old["value"] - 1
+        if not result["higher_is_better"]:
+            change = -change
+        name, was, now = result["name"], old["value"], result["value"]
+        print(f"{name:<32} {was:>12} -> {now:>12} {change:+.1%}")
+        if change < -threshold:
+            regressions.append(result["name"])
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "--only", nargs="+", choices=sorted(SUITES), help="suites to run"
+    )
+    parser.add_argument("--quick", action="store_true", help="smaller workloads")
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    parser.add_argument("--compare", help="baseline JSON report to compare against")
+    parser.add_argument(
+        "--threshold", type=float, default=0.1, help="allowed regression ratio"
+    )
+    args = parser.parse_args(argv)
+
+    report = run(args.only, args.quick)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    elif not args.compare:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(report, json.load(f), args.threshold)
+        if regressions:
+            print(f"Regressed: {', '.join(regressions)}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,3 +9,67 @@ def client():
 async def async_client():
     async with AsyncUnsplashClient(access_key="test_key") as c:
         yield c
+
+def make_user(user_id="u1"):
+    return {
+        "id": user_id,
+        "username": user_id,
+        "name": f"User {user_id}",
+        "total_likes": 0,
+        "total_photos": 0,
+        "total_collections": 0,
+        "profile_image": {
+            "small": "http://e.com/s",
+            "medium": "http://e.com/m",
+            "large": "http://e.com/l"
+        },
+        "links": {
+            "self": "http://e.com",
+            "html": "http://e.com",
+            "photos": "http://e.com",
+            "likes": "http://e.com",
+            "portfolio": "http://e.com"
+        }
+    }
+
+def make_photo(photo_id="foo", created_at="2024-01-01T00:00:00Z", user_id="u1"):
+    return {
+        "id": photo_id,
+        "created_at": created_at,
+        "updated_at": created_at,
+        "width": 100,
+        "height": 100,
+        "color": "#000000",
+        "likes": 0,
+        "urls": {
+            "raw": f"https://images.unsplash.com/photo-{photo_id}?ixid=abc",
+            "full": f"https://images.unsplash.com/photo-{photo_id}?ixid=abc&q=85",
+            "regular": f"https://images.unsplash.com/photo-{photo_id}?ixid=abc&w=1080",
+            "small": f"https://images.unsplash.com/photo-{photo_id}?ixid=abc&w=400",
+            "thumb": f"https://images.unsplash.com/photo-{photo_id}?ixid=abc&w=200"
+        },
+        "links": {
+            "self": f"https://api.unsplash.com/photos/{photo_id}",
+            "html": f"https://unsplash.com/photos/{photo_id}",
+            "download": f"https://unsplash.com/photos/{photo_id}/download",
+            "download_location": f"https://api.unsplash.com/photos/{photo_id}/download"
+        },
+        "user": make_user(user_id)
+    }
+
+def make_collection(collection_id="c1"):
+    return {
+        "id": collection_id,
+        "title": f"Collection {collection_id}",
+        "published_at": "2024-01-01T00:00:00Z",
+        "last_collected_at": "2024-01-01T00:00:00Z",
+        "updated_at": "2024-01-01T00:00:00Z",
+        "total_photos": 1,
+        "links": {
+            "self": "http://e.com",
+            "html": "http://e.com",
+            "photos": "http://e.com",
+            "related": "http://e.com"
+        },
+        "user": make_user()
+    }
@@ -0,0 +1,69 @@
+import asyncio
+
+import httpx
+import pytest
+from conftest import make_photo, make_user
+
+from unsplash import (
+    AsyncUnsplashClient,
+    AuthenticationError,
+    NotFoundError,
+    UnsplashClient,
+)
+
+
+def photo_route(respx_mock):
+    def respond(request):
+        photo_id = request.url.path.rsplit("/", 1)[-1]
+        if photo_id.startswith("missing"):
+            return httpx.Response(404, json={"errors": ["Not Found"]})
+        return httpx.Response(200, json=make_photo(photo_id))
+
+    return respx_mock.get(url__regex=r"https://api.unsplash.com/photos/\w+$").mock(
+        side_effect=respond
+    )
+
+
+def test_get_many_keeps_input_order_and_collects_errors(respx_mock):
+    route = photo_route(respx_mock)
+    client = UnsplashClient(access_key="test_key")
+    batch = client.photos.get_many(["c", "missing1", "a", "c", "b"], concurrency=3)
+
+    assert route.call_count == 4  # duplicate IDs are fetched once
+    assert [p.id if p else None for p in batch.results] == ["c", None, "a", "c", "b"]
+    assert [p.id for p in batch] == ["c", "a", "b"]
+    assert list(batch.errors) == ["missing1"]
+    assert isinstance(batch.errors["missing1"], NotFoundError)
+    assert not batch.ok
+
+
+def test_get_many_aborts_on_authentication_error(respx_mock):
+    respx_mock.get(url__regex=r"https://api.unsplash.com/users/\w+$").mock(
+        return_value=httpx.Response(401, json={"errors": ["OAuth error"]})
+    )
+    client = UnsplashClient(access_key="bad_key")
+    with pytest.raises(AuthenticationError):
+        client.users.get_many(["u1", "u2"])
+
+
+async def test_async_get_many_bounds_concurrency(respx_mock):
+    in_flight = peak = 0
+
+    async def respond(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json=make_user(request.url.path.rsplit("/", 1)[-1]))
+
+    respx_mock.get(url__regex=r"https://api.unsplash.com/users/\w+$").mock(
+        side_effect=respond
+    )
+    usernames = [f"u{i}" for i in range(10)]
+    async with AsyncUnsplashClient(access_key="test_key") as client:
+        batch = await client.users.get_many(usernames, concurrency=3)
+
+    assert batch.ok
+    assert [user.id for user in batch] == usernames
+    assert peak == 3
@@ -0,0 +1,27 @@
+from benchmarks.server import MockUnsplash
+from benchmarks.suite import compare, metric
+from unsplash import UnsplashClient
+
+
+def test_mock_server_serves_a_full_crawl():
+    server = MockUnsplash(total_photos=75)
+    client = UnsplashClient(access_key="bench", transport=server.transport())
+
+    photos = list(client.photos.iter_list(per_page=30))
+
+    assert len(photos) == 75
+    assert len({photo.id for photo in photos}) == 75
+    assert server.requests == 3
+    assert client.photos.get(photos[0].id).id == photos[0].id
+    assert client.search.photos("lake", per_page=30).total == 75
+
+
+def test_compare_flags_regressions_by_direction():
+    baseline = {
+        "results": [metric("rate", 100.0, "items/s"), metric("mem", 10.0, "MiB", False)]
+    }
+    report = {
+        "results": [metric("rate", 95.0, "items/s"), metric("mem", 12.0, "MiB", False)]
+    }
+
+    assert compare(report, baseline, threshold=0.1) == ["mem"]
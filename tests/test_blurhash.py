@@ -0,0 +1,48 @@
+import pytest
+from conftest import make_photo
+
+from unsplash import blurhash
+from unsplash.models import Photo
+
+HASH = "LEHV6nWB2yk8pyo0adR*.7kCMdnj"
+
+
+def encode83(value, length):
+    return "".join(
+        blurhash._ALPHABET[value // 83**i % 83] for i in reversed(range(length))
+    )
+
+
+def test_decode_solid_color():
+    # 1x1 components: only the DC term, so every pixel has the same color
+    solid = "00" + encode83((255 << 16) | (128 << 8) | 0, 4)
+    pixels = blurhash.decode(solid, 4, 3)
+    assert len(pixels) == 4 * 3 * 3
+    assert pixels[:3] == bytes([255, 128, 0])
+    assert set(pixels[i : i + 3] for i in range(0, len(pixels), 3)) == {
+        bytes([255, 128, 0])
+    }
+
+
+def test_decode_is_cached_and_validates():
+    assert blurhash.decode(HASH, 8, 8) is blurhash.decode(HASH, 8, 8)
+    with pytest.raises(ValueError):
+        blurhash.decode(HASH[:-1])
+    with pytest.raises(ValueError):
+        blurhash.decode('LEHV6n"B2yk8pyo0adR*.7kCMdnj')
+
+
+def test_photo_placeholder():
+    photo = Photo.model_validate({**make_photo("a"), "blur_hash": HASH})
+    assert photo.blur_placeholder(16, 8) == blurhash.decode(HASH, 16, 8)
+    assert Photo.model_validate(make_photo("b")).blur_placeholder() is None
+
+
+def test_decode_many_matches_decode():
+    np = pytest.importorskip("numpy")
+    other = "LGF5?xYk^6#M@-5c,1J5@[or[Q6."
+    batch = blurhash.decode_many([HASH, None, other], 20, 10)
+    assert batch.shape == (3, 10, 20, 3) and batch.dtype == np.uint8
+    assert np.array_equal(batch[0], blurhash.decode_array(HASH, 20, 10))
+    assert np.array_equal(batch[2], blurhash.decode_array(other, 20, 10))
+    assert not batch[1].any()
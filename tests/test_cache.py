@@ -0,0 +1,144 @@
+import httpx
+import pytest
+from conftest import make_photo, make_user
+
+from unsplash import (
+    AsyncUnsplashClient,
+    MemoryCache,
+    ResponseCache,
+    UnsplashClient,
+    UnsplashError,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_get_is_served_from_cache(respx_mock):
+    route = respx_mock.get("https://api.unsplash.com/photos/foo").mock(
+        return_value=httpx.Response(200, json=make_photo("foo"))
+    )
+    cache = ResponseCache()
+    client = UnsplashClient(access_key="test_key", cache=cache)
+    assert client.photos.get("foo").id == "foo"
+    assert client.photos.get("foo").id == "foo"
+    assert route.call_count == 1
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+
+
+def test_entries_expire_after_ttl(respx_mock):
+    route = respx_mock.get("https://api.unsplash.com/users/u1").mock(
+        return_value=httpx.Response(200, json=make_user("u1"))
+    )
+    clock = FakeClock()
+    client = UnsplashClient(
+        access_key="test_key", cache=ResponseCache(ttls={"/users/*": 10}, clock=clock)
+    )
+    client.users.get("u1")
+    clock.now += 5
+    client.users.get("u1")
+    assert route.call_count == 1
+    clock.now += 10
+    client.users.get("u1")
+    assert route.call_count == 2
+
+
+def test_params_are_part_of_the_key(respx_mock):
+    route = respx_mock.get("https://api.unsplash.com/photos").mock(
+        return_value=httpx.Response(200, json=[make_photo("foo")])
+    )
+    client = UnsplashClient(access_key="test_key", cache=ResponseCache())
+    client.photos.list(page=1)
+    client.photos.list(page=2)
+    client.photos.list(page=1)
+    assert route.call_count == 2
+
+
+def test_random_is_never_cached(respx_mock):
+    route = respx_mock.get("https://api.unsplash.com/photos/random").mock(
+        return_value=httpx.Response(200, json=make_photo("foo"))
+    )
+    client = UnsplashClient(access_key="test_key", cache=ResponseCache())
+    client.photos.random()
+    client.photos.random()
+    assert route.call_count == 2
+
+
+def test_memory_cache_evicts_least_recently_used(respx_mock):
+    respx_mock.get(url__regex=r"https://api.unsplash.com/users/\w+$").mock(
+        side_effect=lambda request: httpx.Response(
+            200, json=make_user(request.url.path[7:])
+        )
+    )
+    backend = MemoryCache(maxsize=2)
+    cache = ResponseCache(backend=backend)
+    client = UnsplashClient(access_key="test_key", cache=cache)
+    for username in ["a", "b", "a", "c"]:
+        client.users.get(username)
+    assert len(backend) == 2
+    assert cache.stats.evictions == 1
+    assert backend.get("GET /users/b") is None
+    assert backend.get("GET /users/a") is not None
+
+
+async def test_async_client_uses_cache(respx_mock):
+    route = respx_mock.get("https://api.unsplash.com/photos/foo").mock(
+        return_value=httpx.Response(200, json=make_photo("foo"))
+    )
+    async with AsyncUnsplashClient(
+        access_key="test_key", cache=ResponseCache()
+    ) as client:
+        await client.photos.get("foo")
+        await client.photos.get("foo")
+    assert route.call_count == 1
+
+
+def test_stale_entry_is_revalidated_with_etag(respx_mock):
+    route = respx_mock.get("https://api.unsplash.com/photos/foo").mock(
+        side_effect=[
+            httpx.Response(200, json=make_photo("foo"), headers={"ETag": '"v1"'}),
+            httpx.Response(304, headers={"ETag": '"v1"'}),
+        ]
+    )
+    cache = ResponseCache(ttl=0)
+    client = UnsplashClient(access_key="test_key", cache=cache)
+    first = client.photos.get("foo")
+    second = client.photos.get("foo")
+    assert route.call_count == 2
+    assert route.calls[1].request.headers["If-None-Match"] == '"v1"'
+    # the 304 replays the stored response, so the parsed model is reused
+    assert second is first
+    assert cache.stats.revalidations == 1
+
+
+@pytest.mark.parametrize("cache", [None, ResponseCache()])
+def test_unsolicited_304_is_an_error(respx_mock, cache):
+    respx_mock.get("https://api.unsplash.com/photos/foo").mock(
+        return_value=httpx.Response(304)
+    )
+    client = UnsplashClient(access_key="test_key", cache=cache)
+    # without a cached entry no conditional request was sent
+    with pytest.raises(UnsplashError):
+        client.photos.get("foo")
+
+
+def test_changed_resource_replaces_entry(respx_mock):
+    respx_mock.get("https://api.unsplash.com/users/u1").mock(
+        side_effect=[
+            httpx.Response(
+                200,
+                json=make_user("u1"),
+                headers={"Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"},
+            ),
+            httpx.Response(200, json={**make_user("u1"), "name": "Renamed"}),
+        ]
+    )
+    client = UnsplashClient(access_key="test_key", cache=ResponseCache(ttl=0))
+    assert client.users.get("u1").name == "User u1"
+    assert client.users.get("u1").name == "Renamed"
@@ -1,7 +1,7 @@
 import httpx
 import respx
 import pytest
-from unsplash import UnsplashClient, UnsplashError
+from unsplash import NotFoundError, UnsplashClient, UnsplashError
 
 def test_get_photo_success(respx_mock):
     respx_mock.get("https://api.unsplash.com/photos/foo").mock(
@@ -68,3 +68,122 @@ def test_get_photo_not_found(respx_mock):
         client.photos.get("missing")
     
     assert exc_info.value.http_status == 404
+    assert exc_info.value.errors == ["Not Found"]
+    assert str(exc_info.value) == "Not Found"
+
+
+def test_error_message_falls_back_to_body(respx_mock):
+    respx_mock.get("https://api.unsplash.com/photos/foo").mock(
+        return_value=httpx.Response(400, text="Bad request")
+    )
+    client = UnsplashClient(access_key="test_key")
+    with pytest.raises(UnsplashError) as exc_info:
+        client.photos.get("foo")
+
+    assert exc_info.value.errors == []
+    assert exc_info.value.message == exc_info.value.http_body == "Bad request"
+    assert exc_info.value.args == ("Bad request",)
+    assert repr(exc_info.value) == "UnsplashError('Bad request', http_status=400)"
+
+
+def test_error_attributes_are_assignable():
+    import pickle
+
+    error = NotFoundError(http_status=404, http_body=b'{"errors": ["Not Found"]}')
+    assert repr(error) == "NotFoundError('Not Found', http_status=404)"
+    error.message = "Photo missing"
+    error.http_body = "gone"
+    assert (error.args, str(error), error.http_body) == (
+        ("Photo missing",),
+        "Photo missing",
+        "gone",
+    )
+    restored = pickle.loads(pickle.dumps(error))
+    assert (restored.message, restored.http_status) == ("Photo missing", 404)
+
+
+@pytest.mark.parametrize("headers, wait", [
+    ({"Retry-After": "30"}, 30.0),
+    ({"X-Ratelimit-Limit": "50"}, None),
+    ({}, None),
+])
+def test_rate_limit_error_reset_time(respx_mock, headers, wait):
+    from unsplash import RateLimitError
+
+    headers = {"X-Ratelimit-Remaining": "0", **headers}
+    respx_mock.get("https://api.unsplash.com/photos/foo").mock(
+        return_value=httpx.Response(429, text="Rate Limit Exceeded", headers=headers)
+    )
+    client = UnsplashClient(access_key="test_key", max_retries=0)
+    with pytest.raises(RateLimitError) as exc_info:
+        client.photos.get("foo")
+
+    error = exc_info.value
+    assert error.remaining == 0
+    assert error.limit == (50 if "X-Ratelimit-Limit" in headers else 0)
+    if wait is None:
+        assert error.reset_at is None and error.retry_after is None
+    else:
+        assert wait - 1 < error.retry_after <= wait
+
+
+def test_unvalidated_responses(respx_mock):
+    from conftest import make_photo
+
+    respx_mock.get("https://api.unsplash.com/photos").mock(
+        return_value=httpx.Response(200, json=[make_photo("a"), make_photo("b")])
+    )
+    client = UnsplashClient(access_key="test_key", validate_responses=False)
+    photos = client.photos.list()
+    assert [p.id for p in photos] == ["a", "b"]
+    assert str(photos[0].urls.small) == "https://images.unsplash.com/photo-a?ixid=abc&w=400"
+
+
+def test_list_adapter_is_cached():
+    from unsplash._parsing import list_adapter
+    from unsplash.models import Photo
+
+    assert list_adapter(Photo) is list_adapter(Photo)
+
+
+def test_field_projection(respx_mock):
+    from conftest import make_photo
+
+    respx_mock.get("https://api.unsplash.com/photos").mock(
+        return_value=httpx.Response(200, json=[make_photo("a"), make_photo("b")])
+    )
+    client = UnsplashClient(access_key="test_key")
+    photos = client.photos.list(fields=["id", "urls.small", "user.username"])
+    assert [p.id for p in photos] == ["a", "b"]
+    assert str(photos[0].urls.small) == "https://images.unsplash.com/photo-a?ixid=abc&w=400"
+    assert photos[0].model_dump() == {
+        "id": "a",
+        "urls": {"small": photos[0].urls.small},
+        "user": {"username": photos[0].user.username},
+    }
+    with pytest.raises(AttributeError):
+        getattr(photos[0], "description")
+
+
+def test_search_field_projection(respx_mock):
+    from conftest import make_photo
+
+    respx_mock.get("https://api.unsplash.com/search/photos").mock(
+        return_value=httpx.Response(
+            200, json={"total": 1, "total_pages": 1, "results": [make_photo("a")]}
+        )
+    )
+    client = UnsplashClient(access_key="test_key", validate_responses=False)
+    results = client.search.photos("cats", fields=["id"])
+    assert results.total == 1
+    assert results.results[0].model_dump() == {"id": "a"}
+
+
+def test_projection_rejects_unknown_fields():
+    from unsplash.models import Photo
+    from unsplash.models._projection import projection
+
+    with pytest.raises(ValueError):
+        projection(Photo, ("nope",))
+    with pytest.raises(ValueError):
+        projection(Photo, ("id.nope",))
@@ -0,0 +1,125 @@
+import httpx
+import pytest
+from conftest import make_photo
+
+from unsplash import AsyncUnsplashClient, DownloadError, RetryPolicy, UnsplashClient
+from unsplash.models import Photo
+
+IMAGE = bytes(range(256)) * 400
+
+
+def image_route(respx_mock, body=IMAGE, length=None):
+    def respond(request):
+        start = 0
+        if "range" in request.headers:
+            start = int(request.headers["range"][len("bytes=") : -1])
+            last = len(body) - 1
+            return httpx.Response(
+                206,
+                headers={
+                    "Content-Range": f"bytes {start}-{last}/{length or len(body)}"
+                },
+                content=body[start:],
+            )
+        return httpx.Response(200, content=body)
+
+    return respx_mock.get(url__startswith="https://images.unsplash.com/photo-a").mock(
+        side_effect=respond
+    )
+
+
+def track_route(respx_mock):
+    return respx_mock.get("https://api.unsplash.com/photos/a/download").mock(
+        return_value=httpx.Response(200, json={"url": "https://example.com"})
+    )
+
+
+def test_download_file_streams_and_tracks(respx_mock, tmp_path):
+    images = image_route(respx_mock)
+    track = track_route(respx_mock)
+    client = UnsplashClient(access_key="test_key")
+    photo = Photo.model_validate(make_photo("a"))
+
+    path = client.photos.download_file(photo, tmp_path, size="raw", params={"w": 1200})
+    assert path == tmp_path / "a.jpg"
+    assert path.read_bytes() == IMAGE
+    assert track.call_count == 1
+    assert images.calls.last.request.url.params["w"] == "1200"
+
+    # an existing file is not downloaded (or tracked) again
+    client.photos.download_file(photo, tmp_path)
+    assert images.call_count == 1 and track.call_count == 1
+
+
+def test_download_resumes_partial_file(respx_mock, tmp_path):
+    images = image_route(respx_mock)
+    track_route(respx_mock)
+    (tmp_path / "a.jpg.part").write_bytes(IMAGE[:1000])
+    client = UnsplashClient(access_key="test_key")
+
+    path = client.photos.download_file(
+        Photo.model_validate(make_photo("a")), tmp_path / "a.jpg"
+    )
+    assert path.read_bytes() == IMAGE
+    assert images.calls.last.request.headers["range"] == "bytes=1000-"
+    assert not (tmp_path / "a.jpg.part").exists()
+
+
+def test_download_size_mismatch(respx_mock, tmp_path):
+    image_route(respx_mock, length=len(IMAGE) + 10)
+    (tmp_path / "a.jpg.part").write_bytes(IMAGE[:10])
+    client = UnsplashClient(access_key="test_key")
+    with pytest.raises(DownloadError):
+        client.photos.download_file(
+            Photo.model_validate(make_photo("a")), tmp_path / "a.jpg", track=False
+        )
+    assert not (tmp_path / "a.jpg").exists()
+
+
+def test_complete_partial_file_is_not_downloaded_again(respx_mock, tmp_path):
+    images = respx_mock.get(url__startswith="https://images.unsplash.com/photo-a").mock(
+        return_value=httpx.Response(
+            416, headers={"Content-Range": f"bytes */{len(IMAGE)}"}
+        )
+    )
+    (tmp_path / "a.jpg.part").write_bytes(IMAGE)
+    client = UnsplashClient(access_key="test_key")
+    path = client.photos.download_file(
+        Photo.model_validate(make_photo("a")), tmp_path / "a.jpg", track=False
+    )
+    assert path.read_bytes() == IMAGE
+    assert images.call_count == 1
+
+
+def test_download_retries_server_errors(respx_mock, tmp_path):
+    images = respx_mock.get(url__startswith="https://images.unsplash.com/photo-a").mock(
+        side_effect=[httpx.Response(503), httpx.Response(200, content=IMAGE)]
+    )
+    client = UnsplashClient(
+        access_key="test_key", retry_policy=RetryPolicy(backoff_base=0.0)
+    )
+    path = client.photos.download_file(
+        Photo.model_validate(make_photo("a")), tmp_path / "a.jpg", track=False
+    )
+    assert path.read_bytes() == IMAGE
+    assert images.call_count == 2
+
+
+async def test_async_download_files(respx_mock, tmp_path):
+    image_route(respx_mock)
+    track_route(respx_mock)
+    respx_mock.get(url__startswith="https://images.unsplash.com/photo-b").mock(
+        return_value=httpx.Response(404)
+    )
+    respx_mock.get("https://api.unsplash.com/photos/b/download").mock(
+        return_value=httpx.Response(200, json={"url": "https://example.com"})
+    )
+    photos = [
+        Photo.model_validate(make_photo("a")),
+        Photo.model_validate(make_photo("b")),
+    ]
+    async with AsyncUnsplashClient(access_key="test_key") as client:
+        batch = await client.photos.download_files(photos, tmp_path / "out")
+
+    assert batch.results[0].read_bytes() == IMAGE
+    assert isinstance(batch.errors["b"], DownloadError)
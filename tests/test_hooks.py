@@ -0,0 +1,106 @@
+import httpx
+import pytest
+from conftest import make_photo
+
+from unsplash import (
+    AsyncUnsplashClient,
+    MetricsCollector,
+    NotFoundError,
+    RequestHooks,
+    RetryPolicy,
+    UnsplashClient,
+)
+from unsplash._hooks import endpoint
+
+
+class Recorder(RequestHooks):
+    def __init__(self):
+        self.events = []
+
+    def before_request(self, method, url, attempt):
+        self.events.append(("before", attempt))
+
+    def after_response(self, method, url, response, elapsed):
+        self.events.append(("response", response.status_code))
+
+    def on_retry(self, method, url, attempt, delay, outcome):
+        self.events.append(("retry", attempt))
+
+    def on_error(self, method, url, error):
+        self.events.append(("error", type(error).__name__))
+
+    def on_parse(self, model, count, elapsed):
+        self.events.append(("parse", model.__name__, count))
+
+
+def test_hooks_see_retries_responses_and_parsing(respx_mock):
+    respx_mock.get("https://api.unsplash.com/photos").mock(
+        side_effect=[
+            httpx.Response(503),
+            httpx.Response(200, json=[make_photo("a"), make_photo("b")]),
+        ]
+    )
+    recorder = Recorder()
+    client = UnsplashClient(
+        access_key="test_key",
+        retry_policy=RetryPolicy(backoff_base=0.0),
+        hooks=[recorder],
+    )
+
+    client.photos.list()
+
+    assert recorder.events == [
+        ("before", 0),
+        ("response", 503),
+        ("retry", 0),
+        ("before", 1),
+        ("response", 200),
+        ("parse", "Photo", 2),
+    ]
+
+
+def test_hooks_see_final_errors(respx_mock):
+    respx_mock.get("https://api.unsplash.com/photos/missing").mock(
+        return_value=httpx.Response(404, json={"errors": ["Not found"]})
+    )
+    recorder = Recorder()
+    client = UnsplashClient(access_key="test_key", hooks=[recorder])
+
+    with pytest.raises(NotFoundError):
+        client.photos.get("missing")
+
+    assert recorder.events[-1] == ("error", "NotFoundError")
+
+
+def test_endpoint_collapses_resource_ids():
+    assert (
+        endpoint("https://api.unsplash.com/photos/abc123/download")
+        == "/photos/{id}/download"
+    )
+    assert endpoint("https://api.unsplash.com/photos/random") == "/photos/random"
+    assert endpoint("https://api.unsplash.com/search/photos") == "/search/photos"
+
+
+async def test_metrics_collector_exports_prometheus_text(respx_mock):
+    respx_mock.get("https://api.unsplash.com/photos/a").mock(
+        return_value=httpx.Response(
+            200,
+            json=make_photo("a"),
+            headers={"X-Ratelimit-Limit": "50", "X-Ratelimit-Remaining": "42"},
+        )
+    )
+    metrics = MetricsCollector(buckets=(0.1, 1.0))
+    async with AsyncUnsplashClient(access_key="test_key", hooks=[metrics]) as client:
+        await client.photos.get("a")
+
+    text = metrics.export()
+
+    labels = 'endpoint="/photos/{id}",method="GET"'
+    assert "# TYPE unsplash_request_duration_seconds histogram" in text
+    assert f'unsplash_request_duration_seconds_bucket{{{labels},le="+Inf"}} 1' in text
+    assert f"unsplash_request_duration_seconds_count{{{labels}}} 1" in text
+    assert f'unsplash_responses_total{{{labels},status="200"}} 1' in text
+    assert f"unsplash_response_bytes_total{{{labels}}} " in text
+    assert 'unsplash_parsed_models_total{model="Photo"} 1' in text
+    assert "unsplash_ratelimit_remaining 42" in text
+    assert "unsplash_ratelimit_limit 50" in text
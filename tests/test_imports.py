@@ -0,0 +1,57 @@
+import importlib
+import subprocess
+import sys
+
+import unsplash
+import unsplash.models
+import unsplash.resources
+
+
+def imported_modules(statement):
+    """Modules ``statement`` imports in a fresh interpreter, from ``-X importtime``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return {
+        line.rsplit("|", 1)[1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and "|" in line
+    }
+
+
+def test_import_unsplash_is_lazy():
+    modules = imported_modules("import unsplash")
+    assert "unsplash" in modules
+    assert not {"httpx", "pydantic", "unsplash.client", "unsplash.models"} & modules
+
+
+def test_client_import_skips_optional_dependencies():
+    modules = imported_modules("from unsplash import UnsplashClient")
+    assert "httpx" in modules
+    assert (
+        not {"sqlite3", "numpy", "unsplash.models.collection", "unsplash.blurhash"}
+        & modules
+    )
+
+
+def test_model_schemas_are_built_on_first_use():
+    code = (
+        "from unsplash.models import Collection\n"
+        "assert not Collection.__pydantic_complete__\n"
+        "Collection.model_json_schema()\n"
+        "assert Collection.__pydantic_complete__\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_lazy_exports_resolve():
+    for package in (unsplash, unsplash.models, unsplash.resources):
+        for name in package.__all__:
+            assert getattr(package, name) is not None
+        assert set(package.__all__) <= set(dir(package))
+    # loading the defining module must not shadow the exported function
+    importlib.import_module("unsplash.models._compact")
+    assert callable(unsplash.models.compact)
@@ -1,4 +1,6 @@
 from datetime import datetime
+import pytest
+from pydantic import HttpUrl
 from unsplash.models import Photo
 
 def test_photo_model_parsing():
@@ -88,3 +90,156 @@ def test_photo_model_parsing():
     assert photo.width == 2448
     assert photo.user.username == "exampleuser"
     assert isinstance(photo.created_at, datetime)
+
+
+def test_construct_builds_nested_models_without_validation():
+    from unsplash.models import Collection
+    from unsplash.models._construct import construct
+    from conftest import make_collection, make_photo
+
+    data = make_photo("foo")
+    photo = construct(Photo, data)
+    assert isinstance(photo, Photo)
+    # leaf values get their annotated types, equal to the validated ones
+    validated = Photo.model_validate(data)
+    assert photo.user.profile_image.small == validated.user.profile_image.small
+    assert isinstance(photo.created_at, datetime)
+    assert photo.created_at == validated.created_at
+    assert photo.model_dump_json() == validated.model_dump_json()
+    assert isinstance(photo.urls.raw, HttpUrl) and photo.urls == validated.urls
+    assert {photo.urls.raw, validated.urls.raw} == {validated.urls.raw}
+    assert photo.urls.raw.host == "images.unsplash.com"
+    # defaults are filled in just like model_construct
+    assert photo.topics == []
+    assert photo.exif is None
+    assert photo.model_fields_set >= {"id", "urls", "user"}
+
+    collection = construct(Collection, {**make_collection(), "cover_photo": data})
+    assert isinstance(collection.cover_photo, Photo)
+    assert str(collection.cover_photo.urls.raw) == data["urls"]["raw"]
+
+
+def test_construct_defers_until_first_read():
+    import copy
+    import pickle
+    from unsplash.models._construct import construct
+    from conftest import make_photo
+
+    data = make_photo("foo")
+    validated = Photo.model_validate(data)
+    photo = construct(Photo, data)
+    # nothing is built until a field is read, then only that level
+    assert photo.__dict__ == {"__unsplash_raw__": data}
+    assert photo.id == "foo"
+    assert photo.user.__dict__ == {"__unsplash_raw__": data["user"]}
+    # a field assigned before the first read keeps its value
+    photo = construct(Photo, data)
+    photo.likes = 99
+    assert photo.likes == 99 and photo.id == "foo"
+    assert "likes" in photo.model_fields_set
+    # methods that read __dict__ directly build it first
+    for fresh in (
+        lambda: construct(Photo, data),
+        lambda: copy.copy(construct(Photo, data)),
+        lambda: copy.deepcopy(construct(Photo, data)),
+        lambda: pickle.loads(pickle.dumps(construct(Photo, data))),
+    ):
+        assert fresh() == validated
+    assert dict(construct(Photo, data)).keys() == dict(validated).keys()
+    assert construct(Photo, data).model_dump() == validated.model_dump()
+
+
+def test_compact_photo_round_trip():
+    from unsplash.models import CompactPhoto, InternPool, compact
+    from conftest import make_photo
+
+    data = make_photo("a")
+    data["exif"] = {"make": "Canon", "iso": 100}
+    data["location"] = {
+        "city": "Montreal",
+        "position": {"latitude": 45.5, "longitude": -73.6},
+    }
+    data["topics"] = [{"id": "t1", "title": "Nature"}]
+    photos = [Photo.model_validate(data), Photo.model_validate(make_photo("b"))]
+
+    pool = InternPool()
+    compacted = compact(photos, pool)
+    assert pool.users == 1
+    assert compacted[0].user is compacted[1].user
+    assert compacted[0].urls.small == "https://images.unsplash.com/photo-a?ixid=abc&w=400"
+    assert compacted[0].location.position == (45.5, -73.6)
+    assert not hasattr(compacted[0], "__dict__")
+
+    for photo, item in zip(photos, compacted):
+        restored = item.to_photo()
+        assert restored.model_dump() == photo.model_dump()
+        assert CompactPhoto.from_photo(restored) == item
+
+
+def test_photo_columns():
+    import math
+    from unsplash.models import compact, iter_columns, to_columns
+    from unsplash.models._construct import construct
+    from conftest import make_photo
+
+    data = make_photo("a", created_at="1970-01-01T00:01:00Z")
+    position = {"latitude": 1.5, "longitude": 2.5}
+    data.update(color="#6E633A", views=10, location={"position": position})
+    photos = [Photo.model_validate(data), Photo.model_validate(make_photo("b"))]
+
+    columns = to_columns(photos)
+    assert columns.ids == ["a", "b"]
+    assert columns.created_at.typecode == "q"
+    assert list(columns.created_at) == [60, 1704067200]
+    assert list(columns.color) == [0x6E633A, 0]
+    assert list(columns.views) == [10, -1]
+    assert columns.latitude[0] == 1.5 and math.isnan(columns.latitude[1])
+
+    def dump(c):
+        return {k: v if k == "ids" else v.tobytes() for k, v in c.columns().items()}
+
+    # trusted models and compact photos give the same columns
+    trusted = (construct(Photo, d) for d in (data, make_photo("b")))
+    assert dump(to_columns(trusted)) == dump(columns)
+    assert dump(to_columns(compact(photos))) == dump(columns)
+    assert [len(batch) for batch in iter_columns(photos * 3, batch_size=4)] == [4, 2]
+
+
+def test_photo_columns_to_numpy():
+    np = pytest.importorskip("numpy")
+    from unsplash.models import to_columns
+    from conftest import make_photo
+
+    columns = to_columns([Photo.model_validate(make_photo("a"))])
+    arrays = columns.to_numpy()
+    assert arrays["likes"].dtype == np.int64
+    widths = np.frombuffer(columns.width, dtype=np.int64)
+    assert np.shares_memory(arrays["width"], widths)
+
+
+def test_imgix_urls():
+    from unsplash.models import ImgixURL
+    from conftest import make_photo
+
+    photo = Photo.model_validate(make_photo("a"))
+    raw = "https://images.unsplash.com/photo-a?ixid=abc"
+    assert photo.urls.imgix is photo.urls.imgix
+    assert photo.url() == raw
+    webp = photo.url(w=800, fm="webp", crop="faces,edges")
+    assert webp == f"{raw}&w=800&crop=faces,edges&fm=webp"
+    base = "https://images.unsplash.com/photo-a"
+    assert photo.url(ixid="xyz", dpr=1.5) == f"{base}?ixid=xyz&dpr=1.5"
+    # values are encoded exactly once, whether or not a raw parameter is overridden
+    faces = "crop=faces,center"
+    assert photo.url(crop="faces,center", txt="a b") == f"{raw}&txt=a%20b&{faces}"
+    assert photo.url(ixid="x y", crop="faces,center", txt="a b") == (
+        f"{base}?ixid=x%20y&txt=a%20b&{faces}"
+    )
+    widths = photo.srcset(widths=[400, 800], q=75)
+    assert widths == f"{raw}&w=400&q=75 400w, {raw}&w=800&q=75 800w"
+    dprs = photo.srcset(dprs=[1, 2], w=300)
+    assert dprs == f"{raw}&w=300&dpr=1 1x, {raw}&w=300&dpr=2 2x"
+    assert "urls" in photo.model_dump() and "imgix" not in photo.model_dump()["urls"]
+    assert ImgixURL("https://images.unsplash.com/p").url(w=10) == "https://images.unsplash.com/p?w=10"
+    with pytest.raises(ValueError):
+        photo.srcset(widths=[1], dprs=[1])
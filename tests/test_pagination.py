@@ -0,0 +1,105 @@
+import httpx
+from conftest import make_photo
+
+from unsplash import AsyncUnsplashClient, UnsplashClient
+
+
+def page_of(start, count):
+    return [make_photo(f"p{i}") for i in range(start, start + count)]
+
+
+def test_iter_list_walks_pages_until_short_page(respx_mock):
+    route = respx_mock.get("https://api.unsplash.com/photos").mock(
+        side_effect=[
+            httpx.Response(200, json=page_of(0, 30)),
+            httpx.Response(200, json=page_of(30, 30)),
+            httpx.Response(200, json=page_of(60, 5)),
+        ]
+    )
+    client = UnsplashClient(access_key="test_key")
+    ids = [photo.id for photo in client.photos.iter_list()]
+    assert ids == [f"p{i}" for i in range(65)]
+    assert route.call_count == 3
+    assert route.calls[0].request.url.params["per_page"] == "30"
+    assert route.calls[2].request.url.params["page"] == "3"
+
+
+def test_iter_list_stops_on_x_total(respx_mock):
+    route = respx_mock.get("https://api.unsplash.com/users/u1/photos").mock(
+        return_value=httpx.Response(200, json=page_of(0, 2), headers={"X-Total": "4"})
+    )
+    client = UnsplashClient(access_key="test_key")
+    photos = list(client.users.iter_photos("u1", per_page=2, prefetch=True))
+    assert len(photos) == 4
+    assert route.call_count == 2
+
+
+def test_iter_search_stops_on_total_pages(respx_mock):
+    route = respx_mock.get("https://api.unsplash.com/search/photos").mock(
+        return_value=httpx.Response(
+            200, json={"total": 60, "total_pages": 2, "results": page_of(0, 30)}
+        )
+    )
+    client = UnsplashClient(access_key="test_key")
+    assert len(list(client.search.iter_photos("cats"))) == 60
+    assert route.call_count == 2
+
+
+def test_iter_stops_early_when_consumer_breaks(respx_mock):
+    route = respx_mock.get("https://api.unsplash.com/photos").mock(
+        return_value=httpx.Response(200, json=page_of(0, 30))
+    )
+    client = UnsplashClient(access_key="test_key")
+    for _ in client.photos.iter_list(max_pages=10):
+        break
+    assert route.call_count == 1
+
+
+async def test_async_iter_with_prefetch(respx_mock):
+    route = respx_mock.get("https://api.unsplash.com/collections/c1/photos").mock(
+        side_effect=[
+            httpx.Response(200, json=page_of(0, 30)),
+            httpx.Response(200, json=[]),
+        ]
+    )
+    async with AsyncUnsplashClient(access_key="test_key") as client:
+        ids = [
+            photo.id
+            async for photo in client.collections.iter_photos("c1", prefetch=True)
+        ]
+    assert len(ids) == 30
+    assert route.call_count == 2
+
+
+async def test_photos_all_fetches_remaining_pages_concurrently(respx_mock):
+    def respond(request):
+        page = int(request.url.params["page"])
+        return httpx.Response(
+            200,
+            json={"total": 90, "total_pages": 3, "results": page_of(page * 100, 30)},
+        )
+
+    route = respx_mock.get("https://api.unsplash.com/search/photos").mock(
+        side_effect=respond
+    )
+    async with AsyncUnsplashClient(access_key="test_key") as client:
+        ids = [
+            photo.id async for photo in client.search.photos_all("cats", concurrency=2)
+        ]
+    assert route.call_count == 3
+    assert ids == [f"p{i}" for p in (1, 2, 3) for i in range(p * 100, p * 100 + 30)]
+
+
+async def test_photos_all_unordered_respects_max_pages(respx_mock):
+    route = respx_mock.get("https://api.unsplash.com/search/photos").mock(
+        return_value=httpx.Response(
+            200, json={"total": 300, "total_pages": 10, "results": page_of(0, 30)}
+        )
+    )
+    async with AsyncUnsplashClient(access_key="test_key") as client:
+        photos = [
+            p
+            async for p in client.search.photos_all("cats", max_pages=4, ordered=False)
+        ]
+    assert len(photos) == 120
+    assert route.call_count == 4
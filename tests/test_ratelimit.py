@@ -0,0 +1,59 @@
+import httpx
+
+from unsplash import AsyncRateLimiter, RateLimiter, UnsplashClient
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_passes_through_until_limit_is_known():
+    limiter = RateLimiter(burst=1)
+    for _ in range(5):
+        assert limiter._reserve() == 0.0
+
+
+def test_paces_at_quota_rate_after_burst():
+    clock = FakeClock()
+    limiter = RateLimiter(limit=3600, burst=2, clock=clock)
+    assert limiter._reserve() == 0.0
+    assert limiter._reserve() == 0.0
+    # bucket drained: one token per second at 3600/hour
+    assert limiter._reserve() == 1.0
+    assert limiter._reserve() == 2.0
+    clock.now = 10.0
+    assert limiter._reserve() == 0.0
+
+
+def test_remaining_header_caps_tokens():
+    clock = FakeClock()
+    limiter = RateLimiter(burst=10, clock=clock)
+    limiter.update({"X-Ratelimit-Limit": "50", "X-Ratelimit-Remaining": "0"})
+    assert limiter.limit == 50
+    assert limiter.remaining == 0
+    assert limiter._reserve() == 72.0
+
+
+def test_shared_limiter_per_access_key():
+    assert RateLimiter.shared("key-a") is RateLimiter.shared("key-a")
+    assert RateLimiter.shared("key-a") is not RateLimiter.shared("key-b")
+    assert AsyncRateLimiter.shared("key-a") is not RateLimiter.shared("key-a")
+
+
+def test_client_feeds_headers_to_limiter(respx_mock):
+    respx_mock.get("https://api.unsplash.com/users/foo/portfolio").mock(
+        return_value=httpx.Response(
+            200,
+            json={"url": "https://example.com"},
+            headers={"X-Ratelimit-Limit": "5000", "X-Ratelimit-Remaining": "4999"},
+        )
+    )
+    limiter = RateLimiter()
+    client = UnsplashClient(access_key="test_key", rate_limiter=limiter)
+    client.users.portfolio("foo")
+    assert limiter.limit == 5000
+    assert limiter.remaining == 4999
@@ -0,0 +1,105 @@
+import httpx
+import pytest
+
+from unsplash import (
+    AsyncUnsplashClient,
+    RetryBudget,
+    RetryPolicy,
+    UnsplashClient,
+    UnsplashError,
+)
+from unsplash._retry import parse_retry_after
+
+PORTFOLIO = "https://api.unsplash.com/users/foo/portfolio"
+
+
+def fast_policy(**kwargs):
+    return RetryPolicy(backoff_base=0.0, **kwargs)
+
+
+def test_retries_5xx_then_succeeds(respx_mock):
+    route = respx_mock.get(PORTFOLIO).mock(
+        side_effect=[
+            httpx.Response(502),
+            httpx.Response(503),
+            httpx.Response(200, json={"url": "https://example.com"}),
+        ]
+    )
+    client = UnsplashClient(access_key="test_key", retry_policy=fast_policy())
+    assert client.users.portfolio("foo") == "https://example.com"
+    assert route.call_count == 3
+
+
+def test_retries_transport_errors(respx_mock):
+    route = respx_mock.get(PORTFOLIO).mock(
+        side_effect=[
+            httpx.ConnectError("reset"),
+            httpx.Response(200, json={"url": "https://example.com"}),
+        ]
+    )
+    client = UnsplashClient(access_key="test_key", retry_policy=fast_policy())
+    assert client.users.portfolio("foo") == "https://example.com"
+    assert route.call_count == 2
+
+
+def test_gives_up_after_max_retries(respx_mock):
+    route = respx_mock.get(PORTFOLIO).mock(return_value=httpx.Response(500))
+    client = UnsplashClient(
+        access_key="test_key", retry_policy=fast_policy(max_retries=2)
+    )
+    with pytest.raises(UnsplashError) as exc_info:
+        client.users.portfolio("foo")
+    assert exc_info.value.http_status == 500
+    assert route.call_count == 3
+
+
+def test_non_idempotent_methods_are_not_retried(respx_mock):
+    route = respx_mock.post("https://api.unsplash.com/photos/foo/like").mock(
+        return_value=httpx.Response(503)
+    )
+    client = UnsplashClient(access_key="test_key", retry_policy=fast_policy())
+    with pytest.raises(UnsplashError):
+        client._http.request("POST", "/photos/foo/like")
+    assert route.call_count == 1
+
+
+def test_429_without_retry_after_is_not_retried(respx_mock):
+    route = respx_mock.get(PORTFOLIO).mock(return_value=httpx.Response(429))
+    client = UnsplashClient(access_key="test_key", retry_policy=fast_policy())
+    with pytest.raises(UnsplashError):
+        client.users.portfolio("foo")
+    assert route.call_count == 1
+
+
+def test_budget_stops_retry_storm(respx_mock):
+    route = respx_mock.get(PORTFOLIO).mock(return_value=httpx.Response(503))
+    budget = RetryBudget(ratio=0.0, min_retries=2)
+    client = UnsplashClient(
+        access_key="test_key", retry_policy=fast_policy(budget=budget)
+    )
+    for _ in range(3):
+        with pytest.raises(UnsplashError):
+            client.users.portfolio("foo")
+    # 3 original requests plus the 2 retries the budget allowed
+    assert route.call_count == 5
+
+
+async def test_async_retries(respx_mock):
+    route = respx_mock.get(PORTFOLIO).mock(
+        side_effect=[
+            httpx.Response(503, headers={"Retry-After": "0"}),
+            httpx.Response(200, json={"url": "https://example.com"}),
+        ]
+    )
+    async with AsyncUnsplashClient(
+        access_key="test_key", retry_policy=fast_policy()
+    ) as client:
+        assert await client.users.portfolio("foo") == "https://example.com"
+    assert route.call_count == 2
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("12") == 12.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("garbage") is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
@@ -0,0 +1,69 @@
+import itertools
+
+import httpx
+import pytest
+from conftest import make_photo
+
+from unsplash import AsyncUnsplashClient, NotFoundError, UnsplashClient
+
+
+class RandomFeed:
+    """``/photos/random?count=`` handing out fresh photos, tagged by query."""
+
+    def __init__(self):
+        self.counter = itertools.count()
+        self.calls = []
+
+    def __call__(self, request):
+        params = request.url.params
+        self.calls.append(dict(params))
+        tag = params.get("query", "any")
+        count = int(params["count"])
+        return httpx.Response(
+            200, json=[make_photo(f"{tag}{next(self.counter)}") for _ in range(count)]
+        )
+
+
+def test_sampler_serves_from_pool_and_refills_below_watermark(respx_mock):
+    feed = RandomFeed()
+    respx_mock.get("https://api.unsplash.com/photos/random").mock(side_effect=feed)
+    client = UnsplashClient(access_key="test_key")
+
+    with client.photos.sampler(pool_size=5, low_watermark=2) as sampler:
+        ids = [sampler.sample(query="cats").id for _ in range(3)]
+        assert len(feed.calls) == 1
+        assert feed.calls[0] == {"query": "cats", "count": "5"}
+
+        # the pool is below the watermark: the next sample triggers a background refill
+        sampler.sample(query="cats")
+        ids += [sampler.sample(query="cats").id for _ in range(5)]
+
+        assert len(feed.calls) >= 2
+        assert len(set(ids)) == 8
+        assert sampler.sample(query="dogs").id.startswith("dogs")
+
+
+def test_sampler_raises_when_nothing_matches(respx_mock):
+    respx_mock.get("https://api.unsplash.com/photos/random").mock(
+        return_value=httpx.Response(200, json=[])
+    )
+    client = UnsplashClient(access_key="test_key")
+
+    with client.photos.sampler() as sampler, pytest.raises(NotFoundError):
+        sampler.sample(topics=["nothing"])
+
+
+async def test_async_sampler_pools_per_filter(respx_mock):
+    feed = RandomFeed()
+    respx_mock.get("https://api.unsplash.com/photos/random").mock(side_effect=feed)
+
+    async with AsyncUnsplashClient(access_key="test_key") as client:
+        async with client.photos.sampler(pool_size=4, low_watermark=1) as sampler:
+            await sampler.prefill(query="sea")
+            assert sampler.size(query="sea") == 4
+
+            photos = [await sampler.sample(query="sea") for _ in range(6)]
+
+    assert len({photo.id for photo in photos}) == 6
+    assert all(call["query"] == "sea" for call in feed.calls)
+    assert len(feed.calls) == 2
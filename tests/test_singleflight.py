@@ -0,0 +1,123 @@
+import asyncio
+import threading
+import time
+
+import httpx
+from conftest import make_photo
+
+from unsplash import (
+    AsyncSingleFlight,
+    AsyncUnsplashClient,
+    SingleFlight,
+    UnsplashClient,
+)
+
+
+async def test_concurrent_gets_share_one_request(respx_mock):
+    async def respond(request):
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json=make_photo("foo"))
+
+    route = respx_mock.get("https://api.unsplash.com/photos/foo").mock(
+        side_effect=respond
+    )
+    flight = AsyncSingleFlight()
+    async with AsyncUnsplashClient(
+        access_key="test_key", single_flight=flight
+    ) as client:
+        photos = await asyncio.gather(*(client.photos.get("foo") for _ in range(10)))
+    assert route.call_count == 1
+    assert all(photo is photos[0] for photo in photos)
+    assert flight.calls == 1
+    assert flight.coalesced == 9
+
+
+async def test_random_and_download_tracking_are_not_coalesced(respx_mock):
+    async def respond(request):
+        await asyncio.sleep(0.01)
+        if request.url.path.endswith("/download"):
+            return httpx.Response(200, json={"url": "https://images.example/x"})
+        return httpx.Response(200, json=make_photo("foo"))
+
+    random = respx_mock.get("https://api.unsplash.com/photos/random").mock(
+        side_effect=respond
+    )
+    track = respx_mock.get("https://api.unsplash.com/photos/x/download").mock(
+        side_effect=respond
+    )
+    flight = AsyncSingleFlight()
+    async with AsyncUnsplashClient(
+        access_key="test_key", single_flight=flight
+    ) as client:
+        photos = await asyncio.gather(client.photos.random(), client.photos.random())
+        await asyncio.gather(
+            client.photos.track_download("x"), client.photos.track_download("x")
+        )
+    assert photos[0] is not photos[1]
+    assert random.call_count == 2
+    # every download must be reported to Unsplash
+    assert track.call_count == 2
+    assert flight.calls == flight.coalesced == 0
+
+
+async def test_errors_are_shared(respx_mock):
+    route = respx_mock.get("https://api.unsplash.com/photos/missing").mock(
+        return_value=httpx.Response(404, json={"errors": ["Not Found"]})
+    )
+    async with AsyncUnsplashClient(
+        access_key="test_key", single_flight=AsyncSingleFlight()
+    ) as client:
+        results = await asyncio.gather(
+            *(client.photos.get("missing") for _ in range(3)), return_exceptions=True
+        )
+    assert route.call_count == 1
+    assert all(getattr(r, "http_status", None) == 404 for r in results)
+
+
+def test_thread_safe_single_flight():
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    ready = threading.Barrier(6, timeout=5)
+    calls = []
+
+    def slow():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return "result"
+
+    results = []
+
+    def worker():
+        ready.wait()
+        results.append(flight.do("k", slow))
+
+    threads = [threading.Thread(target=worker) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    ready.wait()
+    assert started.wait(5)
+    # followers block on the leader's call; give them a bounded time to join it
+    deadline = time.monotonic() + 5
+    while flight.coalesced < 4 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+        assert not thread.is_alive()
+    assert results == ["result"] * 5
+    assert len(calls) == 1
+    assert flight.coalesced == 4
+    # once finished, the key can run again
+    assert flight.do("k", lambda: "again") == "again"
+
+
+def test_sync_client_accepts_single_flight(respx_mock):
+    route = respx_mock.get("https://api.unsplash.com/photos/foo").mock(
+        return_value=httpx.Response(200, json=make_photo("foo"))
+    )
+    client = UnsplashClient(access_key="test_key", single_flight=SingleFlight())
+    client.photos.get("foo")
+    client.photos.get("foo")
+    assert route.call_count == 2
@@ -0,0 +1,70 @@
+import httpx
+from conftest import make_photo, make_user
+
+from unsplash import SQLiteStore, UnsplashClient
+from unsplash.models import Photo, User
+
+
+def test_write_through_and_read_through(respx_mock, tmp_path):
+    respx_mock.get("https://api.unsplash.com/photos").mock(
+        return_value=httpx.Response(
+            200, json=[make_photo("a"), make_photo("b", user_id="u2")]
+        )
+    )
+    photo_route = respx_mock.get("https://api.unsplash.com/photos/a").mock(
+        return_value=httpx.Response(200, json=make_photo("a"))
+    )
+    user_route = respx_mock.get("https://api.unsplash.com/users/u2").mock(
+        return_value=httpx.Response(200, json=make_user("u2"))
+    )
+    path = str(tmp_path / "unsplash.db")
+    client = UnsplashClient(access_key="test_key", store=SQLiteStore(path))
+    photos = client.photos.list()
+    assert client._http.store.get(Photo, "b", partial=True) == photos[1]
+
+    # list pages lack detail fields: they must not satisfy get()
+    photo = client.photos.get("a")
+    client.users.get("u2")
+    assert photo_route.call_count == 1 and user_route.call_count == 1
+    client._http.store.close()
+
+    # a new process: the store on disk answers get() without a request
+    store = SQLiteStore(path)
+    assert store.count(Photo) == 2 and store.count(User) == 2
+    client = UnsplashClient(access_key="test_key", store=store)
+    assert client.photos.get("a") == photo
+    assert client.users.get("u2").id == "u2"  # users are also found by username
+    assert photo_route.call_count == 1 and user_route.call_count == 1
+
+    # a later list page does not downgrade the complete row
+    store.upsert([Photo.model_validate(make_photo("a"))], complete=False)
+    assert store.get(Photo, "a") == photo
+
+
+def test_stale_entries_are_refetched(respx_mock):
+    now = [1000.0]
+    store = SQLiteStore(max_age=60, clock=lambda: now[0])
+    store.upsert([Photo.model_validate(make_photo("a"))])
+    route = respx_mock.get("https://api.unsplash.com/photos/a").mock(
+        return_value=httpx.Response(200, json=make_photo("a"))
+    )
+    client = UnsplashClient(access_key="test_key", store=store)
+    client.photos.get("a")
+    now[0] += 61
+    client.photos.get("a")
+    assert route.call_count == 1
+
+
+def test_only_newer_updates_replace_rows():
+    store = SQLiteStore(batch_size=2)
+    old = Photo.model_validate({**make_photo("a", "2024-01-01T00:00:00Z"), "likes": 1})
+    new = Photo.model_validate({**make_photo("a", "2024-02-01T00:00:00Z"), "likes": 2})
+    assert (
+        store.upsert([new, Photo.model_validate(make_photo("b"))]) == 4
+    )  # photos + users
+    store.upsert([old])
+    assert store.get(Photo, "a").likes == 2
+    store.upsert(
+        [Photo.model_validate({**make_photo("a", "2024-03-01T00:00:00Z"), "likes": 3})]
+    )
+    assert store.get(Photo, "a").likes == 3
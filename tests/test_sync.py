@@ -0,0 +1,95 @@
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+from conftest import make_photo
+
+from unsplash import AsyncUnsplashClient, SyncState, UnsplashClient
+
+
+def stamp(n):
+    return f"2024-01-01T00:{n // 60:02d}:{n % 60:02d}Z"
+
+
+class Feed:
+    """Newest-first listing served with page/per_page, like /photos?order_by=latest."""
+
+    def __init__(self, count):
+        self.items = [make_photo(f"p{n}", stamp(n)) for n in reversed(range(count))]
+        self.pages = []
+        self.on_page = None
+
+    def __call__(self, request):
+        page = int(request.url.params["page"])
+        per_page = int(request.url.params["per_page"])
+        self.pages.append(page)
+        body = self.items[(page - 1) * per_page : page * per_page]
+        if self.on_page:
+            self.on_page(page)
+        return httpx.Response(200, json=body)
+
+    def publish(self, n):
+        self.items.insert(0, make_photo(f"p{n}", stamp(n)))
+
+
+def test_sync_only_fetches_new_photos(respx_mock):
+    feed = Feed(25)
+    respx_mock.get("https://api.unsplash.com/photos").mock(side_effect=feed)
+    client = UnsplashClient(access_key="test_key")
+    state = SyncState()
+
+    with pytest.raises(ValueError):
+        client.photos.sync(state)
+    assert len(list(client.photos.sync(state, per_page=10, max_pages=5))) == 25
+    assert state.ids == {"p24"}
+
+    feed.publish(25)
+    feed.publish(26)
+    feed.pages.clear()
+    assert [p.id for p in client.photos.sync(state, per_page=10)] == ["p26", "p25"]
+    assert feed.pages == [1]
+    assert (
+        list(client.photos.sync(SyncState.from_dict(state.to_dict()), per_page=10))
+        == []
+    )
+
+
+def test_sync_skips_items_shifted_by_new_arrivals(respx_mock):
+    feed = Feed(20)
+    # a photo is published while page 1 is being consumed
+    feed.on_page = lambda page: feed.publish(20) if page == 1 else None
+    respx_mock.get("https://api.unsplash.com/photos").mock(side_effect=feed)
+    client = UnsplashClient(access_key="test_key")
+
+    ids = [p.id for p in client.photos.sync(SyncState(), per_page=10, max_pages=5)]
+    assert len(ids) == len(set(ids)) == 20
+
+
+def test_state_only_advances_when_consumed(respx_mock):
+    respx_mock.get("https://api.unsplash.com/photos").mock(side_effect=Feed(5))
+    client = UnsplashClient(access_key="test_key")
+    state = SyncState()
+    for _ in client.photos.sync(state, max_pages=1):
+        break
+    assert state.created_at is None
+
+
+def test_seeded_state_bounds_the_first_sync(respx_mock):
+    respx_mock.get("https://api.unsplash.com/photos").mock(side_effect=Feed(5))
+    client = UnsplashClient(access_key="test_key")
+    state = SyncState.since(datetime(2024, 1, 1, 0, 0, 3, tzinfo=timezone.utc))
+    assert [p.id for p in client.photos.sync(state)] == ["p4", "p3"]
+
+
+async def test_async_user_sync(respx_mock):
+    feed = Feed(3)
+    respx_mock.get("https://api.unsplash.com/users/u1/photos").mock(side_effect=feed)
+    state = SyncState()
+    async with AsyncUnsplashClient(access_key="test_key") as client:
+        with pytest.raises(ValueError):
+            client.users.sync_photos("u1", state)
+        first = [p.id async for p in client.users.sync_photos("u1", state, max_pages=1)]
+        feed.publish(3)
+        second = [p.id async for p in client.users.sync_photos("u1", state)]
+    assert first == ["p2", "p1", "p0"]
+    assert second == ["p3"]
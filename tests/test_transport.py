@@ -0,0 +1,61 @@
+import httpx
+
+from unsplash import AsyncUnsplashClient, UnsplashClient
+
+
+def portfolio_handler(request):
+    return httpx.Response(200, json={"url": f"https://example.com{request.url.path}"})
+
+
+def test_custom_transport_and_limits():
+    limits = httpx.Limits(
+        max_connections=4, max_keepalive_connections=4, keepalive_expiry=60
+    )
+    client = UnsplashClient(
+        access_key="test_key",
+        limits=limits,
+        transport=httpx.MockTransport(portfolio_handler),
+    )
+    assert client.users.portfolio("foo") == "https://example.com/users/foo/portfolio"
+
+
+def test_shared_http_client_across_sdk_clients():
+    shared = httpx.Client(transport=httpx.MockTransport(portfolio_handler))
+    first = UnsplashClient(access_key="key-a", http_client=shared)
+    second = UnsplashClient(access_key="key-b", http_client=shared)
+    assert first._http._client is second._http._client is shared
+    assert first.users.portfolio("a") == "https://example.com/users/a/portfolio"
+    assert second.users.portfolio("b") == "https://example.com/users/b/portfolio"
+
+
+async def test_async_client_does_not_close_injected_client():
+    shared = httpx.AsyncClient(transport=httpx.MockTransport(portfolio_handler))
+    async with AsyncUnsplashClient(access_key="test_key", http_client=shared) as client:
+        await client.users.portfolio("foo")
+    assert not shared.is_closed
+    await shared.aclose()
+
+
+def test_sync_client_context_manager_closes_only_its_own_pool():
+    with UnsplashClient(
+        access_key="test_key", transport=httpx.MockTransport(portfolio_handler)
+    ) as client:
+        client.users.portfolio("foo")
+    assert client._http._client.is_closed
+
+    shared = httpx.Client(transport=httpx.MockTransport(portfolio_handler))
+    with UnsplashClient(access_key="test_key", http_client=shared) as client:
+        client.users.portfolio("foo")
+    assert not shared.is_closed
+    shared.close()
+
+
+def test_sync_client_shared_between_threads():
+    from concurrent.futures import ThreadPoolExecutor
+
+    with UnsplashClient(
+        access_key="test_key", transport=httpx.MockTransport(portfolio_handler)
+    ) as client:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            urls = list(pool.map(client.users.portfolio, [f"u{n}" for n in range(64)]))
+    assert urls == [f"https://example.com/users/u{n}/portfolio" for n in range(64)]
@@ -1,18 +1,95 @@
-from .client import UnsplashClient, AsyncUnsplashClient
-from .errors import (
-    UnsplashError,
-    AuthenticationError,
-    RateLimitError,
-    NotFoundError,
-    ValidationError
-)
+from typing import TYPE_CHECKING, Dict
+
+from ._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .client import UnsplashClient, AsyncUnsplashClient
+    from ._retry import RetryPolicy, RetryBudget
+    from ._ratelimit import RateLimiter, AsyncRateLimiter
+    from ._cache import (
+        ResponseCache,
+        CacheBackend,
+        MemoryCache,
+        CachedResponse,
+        CacheStats
+    )
+    from ._singleflight import SingleFlight, AsyncSingleFlight
+    from .resources._batch import BatchResult
+    from .resources._sampler import RandomPhotoSampler, AsyncRandomPhotoSampler
+    from ._store import SQLiteStore
+    from ._incremental import SyncState
+    from ._hooks import RequestHooks, MetricsCollector
+    from .errors import (
+        UnsplashError,
+        AuthenticationError,
+        RateLimitError,
+        NotFoundError,
+        ValidationError,
+        DownloadError
+    )
+
+# Public names are imported on first access (PEP 562), so ``import unsplash``
+# does not pay for httpx, pydantic and every model up front.
+_EXPORTS: Dict[str, str] = {
+    "UnsplashClient": ".client",
+    "AsyncUnsplashClient": ".client",
+    "RetryPolicy": "._retry",
+    "RetryBudget": "._retry",
+    "RateLimiter": "._ratelimit",
+    "AsyncRateLimiter": "._ratelimit",
+    "ResponseCache": "._cache",
+    "CacheBackend": "._cache",
+    "MemoryCache": "._cache",
+    "CachedResponse": "._cache",
+    "CacheStats": "._cache",
+    "SingleFlight": "._singleflight",
+    "AsyncSingleFlight": "._singleflight",
+    "BatchResult": ".resources._batch",
+    "RandomPhotoSampler": ".resources._sampler",
+    "AsyncRandomPhotoSampler": ".resources._sampler",
+    "SQLiteStore": "._store",
+    "SyncState": "._incremental",
+    "RequestHooks": "._hooks",
+    "MetricsCollector": "._hooks",
+    "UnsplashError": ".errors",
+    "AuthenticationError": ".errors",
+    "RateLimitError": ".errors",
+    "NotFoundError": ".errors",
+    "ValidationError": ".errors",
+    "DownloadError": ".errors",
+}
+
+# subpackages that used to be reachable as attributes after ``import unsplash``
+_SUBMODULES = ("client", "errors", "models", "resources")
 
 __all__ = [
     "UnsplashClient",
     "AsyncUnsplashClient",
+    "RetryPolicy",
+    "RetryBudget",
+    "RateLimiter",
+    "AsyncRateLimiter",
+    "ResponseCache",
+    "CacheBackend",
+    "MemoryCache",
+    "CachedResponse",
+    "CacheStats",
+    "SingleFlight",
+    "AsyncSingleFlight",
+    "BatchResult",
+    "RandomPhotoSampler",
+    "AsyncRandomPhotoSampler",
+    "SQLiteStore",
+    "SyncState",
+    "RequestHooks",
+    "MetricsCollector",
     "UnsplashError",
     "AuthenticationError",
     "RateLimitError",
     "NotFoundError",
     "ValidationError",
+    "DownloadError",
 ]
+
+
+__getattr__, __dir__ = lazy_exports(globals(), _EXPORTS, _SUBMODULES)
@@ -0,0 +1,276 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+from typing import Any, Callable, Dict, Mapping, NamedTuple, Optional
+from urllib.parse import urlencode
+
+import httpx
+
+# Random photos must stay random and download tracking must reach Unsplash, so
+# these are neither cached nor coalesced by single flight.
+NEVER_SHARED = ("/photos/random", "/photos/*/download")
+
+DEFAULT_TTLS: Dict[str, Optional[float]] = {
+    **dict.fromkeys(NEVER_SHARED),
+    "/search/*": 300.0,
+}
+
+
+def never_shared(path: str) -> bool:
+    """Whether responses from ``path`` must never be cached or shared."""
+    return any(fnmatchcase(path, pattern) for pattern in NEVER_SHARED)
+
+
+# The body is stored decoded, so framing and encoding headers must not be replayed.
+_DROPPED_HEADERS = frozenset(
+    {"content-encoding", "content-length", "transfer-encoding"}
+)
+
+
+def cache_key(
+    method: str, path: str, params: Optional[Mapping[str, Any]] = None
+) -> str:
+    """Build a stable key from method, path and (sorted) query parameters."""
+    key = f"{method.upper()} {path}"
+    if params:
+        key += "?" + urlencode(sorted((str(k), str(v)) for k, v in params.items()))
+    return key
+
+
+class CachedResponse:
+    """
+    The parts of an HTTP response needed to replay it.
+
+    The replayed ``httpx.Response`` is built once and reused, so anything parsed
+    from it (see ``HTTPClient.parse``) is shared by later hits and 304s.
+    """
+
+    __slots__ = ("status_code", "headers", "content", "expires_at", "_response")
+
+    def __init__(
+        self,
+        status_code: int,
+        headers: Dict[str, str],
+        content: bytes,
+        expires_at: float,
+    ):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.expires_at = expires_at
+        self._response: Optional[httpx.Response] = None
+
+    @property
+    def etag(self) -> Optional[str]:
+        return self.headers.get("etag") or self.headers.get("ETag")
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        return self.headers.get("last-modified") or self.headers.get("Last-Modified")
+
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers for revalidating this entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_response(self, request: httpx.Request) -> httpx.Response:
+        if self._response is None:
+            self._response = httpx.Response(
+                self.status_code,
+                headers=self.headers,
+                content=self.content,
+                request=request,
+            )
+        return self._response
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    revalidations: int
+    evictions: int
+    size: int
+
+
+class CacheBackend(ABC):
+    """
+    Storage interface for ``ResponseCache``.
+
+    Implement this to keep responses on disk or in a shared store. Backends
+    must be safe to call from several threads.
+    """
+
+    evictions: int = 0
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Return the entry for ``key`` or None."""
+
+    @abstractmethod
+    def set(self, key: str, entry: CachedResponse) -> None:
+        """Store ``entry`` under ``key``."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove ``key`` if present."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every entry."""
+
+    @abstractmethod
+    def __len__(self) -> int: ...
+
+
+class MemoryCache(CacheBackend):
+    """
+    Thread-safe in-memory LRU backend.
+
+    Args:
+        maxsize: Maximum number of entries kept (default 1024).
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self.evictions = 0
+        self._data: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                self._data.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        with self._lock:
+            self._data[key] = entry
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class ResponseCache:
+    """
+    TTL cache for successful GET responses, keyed on method, path and params.
+
+    TTLs are looked up per endpoint: ``ttls`` maps shell-style path patterns
+    (e.g. ``"/photos/*"``) to seconds, checked in insertion order before the
+    built-in defaults and finally ``ttl``. A TTL of None disables caching for
+    matching paths; a TTL of 0 revalidates on every request.
+
+    Expired entries that carry an ``ETag`` or ``Last-Modified`` header are
+    kept and revalidated with ``If-None-Match``/``If-Modified-Since``; a 304
+    replays the stored response (and the models already parsed from it)
+    instead of downloading and validating the body again.
+
+    Args:
+        backend: Storage backend (default ``MemoryCache()``).
+        ttl: Default TTL in seconds (default 60).
+        ttls: Per-endpoint TTL overrides.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        ttl: Optional[float] = 60.0,
+        ttls: Optional[Mapping[str, Optional[float]]] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.backend = backend if backend is not None else MemoryCache()
+        self.ttl = ttl
+        self.ttls: Dict[str, Optional[float]] = {**(ttls or {})}
+        for pattern, value in DEFAULT_TTLS.items():
+            self.ttls.setdefault(pattern, value)
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self._clock = clock
+        # guards the counters and the lifetime of revalidated entries
+        self._lock = threading.Lock()
+
+    def ttl_for(self, path: str) -> Optional[float]:
+        """TTL applied to responses from ``path``."""
+        for pattern, ttl in self.ttls.items():
+            if fnmatchcase(path, pattern):
+                return ttl
+        return self.ttl
+
+    def lookup(self, key: str) -> Optional[CachedResponse]:
+        """
+        Return the entry for ``key``, fresh or stale, counting the hit or miss.
+
+        Use ``is_fresh`` to tell whether it can be served without revalidation.
+        """
+        entry = self.backend.get(key)
+        fresh = entry is not None and self.is_fresh(entry)
+        with self._lock:
+            if fresh:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return entry
+
+    def is_fresh(self, entry: CachedResponse) -> bool:
+        return entry.expires_at > self._clock()
+
+    def set(self, key: str, path: str, response: httpx.Response) -> None:
+        """Store ``response`` if it is a success and its endpoint is cacheable."""
+        ttl = self.ttl_for(path)
+        if ttl is None or not response.is_success:
+            return
+        entry = CachedResponse(
+            response.status_code,
+            {
+                k: v
+                for k, v in response.headers.items()
+                if k.lower() not in _DROPPED_HEADERS
+            },
+            response.content,
+            self._clock() + ttl,
+        )
+        if ttl <= 0 and not entry.validators():
+            return
+        # replay the original response so models parsed from it are shared
+        entry._response = response
+        self.backend.set(key, entry)
+
+    def revalidated(self, key: str, path: str, entry: CachedResponse) -> None:
+        """Record a 304 for ``entry`` and extend its lifetime."""
+        expires_at = self._clock() + (self.ttl_for(path) or 0.0)
+        with self._lock:
+            self.revalidations += 1
+            entry.expires_at = expires_at
+        self.backend.set(key, entry)
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+    @property
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            self.hits,
+            self.misses,
+            self.revalidations,
+            self.backend.evictions,
+            len(self.backend),
+        )
@@ -1,5 +1,15 @@
+import asyncio
+import time
 import httpx
-from typing import Optional, Any, Dict
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Any, Callable, Dict, List, Sequence, Type
+from ._retry import RetryPolicy, parse_retry_after
+from ._ratelimit import RateLimiter, AsyncRateLimiter, header_int
+from ._cache import ResponseCache, cache_key, never_shared
+from ._parsing import M, is_parsed, parse_model, parse_models
+from ._singleflight import SingleFlight, AsyncSingleFlight
+from ._download import DEFAULT_CHUNK_SIZE, PathLike, download, adownload
+from ._hooks import Outcome, RequestHooks
 from .errors import (
     UnsplashError,
     AuthenticationError,
@@ -8,20 +18,202 @@ from .errors import (
     ValidationError
 )
 
-class HTTPClient:
-    """Sync/async HTTP client for API requests."""
+if TYPE_CHECKING:
+    # sqlite3 is only loaded when a store is actually created
+    from ._store import SQLiteStore
+
+# Same pool size as httpx's own default.
+DEFAULT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
+_STORED = "unsplash.stored"
+
+_QUOTA_HEADERS = frozenset(
+    {b"x-ratelimit-limit", b"x-ratelimit-remaining", b"retry-after"}
+)
+
+
+def _rate_limit_error(response: httpx.Response) -> RateLimitError:
+    # one pass over the raw headers; each Headers.get() rescans (and decodes) them all
+    headers = {
+        name.decode("ascii"): value.decode("latin-1")
+        for name, value in ((key.lower(), value) for key, value in response.headers.raw)
+        if name in _QUOTA_HEADERS
+    }
+    # Without Retry-After the reset time is unknown: the hourly window is not
+    # reported, so (as in RetryPolicy) no wait is guessed
+    retry_after = parse_retry_after(headers.get("retry-after"))
+    return RateLimitError(
+        # 0 when a header is missing, as before the mapper read them lazily
+        limit=header_int(headers, "x-ratelimit-limit") or 0,
+        remaining=header_int(headers, "x-ratelimit-remaining") or 0,
+        reset_at=None if retry_after is None else time.time() + retry_after,
+        http_status=response.status_code,
+        http_body=response.content
+    )
+
+
+def _error(cls: Type[UnsplashError]) -> Callable[[httpx.Response], UnsplashError]:
+    return lambda response: cls(
+        http_status=response.status_code, http_body=response.content
+    )
+
+
+# status -> exception factory; the body is handed over undecoded (see UnsplashError)
+_ERRORS: Dict[int, Callable[[httpx.Response], UnsplashError]] = {
+    401: _error(AuthenticationError),
+    404: _error(NotFoundError),
+    422: _error(ValidationError),
+    429: _rate_limit_error,
+}
+_DEFAULT_ERROR = _error(UnsplashError)
+
+
+class _BaseHTTPClient:
+    """Behavior shared by the sync and async HTTP clients."""
+
+    validate_responses: bool = True
+    store: Optional["SQLiteStore"] = None
+    hooks: Sequence[RequestHooks] = ()
+
+    def parse(
+        self,
+        response: httpx.Response,
+        model: Type[M],
+        fields: Optional[Sequence[str]] = None
+    ) -> M:
+        """Parse a response body into ``model``, optionally only ``fields``."""
+        validate = self.validate_responses
+        if self.hooks and not is_parsed(response, model, False, validate, fields):
+            start = time.perf_counter()
+            parsed = parse_model(response, model, validate, fields)
+            self._parsed(model, 1, time.perf_counter() - start)
+        else:
+            parsed = parse_model(response, model, validate, fields)
+        if self.store is not None and fields is None:
+            # search results wrap the stored models in ``results``; like list
+            # pages they lack detail fields, so they are stored as partial rows
+            results = getattr(parsed, "results", None)
+            if results is None:
+                self._write_through(response, [parsed], complete=True)
+            else:
+                self._write_through(response, results, complete=False)
+        return parsed
+
+    def parse_many(
+        self,
+        response: httpx.Response,
+        model: Type[M],
+        fields: Optional[Sequence[str]] = None
+    ) -> List[M]:
+        """Parse a JSON array response body into a list of ``model``."""
+        validate = self.validate_responses
+        if self.hooks and not is_parsed(response, model, True, validate, fields):
+            start = time.perf_counter()
+            parsed = parse_models(response, model, validate, fields)
+            self._parsed(model, len(parsed), time.perf_counter() - start)
+        else:
+            parsed = parse_models(response, model, validate, fields)
+        if self.store is not None and fields is None:
+            self._write_through(response, parsed, complete=False)
+        return parsed
+
+    def stored(self, model: Type[M], key: str) -> Optional[M]:
+        """``model`` for ``key`` from the store, if one is set and has a fresh entry."""
+        if self.store is None:
+            return None
+        return self.store.get(model, key, validate=self.validate_responses)
+
+    def _write_through(
+        self, response: httpx.Response, items: Sequence[Any], complete: bool
+    ) -> None:
+        # a response replayed from the cache was already written
+        if self.store is None or response.extensions.get(_STORED):
+            return
+        response.extensions[_STORED] = True
+        self.store.upsert(items, complete)
+
+    @staticmethod
+    def _check_error(response: httpx.Response, conditional: bool = False) -> None:
+        """Convert HTTP errors to domain exceptions."""
+        # 304 only answers a conditional request sent by the response cache.
+        if response.is_success or (conditional and response.status_code == 304):
+            return
+        raise _ERRORS.get(response.status_code, _DEFAULT_ERROR)(response)
+
+    def _parsed(self, model: Type[Any], count: int, elapsed: float) -> None:
+        for hook in self.hooks:
+            hook.on_parse(model, count, elapsed)
+
+    def _before_request(self, method: str, url: str, attempt: int) -> float:
+        for hook in self.hooks:
+            hook.before_request(method, url, attempt)
+        return time.perf_counter()
+
+    def _after_response(
+        self, method: str, url: str, response: httpx.Response, start: float
+    ) -> None:
+        elapsed = time.perf_counter() - start
+        for hook in self.hooks:
+            hook.after_response(method, url, response, elapsed)
+
+    def _retrying(
+        self, method: str, url: str, attempt: int, delay: float, outcome: Outcome
+    ) -> None:
+        for hook in self.hooks:
+            hook.on_retry(method, url, attempt, delay, outcome)
+
+    def _failed(self, method: str, url: str, error: BaseException) -> None:
+        for hook in self.hooks:
+            hook.on_error(method, url, error)
+
+
+class HTTPClient(_BaseHTTPClient):
+    """
+    Sync HTTP client for API requests.
+
+    Safe to share between threads: the ``httpx.Client`` connection pool and
+    the built-in optional components (retry budget, rate limiter, response
+    cache and ``MemoryCache``, single flight, store, metrics) are guarded by
+    locks. A custom ``CacheBackend`` or ``RequestHooks`` must be thread-safe
+    itself.
+    """
     
     def __init__(
         self,
         access_key: str,
         base_url: str = "https://api.unsplash.com",
         timeout: float = 30.0,
-        max_retries: int = 3
+        max_retries: int = 3,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        single_flight: Optional[SingleFlight] = None,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        transport: Optional[httpx.BaseTransport] = None,
+        http_client: Optional[httpx.Client] = None,
+        validate_responses: bool = True,
+        store: Optional["SQLiteStore"] = None,
+        hooks: Sequence[RequestHooks] = ()
     ):
         self.access_key = access_key
         self.base_url = base_url
-        self.max_retries = max_retries
-        self._client = httpx.Client(timeout=timeout)
+        self.retry_policy = retry_policy or RetryPolicy(max_retries=max_retries)
+        self.max_retries = self.retry_policy.max_retries
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.single_flight = single_flight
+        self.validate_responses = validate_responses
+        self.store = store
+        self.hooks = tuple(hooks)
+        # an injected client is shared with its owner, who is responsible for closing it
+        self._owns_client = http_client is None
+        self._client = http_client or httpx.Client(
+            timeout=timeout,
+            limits=limits or DEFAULT_LIMITS,
+            http2=http2,
+            transport=transport
+        )
     
     def request(
         self,
@@ -32,48 +224,110 @@ class HTTPClient:
         headers = kwargs.pop("headers", {})
         headers["Authorization"] = f"Client-ID {self.access_key}"
         headers["Accept-Version"] = "v1"
-        
-        response = self._client.request(
-            method,
-            f"{self.base_url}{path}",
-            headers=headers,
-            **kwargs
-        )
-        self._check_error(response)
+        url = f"{self.base_url}{path}"
+
+        if (
+            method.upper() != "GET"
+            or (self.cache is None and self.single_flight is None)
+            or never_shared(path)
+        ):
+            return self._send(method, url, headers, **kwargs)
+
+        key = cache_key(method, path, kwargs.get("params"))
+        if self.single_flight is not None:
+            return self.single_flight.do(
+                key, lambda: self._get(key, path, url, headers, **kwargs)
+            )
+        return self._get(key, path, url, headers, **kwargs)
+
+    def _get(
+        self,
+        key: str,
+        path: str,
+        url: str,
+        headers: Dict[str, str],
+        **kwargs: Any
+    ) -> httpx.Response:
+        """GET through the response cache, revalidating stale entries."""
+        if self.cache is None:
+            return self._send("GET", url, headers, **kwargs)
+
+        request = httpx.Request("GET", url, params=kwargs.get("params"))
+        entry = self.cache.lookup(key)
+        if entry is not None:
+            if self.cache.is_fresh(entry):
+                return entry.to_response(request)
+            headers.update(entry.validators())
+
+        response = self._send("GET", url, headers, entry is not None, **kwargs)
+        if response.status_code == 304 and entry is not None:
+            self.cache.revalidated(key, path, entry)
+            return entry.to_response(request)
+        self.cache.set(key, path, response)
         return response
 
-    def _check_error(self, response: httpx.Response) -> None:
-        """Convert HTTP errors to domain exceptions."""
-        if response.is_success:
-            return
+    def _send(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        conditional: bool = False,
+        **kwargs: Any
+    ) -> httpx.Response:
+        """
+        Send a request, applying rate limiting and the retry policy.
 
-        status = response.status_code
-        body = response.text
-        
-        try:
-            data = response.json()
-            errors = data.get("errors", [])
-            message = ", ".join(errors) if errors else body
-        except Exception:
-            message = body
-            data = {}
-        
-        if status == 401:
-            raise AuthenticationError(message, status, body)
-        elif status == 404:
-            raise NotFoundError(message, status, body)
-        elif status == 422:
-            errors = data.get("errors", [])
-            raise ValidationError(message, errors, http_status=status, http_body=body)
-        elif status == 429:
-            limit = int(response.headers.get("X-Ratelimit-Limit", 0))
-            remaining = int(response.headers.get("X-Ratelimit-Remaining", 0))
-            raise RateLimitError(message, limit, remaining, http_status=status, http_body=body)
-        else:
-            raise UnsplashError(message, status, body)
+        ``conditional`` marks a cache revalidation, for which 304 is not an error.
+        """
+        policy = self.retry_policy
+        policy.budget.deposit()
+
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            start = self._before_request(method, url, attempt) if self.hooks else 0.0
+            outcome: Outcome
+            try:
+                response = self._client.request(method, url, headers=headers, **kwargs)
+            except httpx.TransportError as exc:
+                delay = policy.delay_for_exception(method, exc, attempt)
+                if delay is None:
+                    self._failed(method, url, exc)
+                    raise
+                outcome = exc
+            else:
+                if self.hooks:
+                    self._after_response(method, url, response, start)
+                if self.rate_limiter is not None:
+                    self.rate_limiter.update(response.headers)
+                delay = policy.delay_for_response(method, response, attempt)
+                if delay is None:
+                    try:
+                        self._check_error(response, conditional)
+                    except UnsplashError as exc:
+                        self._failed(method, url, exc)
+                        raise
+                    return response
+                outcome = response
+                response.close()
+            self._retrying(method, url, attempt, delay, outcome)
+            time.sleep(delay)
+            attempt += 1
+
+    def download(
+        self, url: str, path: PathLike, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Path:
+        """Stream an image URL to ``path``, resuming partial files."""
+        return download(self._client, url, path, self.retry_policy, chunk_size)
 
+    def close(self) -> None:
+        if self._owns_client:
+            self._client.close()
 
-class AsyncHTTPClient:
+
+
+class AsyncHTTPClient(_BaseHTTPClient):
     """Async variant of HTTPClient."""
     
     def __init__(
@@ -81,12 +335,37 @@ class AsyncHTTPClient:
         access_key: str,
         base_url: str = "https://api.unsplash.com",
         timeout: float = 30.0,
-        max_retries: int = 3
+        max_retries: int = 3,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[AsyncRateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        single_flight: Optional[AsyncSingleFlight] = None,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+        validate_responses: bool = True,
+        store: Optional["SQLiteStore"] = None,
+        hooks: Sequence[RequestHooks] = ()
     ):
         self.access_key = access_key
         self.base_url = base_url
-        self.max_retries = max_retries
-        self._client = httpx.AsyncClient(timeout=timeout)
+        self.retry_policy = retry_policy or RetryPolicy(max_retries=max_retries)
+        self.max_retries = self.retry_policy.max_retries
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.single_flight = single_flight
+        self.validate_responses = validate_responses
+        self.store = store
+        self.hooks = tuple(hooks)
+        # an injected client is shared with its owner, who is responsible for closing it
+        self._owns_client = http_client is None
+        self._client = http_client or httpx.AsyncClient(
+            timeout=timeout,
+            limits=limits or DEFAULT_LIMITS,
+            http2=http2,
+            transport=transport
+        )
 
     async def request(
         self,
@@ -97,46 +376,111 @@ class AsyncHTTPClient:
         headers = kwargs.pop("headers", {})
         headers["Authorization"] = f"Client-ID {self.access_key}"
         headers["Accept-Version"] = "v1"
-        
-        response = await self._client.request(
-            method,
-            f"{self.base_url}{path}",
-            headers=headers,
-            **kwargs
+        url = f"{self.base_url}{path}"
+
+        if (
+            method.upper() != "GET"
+            or (self.cache is None and self.single_flight is None)
+            or never_shared(path)
+        ):
+            return await self._send(method, url, headers, **kwargs)
+
+        key = cache_key(method, path, kwargs.get("params"))
+        if self.single_flight is not None:
+            return await self.single_flight.do(
+                key, lambda: self._get(key, path, url, headers, **kwargs)
+            )
+        return await self._get(key, path, url, headers, **kwargs)
+
+    async def _get(
+        self,
+        key: str,
+        path: str,
+        url: str,
+        headers: Dict[str, str],
+        **kwargs: Any
+    ) -> httpx.Response:
+        """GET through the response cache, revalidating stale entries."""
+        if self.cache is None:
+            return await self._send("GET", url, headers, **kwargs)
+
+        request = httpx.Request("GET", url, params=kwargs.get("params"))
+        entry = self.cache.lookup(key)
+        if entry is not None:
+            if self.cache.is_fresh(entry):
+                return entry.to_response(request)
+            headers.update(entry.validators())
+
+        response = await self._send(
+            "GET", url, headers, entry is not None, **kwargs
         )
-        self._check_error(response)
+        if response.status_code == 304 and entry is not None:
+            self.cache.revalidated(key, path, entry)
+            return entry.to_response(request)
+        self.cache.set(key, path, response)
         return response
 
-    def _check_error(self, response: httpx.Response) -> None:
-        """Reuse error checking logic (identical behavior)."""
-        # We can duplicate the logic or use a mixin, duplication is fine for now to avoid complexity
-        if response.is_success:
-            return
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        conditional: bool = False,
+        **kwargs: Any
+    ) -> httpx.Response:
+        """
+        Send a request, applying rate limiting and the retry policy.
+
+        ``conditional`` marks a cache revalidation, for which 304 is not an error.
+        """
+        policy = self.retry_policy
+        policy.budget.deposit()
+
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire()
+            start = self._before_request(method, url, attempt) if self.hooks else 0.0
+            outcome: Outcome
+            try:
+                response = await self._client.request(
+                    method, url, headers=headers, **kwargs
+                )
+            except httpx.TransportError as exc:
+                delay = policy.delay_for_exception(method, exc, attempt)
+                if delay is None:
+                    self._failed(method, url, exc)
+                    raise
+                outcome = exc
+            else:
+                if self.hooks:
+                    self._after_response(method, url, response, start)
+                if self.rate_limiter is not None:
+                    self.rate_limiter.update(response.headers)
+                delay = policy.delay_for_response(method, response, attempt)
+                if delay is None:
+                    try:
+                        self._check_error(response, conditional)
+                    except UnsplashError as exc:
+                        self._failed(method, url, exc)
+                        raise
+                    return response
+                outcome = response
+                await response.aclose()
+            self._retrying(method, url, attempt, delay, outcome)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def download(
+        self,
+        url: str,
+        path: PathLike,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Path:
+        """Stream an image URL to ``path``, resuming partial files."""
+        return await adownload(self._client, url, path, self.retry_policy, chunk_size)
 
-        status = response.status_code
-        body = response.text
-        
-        try:
-            data = response.json()
-            errors = data.get("errors", [])
-            message = ", ".join(errors) if errors else body
-        except Exception:
-            message = body
-            data = {}
-        
-        if status == 401:
-            raise AuthenticationError(message, status, body)
-        elif status == 404:
-            raise NotFoundError(message, status, body)
-        elif status == 422:
-            errors = data.get("errors", [])
-            raise ValidationError(message, errors, http_status=status, http_body=body)
-        elif status == 429:
-            limit = int(response.headers.get("X-Ratelimit-Limit", 0))
-            remaining = int(response.headers.get("X-Ratelimit-Remaining", 0))
-            raise RateLimitError(message, limit, remaining, http_status=status, http_body=body)
-        else:
-            raise UnsplashError(message, status, body)
 
     async def aclose(self) -> None:
-        await self._client.aclose()
+        if self._owns_client:
+            await self._client.aclose()
@@ -0,0 +1,164 @@
+import asyncio
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Tuple, Union
+
+import httpx
+
+from ._retry import RetryPolicy
+from .errors import DownloadError
+from .models import Photo, PhotoUrls
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+def image_url(
+    photo: Photo, size: str = "full", params: Optional[Mapping[str, Any]] = None
+) -> str:
+    """``photo.urls.<size>`` with extra imgix ``params`` (e.g. ``{"w": 1200}``)."""
+    if size not in PhotoUrls.model_fields:
+        raise ValueError(f"size must be one of {', '.join(PhotoUrls.model_fields)}")
+    url = getattr(photo.urls, size)
+    if url is None:
+        raise ValueError(f"Photo {photo.id} has no {size} URL")
+    if not params:
+        return str(url)
+    return str(httpx.URL(str(url)).copy_merge_params(dict(params)))
+
+
+def part_path(path: Path) -> Path:
+    """Where the partial download of ``path`` is kept until it is complete."""
+    return path.with_name(path.name + ".part")
+
+
+def _resume(part: Path) -> Tuple[int, Dict[str, str]]:
+    """Bytes already on disk and the request headers to fetch the rest."""
+    offset = part.stat().st_size if part.exists() else 0
+    # sizes are verified on the wire, so ask for the bytes as stored
+    headers = {"Accept-Encoding": "identity"}
+    if offset:
+        headers["Range"] = f"bytes={offset}-"
+    return offset, headers
+
+
+def _range_total(response: httpx.Response) -> Optional[int]:
+    """Full size from ``Content-Range: bytes 100-999/1000`` (or ``bytes */1000``)."""
+    total = response.headers.get("Content-Range", "").rpartition("/")[2]
+    return int(total) if total.isdigit() else None
+
+
+def _expected_size(response: httpx.Response) -> Tuple[str, Optional[int]]:
+    """File mode for writing ``response`` and the final size it should produce."""
+    if response.status_code == 206:
+        return "ab", _range_total(response)
+    if response.status_code == 200:
+        # the server ignored the Range header and sent the whole file
+        length = response.headers.get("Content-Length")
+        return "wb", int(length) if length and length.isdigit() else None
+    raise DownloadError(
+        f"Download of {response.url} failed with status {response.status_code}",
+        response.status_code,
+    )
+
+
+def _finish(part: Path, path: Path, total: Optional[int]) -> Path:
+    size = part.stat().st_size
+    if total is not None and size != total:
+        part.unlink()
+        raise DownloadError(f"Downloaded {size} bytes of {path.name}, expected {total}")
+    os.replace(part, path)
+    return path
+
+
+def download(
+    client: httpx.Client,
+    url: str,
+    path: PathLike,
+    policy: RetryPolicy,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Path:
+    """
+    Stream ``url`` to ``path`` in ``chunk_size`` pieces.
+
+    Bytes go to ``<path>.part`` first. A leftover ``.part`` file, or a connection
+    that drops mid-transfer, is resumed with an HTTP Range request, following
+    ``policy`` for retries, which also covers retryable statuses such as a
+    503. The file is renamed into place once its size matches what the
+    server announced; a 416 whose ``Content-Range`` matches the ``.part``
+    file means it is already complete.
+    """
+    path = Path(path)
+    part = part_path(path)
+    policy.budget.deposit()
+    attempt = 0
+    while True:
+        offset, headers = _resume(part)
+        delay = None
+        try:
+            with client.stream("GET", url, headers=headers) as response:
+                if response.status_code == 416 and offset:
+                    if _range_total(response) == offset:
+                        # the partial file already holds every byte
+                        return _finish(part, path, offset)
+                    # the partial file is stale: start over
+                    part.unlink()
+                    continue
+                if not response.is_success:
+                    delay = policy.delay_for_response("GET", response, attempt)
+                if delay is None:
+                    mode, total = _expected_size(response)
+                    with open(part, mode) as f:
+                        for chunk in response.iter_raw(chunk_size):
+                            f.write(chunk)
+        except httpx.TransportError as exc:
+            delay = policy.delay_for_exception("GET", exc, attempt)
+            if delay is None:
+                raise
+        if delay is not None:
+            time.sleep(delay)
+            attempt += 1
+            continue
+        return _finish(part, path, total)
+
+
+async def adownload(
+    client: httpx.AsyncClient,
+    url: str,
+    path: PathLike,
+    policy: RetryPolicy,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Path:
+    """Async ``download``. File writes are plain blocking writes of one chunk each."""
+    path = Path(path)
+    part = part_path(path)
+    policy.budget.deposit()
+    attempt = 0
+    while True:
+        offset, headers = _resume(part)
+        delay = None
+        try:
+            async with client.stream("GET", url, headers=headers) as response:
+                if response.status_code == 416 and offset:
+                    if _range_total(response) == offset:
+                        return _finish(part, path, offset)
+                    part.unlink()
+                    continue
+                if not response.is_success:
+                    delay = policy.delay_for_response("GET", response, attempt)
+                if delay is None:
+                    mode, total = _expected_size(response)
+                    with open(part, mode) as f:
+                        async for chunk in response.aiter_raw(chunk_size):
+                            f.write(chunk)
+        except httpx.TransportError as exc:
+            delay = policy.delay_for_exception("GET", exc, attempt)
+            if delay is None:
+                raise
+        if delay is not None:
+            await asyncio.sleep(delay)
+            attempt += 1
+            continue
+        return _finish(part, path, total)
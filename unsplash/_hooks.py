@@ -0,0 +1,247 @@
+import re
+import threading
+from bisect import bisect_left
+from typing import Dict, List, Optional, Sequence, Tuple, Type, Union
+
+import httpx
+
+Outcome = Union[httpx.Response, BaseException]
+
+
+class RequestHooks:
+    """
+    Callbacks fired by the HTTP clients. Subclass and override what you need;
+    every hook is a no-op by default.
+
+    Hooks run inline on the request path (and on the event loop for the async
+    client), so they should be quick and must not raise.
+    """
+
+    def before_request(self, method: str, url: str, attempt: int) -> None:
+        """A request (``attempt`` 0) or a retry of it is about to be sent."""
+
+    def after_response(
+        self, method: str, url: str, response: httpx.Response, elapsed: float
+    ) -> None:
+        """A response arrived after ``elapsed`` seconds, whatever its status."""
+
+    def on_retry(
+        self, method: str, url: str, attempt: int, delay: float, outcome: Outcome
+    ) -> None:
+        """``outcome`` (a response or transport error) is retried after ``delay``."""
+
+    def on_error(self, method: str, url: str, error: BaseException) -> None:
+        """The request failed for good; ``error`` is about to be raised."""
+
+    def on_parse(self, model: Type[object], count: int, elapsed: float) -> None:
+        """``count`` instances of ``model`` were parsed from a body in ``elapsed``."""
+
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# /photos/abc123/download -> /photos/{id}/download, keeping label cardinality low
+_RESOURCE_ID = re.compile(r"^/(photos|users|collections|topics)/(?!random$)[^/]+")
+
+
+def endpoint(url: str) -> str:
+    """Path of ``url`` with resource IDs replaced by ``{id}``."""
+    path = httpx.URL(url).path
+    return _RESOURCE_ID.sub(r"/\1/{id}", path)
+
+
+class _Histogram:
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.buckets, value)
+        if index < len(self.counts):
+            self.counts[index] += 1
+        self.sum += value
+        self.count += 1
+
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{value}"' for key, value in labels) + "}"
+
+
+class MetricsCollector(RequestHooks):
+    """
+    ``RequestHooks`` that aggregates request metrics in memory.
+
+    Records per-endpoint latency histograms, response counts by status,
+    retries, errors, bytes received, parse time per model and the latest
+    rate-limit headroom. ``export()`` renders everything in the Prometheus
+    text exposition format.
+
+    Args:
+        prefix: Metric name prefix (default ``"unsplash"``).
+        buckets: Histogram bucket upper bounds in seconds.
+    """
+
+    def __init__(
+        self, prefix: str = "unsplash", buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        self.prefix = prefix
+        self.buckets = tuple(sorted(buckets))
+        self.latency: Dict[Labels, _Histogram] = {}
+        self.parse_time: Dict[Labels, _Histogram] = {}
+        self.responses: Dict[Labels, int] = {}
+        self.retries: Dict[Labels, int] = {}
+        self.errors: Dict[Labels, int] = {}
+        self.bytes_received: Dict[Labels, int] = {}
+        self.parsed: Dict[Labels, int] = {}
+        self.ratelimit_limit: Optional[int] = None
+        self.ratelimit_remaining: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def after_response(
+        self, method: str, url: str, response: httpx.Response, elapsed: float
+    ) -> None:
+        labels = (("endpoint", endpoint(url)), ("method", method))
+        status = labels + (("status", str(response.status_code)),)
+        with self._lock:
+            self._histogram(self.latency, labels).observe(elapsed)
+            self.responses[status] = self.responses.get(status, 0) + 1
+            self.bytes_received[labels] = (
+                self.bytes_received.get(labels, 0) + response.num_bytes_downloaded
+            )
+            limit = response.headers.get("X-Ratelimit-Limit")
+            remaining = response.headers.get("X-Ratelimit-Remaining")
+            if limit is not None and limit.isdigit():
+                self.ratelimit_limit = int(limit)
+            if remaining is not None and remaining.isdigit():
+                self.ratelimit_remaining = int(remaining)
+
+    def on_retry(
+        self, method: str, url: str, attempt: int, delay: float, outcome: Outcome
+    ) -> None:
+        labels = (("endpoint", endpoint(url)), ("method", method))
+        with self._lock:
+            self.retries[labels] = self.retries.get(labels, 0) + 1
+
+    def on_error(self, method: str, url: str, error: BaseException) -> None:
+        labels = (
+            ("endpoint", endpoint(url)),
+            ("method", method),
+            ("error", type(error).__name__),
+        )
+        with self._lock:
+            self.errors[labels] = self.errors.get(labels, 0) + 1
+
+    def on_parse(self, model: Type[object], count: int, elapsed: float) -> None:
+        labels = (("model", model.__name__),)
+        with self._lock:
+            self._histogram(self.parse_time, labels).observe(elapsed)
+            self.parsed[labels] = self.parsed.get(labels, 0) + count
+
+    def _histogram(
+        self, family: Dict[Labels, _Histogram], labels: Labels
+    ) -> _Histogram:
+        histogram = family.get(labels)
+        if histogram is None:
+            histogram = family[labels] = _Histogram(self.buckets)
+        return histogram
+
+    def export(self) -> str:
+        """All metrics in the Prometheus text format (version 0.0.4)."""
+        lines: List[str] = []
+        with self._lock:
+            self._export_histogram(
+                lines, "request_duration_seconds", "HTTP request latency.", self.latency
+            )
+            self._export_counter(
+                lines, "responses_total", "HTTP responses by status.", self.responses
+            )
+            self._export_counter(
+                lines, "retries_total", "Requests retried.", self.retries
+            )
+            self._export_counter(
+                lines, "errors_total", "Requests that failed.", self.errors
+            )
+            self._export_counter(
+                lines,
+                "response_bytes_total",
+                "Response bytes received.",
+                self.bytes_received,
+            )
+            self._export_histogram(
+                lines,
+                "parse_duration_seconds",
+                "Time spent parsing bodies into models.",
+                self.parse_time,
+            )
+            self._export_counter(
+                lines, "parsed_models_total", "Models parsed.", self.parsed
+            )
+            for name, value, help_text in (
+                ("ratelimit_limit", self.ratelimit_limit, "Hourly request quota."),
+                (
+                    "ratelimit_remaining",
+                    self.ratelimit_remaining,
+                    "Requests left this hour.",
+                ),
+            ):
+                if value is not None:
+                    lines += [
+                        f"# HELP {self.prefix}_{name} {help_text}",
+                        f"# TYPE {self.prefix}_{name} gauge",
+                        f"{self.prefix}_{name} {value}",
+                    ]
+        return "\n".join(lines) + "\n"
+
+    def _export_counter(
+        self, lines: List[str], name: str, help_text: str, values: Dict[Labels, int]
+    ) -> None:
+        if not values:
+            return
+        name = f"{self.prefix}_{name}"
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+        lines += [
+            f"{name}{_labels(labels)} {value}"
+            for labels, value in sorted(values.items())
+        ]
+
+    def _export_histogram(
+        self,
+        lines: List[str],
+        name: str,
+        help_text: str,
+        values: Dict[Labels, _Histogram],
+    ) -> None:
+        if not values:
+            return
+        name = f"{self.prefix}_{name}"
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+        for labels, histogram in sorted(values.items()):
+            cumulative = 0
+            for bound, count in zip(histogram.buckets, histogram.counts):
+                cumulative += count
+                le = _labels(labels + (("le", format(bound, "g")),))
+                lines.append(f"{name}_bucket{le} {cumulative}")
+            le = _labels(labels + (("le", "+Inf"),))
+            lines.append(f"{name}_bucket{le} {histogram.count}")
+            lines.append(f"{name}_sum{_labels(labels)} {histogram.sum:.6f}")
+            lines.append(f"{name}_count{_labels(labels)} {histogram.count}")
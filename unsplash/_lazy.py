@@ -0,0 +1,30 @@
+from importlib import import_module
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+
+def lazy_exports(
+    namespace: Dict[str, Any], exports: Dict[str, str], submodules: Sequence[str] = ()
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Module ``__getattr__`` and ``__dir__`` (PEP 562) for a package's ``globals()``.
+
+    ``exports`` maps each public name to the relative module defining it; the
+    module is imported on first access and the value cached in ``namespace``.
+    ``submodules`` are returned as modules when accessed as attributes.
+    """
+    package = namespace["__name__"]
+
+    def __getattr__(name: str) -> Any:
+        if name in submodules:
+            return import_module(f".{name}", package)
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(import_module(module, package), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(namespace["__all__"]))
+
+    return __getattr__, __dir__
@@ -0,0 +1,94 @@
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, TypeVar, cast
+
+import httpx
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import from_json
+
+from .models._construct import construct
+from .models._projection import adopt, projection
+
+M = TypeVar("M", bound=BaseModel)
+
+_PARSED = "unsplash.parsed"
+
+
+_MemoKey = Tuple[Type[BaseModel], bool, bool, Optional[Tuple[str, ...]]]
+
+
+def _memo(response: httpx.Response) -> Dict[_MemoKey, Any]:
+    """Per-response store of parsed results, kept in ``response.extensions``."""
+    return cast(Dict[_MemoKey, Any], response.extensions.setdefault(_PARSED, {}))
+
+
+def _key(
+    model: Type[BaseModel], many: bool, validate: bool, fields: Optional[Sequence[str]]
+) -> _MemoKey:
+    return (model, many, validate, tuple(fields) if fields else None)
+
+
+def is_parsed(
+    response: httpx.Response,
+    model: Type[BaseModel],
+    many: bool,
+    validate: bool = True,
+    fields: Optional[Sequence[str]] = None,
+) -> bool:
+    """Whether parsing ``response`` as ``model`` would be answered from the memo."""
+    memo = response.extensions.get(_PARSED)
+    return memo is not None and _key(model, many, validate, fields) in memo
+
+
+@lru_cache(maxsize=None)
+def list_adapter(model: Type[M]) -> "TypeAdapter[List[M]]":
+    """``TypeAdapter(List[model])``, built once per model type."""
+    return TypeAdapter(List[model])  # type: ignore[valid-type]
+
+
+def parse_model(
+    response: httpx.Response,
+    model: Type[M],
+    validate: bool = True,
+    fields: Optional[Sequence[str]] = None,
+) -> M:
+    """
+    Validate the response body as ``model``.
+
+    The raw body bytes go straight to pydantic-core's JSON parser, so no
+    intermediate Python dicts are built. With ``validate=False`` the model is
+    built by ``construct`` instead, which skips validation.
+    ``fields`` restricts parsing to the given dotted paths (see ``projection``).
+    The result is memoized on the response, so a response replayed from the
+    cache (or shared by several callers) is only parsed once.
+    """
+    memo = _memo(response)
+    key = _key(model, False, validate, fields)
+    if key not in memo:
+        target = projection(model, key[3]) if key[3] else model
+        if validate:
+            parsed: BaseModel = target.model_validate_json(response.content)
+        else:
+            parsed = construct(target, from_json(response.content))
+        memo[key] = adopt(model, parsed) if key[3] else parsed
+    return cast(M, memo[key])
+
+
+def parse_models(
+    response: httpx.Response,
+    model: Type[M],
+    validate: bool = True,
+    fields: Optional[Sequence[str]] = None,
+) -> List[M]:
+    """Parse a JSON array body as a list of ``model`` (see ``parse_model``)."""
+    memo = _memo(response)
+    key = _key(model, True, validate, fields)
+    if key not in memo:
+        target = projection(model, key[3]) if key[3] else model
+        if validate:
+            parsed: List[BaseModel] = list_adapter(target).validate_json(
+                response.content
+            )
+        else:
+            parsed = [construct(target, item) for item in from_json(response.content)]
+        memo[key] = [adopt(model, item) for item in parsed] if key[3] else parsed
+    return list(memo[key])
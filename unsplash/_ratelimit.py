@@ -0,0 +1,137 @@
+import asyncio
+import threading
+import time
+from typing import Any, Callable, ClassVar, Dict, Mapping, Optional, Type, TypeVar, cast
+
+T = TypeVar("T", bound="_TokenBucket")
+
+
+def header_int(headers: Mapping[str, str], name: str) -> Optional[int]:
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+class _TokenBucket:
+    """
+    Token bucket refilled at ``limit / window`` tokens per second.
+
+    The limit is learned from the ``X-Ratelimit-Limit`` header of every
+    response, and ``X-Ratelimit-Remaining`` caps the local token count so the
+    bucket never believes it has more quota than the server does. Until the
+    first response arrives the limit is unknown and requests pass through.
+    """
+
+    _shared: ClassVar[Dict[str, "_TokenBucket"]]
+    _shared_lock: ClassVar[threading.Lock]
+
+    def __init__(
+        self,
+        limit: Optional[int] = None,
+        window: float = 3600.0,
+        burst: int = 10,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.limit = limit
+        self.remaining: Optional[int] = None
+        self.window = window
+        self.burst = burst
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def __init_subclass__(cls) -> None:
+        super().__init_subclass__()
+        cls._shared = {}
+        cls._shared_lock = threading.Lock()
+
+    @classmethod
+    def shared(cls: Type[T], access_key: str, **kwargs: Any) -> T:
+        """
+        Return the process-wide limiter for ``access_key``.
+
+        Clients built with the same access key draw from one bucket, matching
+        how Unsplash accounts the quota. ``kwargs`` only apply on first use.
+        """
+        with cls._shared_lock:
+            limiter = cls._shared.get(access_key)
+            if limiter is None:
+                limiter = cls(**kwargs)
+                cls._shared[access_key] = limiter
+            return cast(T, limiter)
+
+    @property
+    def rate(self) -> Optional[float]:
+        """Sustained requests per second allowed by the current limit."""
+        if not self.limit:
+            return None
+        return self.limit / self.window
+
+    def _refill(self, now: float) -> None:
+        rate = self.rate
+        if rate is not None:
+            elapsed = max(0.0, now - self._updated)
+            self._tokens = min(float(self.burst), self._tokens + elapsed * rate)
+        self._updated = now
+
+    def _reserve(self) -> float:
+        """Take one token and return how long the caller must wait to use it."""
+        with self._lock:
+            rate = self.rate
+            if rate is None:
+                return 0.0
+            self._refill(self._clock())
+            self._tokens -= 1.0
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / rate
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """Feed rate-limit headers from a response back into the bucket."""
+        limit = header_int(headers, "X-Ratelimit-Limit")
+        remaining = header_int(headers, "X-Ratelimit-Remaining")
+        if limit is None and remaining is None:
+            return
+        with self._lock:
+            self._refill(self._clock())
+            if limit:
+                self.limit = limit
+            if remaining is not None:
+                self.remaining = remaining
+                self._tokens = min(self._tokens, float(remaining))
+
+
+class RateLimiter(_TokenBucket):
+    """
+    Thread-safe client-side rate limiter driven by Unsplash rate-limit headers.
+
+    Requests are paced at the hourly quota's average rate with a small burst
+    allowance, so a long crawl approaches the limit smoothly instead of hitting
+    429 and stalling until the window resets.
+
+    Args:
+        limit: Requests per window; learned from responses when omitted.
+        window: Quota window in seconds (default 3600).
+        burst: Requests that may be sent back-to-back (default 10).
+    """
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+
+class AsyncRateLimiter(_TokenBucket):
+    """asyncio variant of ``RateLimiter``; waiting does not block the event loop."""
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
@@ -0,0 +1,146 @@
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import FrozenSet, Iterable, Optional
+
+import httpx
+
+RETRYABLE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a ``Retry-After`` header (delta-seconds or HTTP date) into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+class RetryBudget:
+    """
+    Token bucket that caps retries to a fraction of overall traffic.
+
+    The bucket holds up to ``min_retries`` tokens. Every original request
+    deposits ``ratio`` tokens and every retry withdraws one, so once the bucket
+    is drained retries add at most ``ratio`` extra load on top of the normal
+    request volume instead of multiplying it.
+
+    Args:
+        ratio: Retries earned per original request (default 0.2).
+        min_retries: Bucket capacity, i.e. retries available in a burst (default 10).
+    """
+
+    def __init__(self, ratio: float = 0.2, min_retries: int = 10):
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self._tokens = float(min_retries)
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        """Record an original (non-retry) request."""
+        with self._lock:
+            self._tokens = min(float(self.min_retries), self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Try to spend a token for one retry. Returns False if exhausted."""
+        with self._lock:
+            if self._tokens < 1.0:
+                return False
+            self._tokens -= 1.0
+            return True
+
+    @property
+    def available(self) -> float:
+        """Retries currently available."""
+        return self._tokens
+
+
+class RetryPolicy:
+    """
+    Decide whether and when a failed request should be retried.
+
+    Delays use exponential backoff with full jitter: the n-th retry sleeps a
+    random amount between 0 and ``min(backoff_max, backoff_base * 2 ** n)``.
+    A ``Retry-After`` header on the response takes precedence, as long as it
+    does not exceed ``max_retry_after``.
+
+    Args:
+        max_retries: Maximum retries per request (default 3).
+        backoff_base: Base delay in seconds (default 0.5).
+        backoff_max: Upper bound for a single backoff delay (default 30.0).
+        max_retry_after: Longest ``Retry-After`` we are willing to honor; longer
+            waits are surfaced to the caller instead (default 60.0).
+        retry_methods: HTTP methods considered idempotent (default GET/HEAD/OPTIONS).
+        retry_statuses: Status codes that trigger a retry.
+        budget: Shared ``RetryBudget``; a fresh one is created when omitted.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        max_retry_after: float = 60.0,
+        retry_methods: Iterable[str] = RETRYABLE_METHODS,
+        retry_statuses: Iterable[int] = RETRYABLE_STATUSES,
+        budget: Optional[RetryBudget] = None,
+    ):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_retry_after = max_retry_after
+        self.retry_methods: FrozenSet[str] = frozenset(m.upper() for m in retry_methods)
+        self.retry_statuses: FrozenSet[int] = frozenset(retry_statuses)
+        self.budget = budget if budget is not None else RetryBudget()
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter delay before retry number ``attempt`` (0-based)."""
+        cap = min(self.backoff_max, self.backoff_base * (2**attempt))
+        return random.uniform(0, cap)
+
+    def _allowed(self, method: str, attempt: int) -> bool:
+        return attempt < self.max_retries and method.upper() in self.retry_methods
+
+    def delay_for_response(
+        self, method: str, response: httpx.Response, attempt: int
+    ) -> Optional[float]:
+        """
+        Return the delay before retrying ``response``, or None to give up.
+
+        A 429 is only retried when the server says when to come back, since
+        Unsplash quotas are hourly and blind backoff would just burn retries.
+        """
+        status = response.status_code
+        if status not in self.retry_statuses or not self._allowed(method, attempt):
+            return None
+
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if retry_after is not None and retry_after > self.max_retry_after:
+            return None
+        if status == 429 and retry_after is None:
+            return None
+        if not self.budget.withdraw():
+            return None
+        return retry_after if retry_after is not None else self.backoff(attempt)
+
+    def delay_for_exception(
+        self, method: str, exc: Exception, attempt: int
+    ) -> Optional[float]:
+        """Return the delay before retrying after a transport error, or None."""
+        if not isinstance(exc, httpx.TransportError):
+            return None
+        if isinstance(exc, (httpx.UnsupportedProtocol, httpx.ProxyError)):
+            return None
+        if not self._allowed(method, attempt) or not self.budget.withdraw():
+            return None
+        return self.backoff(attempt)
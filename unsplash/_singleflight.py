@@ -0,0 +1,90 @@
+import asyncio
+import threading
+from typing import Awaitable, Callable, Dict, Generic, Optional, TypeVar, cast
+
+T = TypeVar("T")
+
+
+class _Call(Generic[T]):
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Optional[T] = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Thread-safe request coalescing.
+
+    While a call for a key is in flight, other threads asking for the same key
+    wait for it and receive the same result (or exception) instead of issuing
+    their own request.
+
+    Attributes:
+        calls: Calls that were actually executed.
+        coalesced: Calls that piggybacked on an in-flight one.
+    """
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.coalesced = 0
+        self._inflight: Dict[str, "_Call[object]"] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        """Run ``fn`` unless a call for ``key`` is running; then share its outcome."""
+        with self._lock:
+            call = self._inflight.get(key)
+            leader = call is None
+            if call is None:
+                call = self._inflight[key] = _Call()
+                self.calls += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return cast(T, call.result)
+
+        try:
+            result = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        else:
+            call.result = result
+            return result
+        finally:
+            with self._lock:
+                del self._inflight[key]
+            call.done.set()
+
+
+class AsyncSingleFlight:
+    """
+    asyncio variant of ``SingleFlight``.
+
+    The shared call runs in its own task, so cancelling one waiter does not
+    cancel the request for the others.
+    """
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.coalesced = 0
+        self._inflight: Dict[str, "asyncio.Future[object]"] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Await ``fn`` unless a call for ``key`` is running; then share its outcome."""
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(cast(Awaitable[object], fn()))
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+            self.calls += 1
+        else:
+            self.coalesced += 1
+        return cast(T, await asyncio.shield(future))
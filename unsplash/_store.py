@@ -0,0 +1,204 @@
+import sqlite3
+import threading
+import time
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Type
+
+from pydantic import BaseModel
+from pydantic_core import from_json
+
+from ._parsing import M
+from ._time import timestamp
+from .models import Collection, Photo, User
+from .models._construct import construct
+
+# model -> (table, attribute that can also be looked up, e.g. users by username)
+_TABLES: Dict[Type[BaseModel], Tuple[str, Optional[str]]] = {
+    Photo: ("photos", None),
+    User: ("users", "username"),
+    Collection: ("collections", None),
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS {table} (
+    id TEXT PRIMARY KEY,
+    handle TEXT,
+    updated_at REAL,
+    fetched_at REAL NOT NULL,
+    complete INTEGER NOT NULL,
+    data BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS {table}_handle ON {table} (handle);
+"""
+
+# The row is rewritten only when the upstream updated_at moved (or is unknown);
+# otherwise just fetched_at is bumped so read-through sees the entry as fresh.
+# A partial row (from a list page) never overwrites an up-to-date complete one.
+_UPSERT = """
+INSERT INTO {table} (id, handle, updated_at, fetched_at, complete, data)
+VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT (id) DO UPDATE SET
+    fetched_at = excluded.fetched_at,
+    handle = excluded.handle,
+    complete = CASE WHEN {newer} THEN excluded.complete
+        ELSE max({table}.complete, excluded.complete) END,
+    data = CASE WHEN {newer} OR excluded.complete > {table}.complete
+        THEN excluded.data ELSE {table}.data END,
+    updated_at = CASE WHEN {newer}
+        THEN excluded.updated_at ELSE {table}.updated_at END
+"""
+_NEWER = (
+    "(excluded.updated_at IS NULL OR {table}.updated_at IS NULL"
+    " OR excluded.updated_at > {table}.updated_at)"
+)
+
+
+def _chunks(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class SQLiteStore:
+    """
+    Persistent store of photos, users and collections, keyed by ``id``.
+
+    Pass it to the client as ``store=`` to write every parsed model through
+    to disk (including the users embedded in photos and collections) and to
+    answer ``photos.get``, ``users.get`` and ``collections.get`` from disk while
+    entries are younger than ``max_age``. A stored row's data is replaced only
+    when the upstream ``updated_at`` moves forward.
+
+    Models from list and search pages (and embedded users) carry fewer fields
+    than the detail endpoints return. They are stored as partial rows, which
+    ``get`` skips unless asked for them, so read-through never hands out a
+    photo without its EXIF, location or tags.
+
+    The store is safe to share between threads. It is synchronous, so async
+    clients block briefly on local disk I/O.
+
+    Args:
+        path: Database file (default ``":memory:"``).
+        max_age: Seconds a stored entry answers ``get`` without a request
+            (default 3600). None serves stored entries indefinitely.
+        batch_size: Rows written per transaction by ``upsert`` (default 500).
+    """
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        max_age: Optional[float] = 3600.0,
+        batch_size: int = 500,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = path
+        self.max_age = max_age
+        self.batch_size = batch_size
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            path, check_same_thread=False, isolation_level=None
+        )
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        for table, _ in _TABLES.values():
+            self._conn.executescript(_SCHEMA.format(table=table))
+
+    def upsert(self, items: Iterable[BaseModel], complete: bool = True) -> int:
+        """
+        Write ``items`` (and the users they embed) in batched transactions.
+
+        Pass ``complete=False`` for models from list or search pages. Embedded
+        users are always stored as partial rows. Returns the number of rows
+        offered to the store. Items of types the store does not keep are ignored.
+        """
+        count = 0
+        now = self._clock()
+        for chunk in _chunks(self._flatten(items, complete), self.batch_size):
+            rows: Dict[str, List[Tuple[Any, ...]]] = {}
+            for item, full in chunk:
+                table, handle = _TABLES[type(item)]
+                rows.setdefault(table, []).append(
+                    (
+                        item.id,
+                        getattr(item, handle) if handle else None,
+                        timestamp(getattr(item, "updated_at", None)),
+                        now,
+                        int(full),
+                        item.model_dump_json(by_alias=True),
+                    )
+                )
+            with self._lock:
+                self._conn.execute("BEGIN")
+                try:
+                    for table, values in rows.items():
+                        sql = _UPSERT.format(
+                            table=table, newer=_NEWER.format(table=table)
+                        )
+                        self._conn.executemany(sql, values)
+                except BaseException:
+                    self._conn.execute("ROLLBACK")
+                    raise
+                self._conn.execute("COMMIT")
+            count += len(chunk)
+        return count
+
+    def get(
+        self,
+        model: Type[M],
+        key: str,
+        max_age: Optional[float] = None,
+        validate: bool = True,
+        partial: bool = False,
+    ) -> Optional[M]:
+        """
+        Stored ``model`` for ``key`` (its id, or a user's username), or None.
+
+        Entries fetched more than ``max_age`` seconds ago (default: the store's
+        ``max_age``) count as missing, as do partial rows unless ``partial``.
+        """
+        table, handle = _TABLES[model]
+        where = "(id = ? OR handle = ?)" if handle else "id = ?"
+        if not partial:
+            where += " AND complete"
+        params: Tuple[Any, ...] = (key, key) if handle else (key,)
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT fetched_at, data FROM {table} WHERE {where} LIMIT 1", params
+            ).fetchone()
+        if row is None:
+            return None
+        max_age = self.max_age if max_age is None else max_age
+        if max_age is not None and row[0] + max_age < self._clock():
+            return None
+        if validate:
+            return model.model_validate_json(row[1])
+        return construct(model, from_json(row[1]))
+
+    def count(self, model: Type[BaseModel]) -> int:
+        """Number of stored ``model`` rows."""
+        table, _ = _TABLES[model]
+        with self._lock:
+            return int(
+                self._conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _flatten(
+        items: Iterable[BaseModel], complete: bool
+    ) -> Iterator[Tuple[BaseModel, bool]]:
+        for item in items:
+            if type(item) not in _TABLES:
+                continue
+            yield item, complete
+            user = getattr(item, "user", None)
+            if type(user) is User:
+                yield user, False
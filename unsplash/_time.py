@@ -0,0 +1,18 @@
+from datetime import datetime, timezone
+from typing import Optional, Union
+
+
+def parse_datetime(value: str) -> datetime:
+    """An API ISO 8601 timestamp (``fromisoformat`` only takes ``Z`` from 3.11)."""
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def timestamp(value: Union[datetime, str, None]) -> Optional[float]:
+    """Epoch seconds of an API datetime or ISO 8601 string; naive means UTC."""
+    if isinstance(value, str):
+        value = parse_datetime(value)
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
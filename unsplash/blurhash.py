@@ -0,0 +1,209 @@
+"""
+BlurHash decoding (https://blurha.sh) for ``Photo.blur_hash`` placeholders.
+
+``decode`` returns packed RGB bytes, ``decode_many`` decodes a whole page at
+once with NumPy (``pip install unsplash-pydantic[numpy]``).
+"""
+
+import math
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    import numpy
+
+_ALPHABET = (
+    "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    "abcdefghijklmnopqrstuvwxyz#$%*+,-.:;=?@[]^_{|}~"
+)
+_DIGITS = {char: value for value, char in enumerate(_ALPHABET)}
+
+Color = Tuple[float, float, float]
+
+
+def _decode83(text: str) -> int:
+    value = 0
+    for char in text:
+        digit = _DIGITS.get(char)
+        if digit is None:
+            raise ValueError(f"Invalid BlurHash character {char!r}")
+        value = value * 83 + digit
+    return value
+
+
+def _srgb_to_linear(value: int) -> float:
+    v = value / 255
+    return v / 12.92 if v <= 0.04045 else ((v + 0.055) / 1.055) ** 2.4
+
+
+# every sRGB byte for linear values 0..1 in steps of 1/4096: close enough for
+# 8-bit output and far cheaper than a pow() per channel
+_LINEAR_STEPS = 4096
+_TO_SRGB = bytes(
+    max(
+        0,
+        min(
+            255,
+            int(
+                (v * 12.92 if v <= 0.0031308 else 1.055 * v ** (1 / 2.4) - 0.055) * 255
+                + 0.5
+            ),
+        ),
+    )
+    for v in (i / _LINEAR_STEPS for i in range(_LINEAR_STEPS + 1))
+)
+
+
+def _sign_pow(value: float, exp: float) -> float:
+    return math.copysign(abs(value) ** exp, value)
+
+
+def components(blur_hash: str, punch: float = 1.0) -> Tuple[int, int, List[Color]]:
+    """
+    Parse ``blur_hash`` into ``(x_components, y_components, colors)``.
+
+    ``colors`` holds linear RGB factors in row-major component order. ``punch``
+    scales the contrast of the AC components.
+    """
+    if len(blur_hash) < 6:
+        raise ValueError("BlurHash must be at least 6 characters")
+    size_flag = _decode83(blur_hash[0])
+    num_y, num_x = size_flag // 9 + 1, size_flag % 9 + 1
+    if len(blur_hash) != 4 + 2 * num_x * num_y:
+        raise ValueError(
+            f"BlurHash length {len(blur_hash)} does not match "
+            f"{num_x}x{num_y} components"
+        )
+
+    max_value = (_decode83(blur_hash[1]) + 1) / 166 * punch
+    dc = _decode83(blur_hash[2:6])
+    colors = [
+        (
+            _srgb_to_linear(dc >> 16),
+            _srgb_to_linear((dc >> 8) & 255),
+            _srgb_to_linear(dc & 255),
+        )
+    ]
+    for i in range(1, num_x * num_y):
+        value = _decode83(blur_hash[4 + i * 2 : 6 + i * 2])
+        colors.append(
+            (
+                _sign_pow((value // 361 - 9) / 9, 2.0) * max_value,
+                _sign_pow((value // 19 % 19 - 9) / 9, 2.0) * max_value,
+                _sign_pow((value % 19 - 9) / 9, 2.0) * max_value,
+            )
+        )
+    return num_x, num_y, colors
+
+
+@lru_cache(maxsize=64)
+def _cosines(components: int, size: int) -> Tuple[Tuple[float, ...], ...]:
+    """``cos(pi * pixel * component / size)``, indexed ``[component][pixel]``."""
+    return tuple(
+        tuple(math.cos(math.pi * pixel * component / size) for pixel in range(size))
+        for component in range(components)
+    )
+
+
+@lru_cache(maxsize=1024)
+def decode(
+    blur_hash: str, width: int = 32, height: int = 32, punch: float = 1.0
+) -> bytes:
+    """
+    Decode ``blur_hash`` into ``width * height`` packed RGB pixels (row-major).
+
+    Results are cached, so repeated hashes (and sizes) cost a dict lookup.
+    Raises ``ValueError`` for malformed hashes.
+    """
+    num_x, num_y, colors = components(blur_hash, punch)
+    cos_x = _cosines(num_x, width)
+    cos_y = _cosines(num_y, height)
+
+    # the basis is separable: fold the x cosines into each row of components
+    # once, then each pixel row only sums over the y components
+    rows = []
+    for j in range(num_y):
+        row_colors = colors[j * num_x : (j + 1) * num_x]
+        rows.append(
+            [
+                (
+                    sum(c[0] * cx[x] for c, cx in zip(row_colors, cos_x)),
+                    sum(c[1] * cx[x] for c, cx in zip(row_colors, cos_x)),
+                    sum(c[2] * cx[x] for c, cx in zip(row_colors, cos_x)),
+                )
+                for x in range(width)
+            ]
+        )
+
+    steps = _LINEAR_STEPS
+    srgb = _TO_SRGB
+    pixels = bytearray(width * height * 3)
+    i = 0
+    for y in range(height):
+        weights = [cy[y] for cy in cos_y]
+        for x in range(width):
+            r = g = b = 0.0
+            for weight, row in zip(weights, rows):
+                pr, pg, pb = row[x]
+                r += weight * pr
+                g += weight * pg
+                b += weight * pb
+            pixels[i] = srgb[min(steps, max(0, int(r * steps + 0.5)))]
+            pixels[i + 1] = srgb[min(steps, max(0, int(g * steps + 0.5)))]
+            pixels[i + 2] = srgb[min(steps, max(0, int(b * steps + 0.5)))]
+            i += 3
+    return bytes(pixels)
+
+
+def decode_array(
+    blur_hash: str, width: int = 32, height: int = 32, punch: float = 1.0
+) -> "numpy.ndarray[Any, Any]":
+    """``decode`` as a read-only ``(height, width, 3)`` uint8 NumPy array."""
+    np = _numpy()
+    pixels: "numpy.ndarray[Any, Any]" = np.frombuffer(
+        decode(blur_hash, width, height, punch), dtype=np.uint8
+    )
+    return pixels.reshape(height, width, 3)
+
+
+def decode_many(
+    blur_hashes: Sequence[Optional[str]],
+    width: int = 32,
+    height: int = 32,
+    punch: float = 1.0,
+) -> "numpy.ndarray[Any, Any]":
+    """
+    Decode a page of hashes at once into an ``(n, height, width, 3)`` uint8 array.
+
+    Components of every hash are stacked and evaluated with one matrix product
+    per axis. Missing (None) hashes decode to black.
+    """
+    np = _numpy()
+    parsed = [
+        components(h, punch) if h else (1, 1, [(0.0, 0.0, 0.0)]) for h in blur_hashes
+    ]
+    max_x = max((num_x for num_x, _, _ in parsed), default=1)
+    max_y = max((num_y for _, num_y, _ in parsed), default=1)
+
+    stacked = np.zeros((len(parsed), max_y, max_x, 3))
+    for n, (num_x, num_y, colors) in enumerate(parsed):
+        stacked[n, :num_y, :num_x] = np.asarray(colors).reshape(num_y, num_x, 3)
+
+    cos_x = np.cos(np.pi * np.outer(np.arange(max_x), np.arange(width)) / width)
+    cos_y = np.cos(np.pi * np.outer(np.arange(height), np.arange(max_y)) / height)
+    # (height, max_y) x (n, max_y, max_x, 3) x (max_x, width) -> (n, height, width, 3)
+    linear = np.einsum("hj,njic,iw->nhwc", cos_y, stacked, cos_x, optimize=True)
+    index = np.clip(np.rint(linear * _LINEAR_STEPS), 0, _LINEAR_STEPS).astype(np.intp)
+    pixels: "numpy.ndarray[Any, Any]" = np.frombuffer(_TO_SRGB, dtype=np.uint8)[index]
+    return pixels
+
+
+def _numpy() -> Any:
+    try:
+        import numpy
+    except ImportError as exc:
+        raise ImportError(
+            "This BlurHash function requires numpy: "
+            "pip install unsplash-pydantic[numpy]"
+        ) from exc
+    return numpy
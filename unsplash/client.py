@@ -1,4 +1,11 @@
+import httpx
+from typing import TYPE_CHECKING, Optional, Sequence
 from ._client_base import HTTPClient, AsyncHTTPClient
+from ._retry import RetryPolicy
+from ._ratelimit import RateLimiter, AsyncRateLimiter
+from ._cache import ResponseCache
+from ._singleflight import SingleFlight, AsyncSingleFlight
+from ._hooks import RequestHooks
 from .resources import (
     PhotosResource, AsyncPhotosResource,
     UsersResource, AsyncUsersResource,
@@ -6,15 +13,44 @@ from .resources import (
     SearchResource, AsyncSearchResource
 )
 
+if TYPE_CHECKING:
+    from ._store import SQLiteStore
+
 class UnsplashClient:
     """
     Synchronous Unsplash API Client.
+
+    Use it as a context manager, or call ``close()``, to release its
+    connections. One client is safe to share between threads (e.g. the
+    workers of a ``ThreadPoolExecutor``) and they all reuse its keep-alive
+    connections, so prefer one long-lived client over one per task.
     
     Args:
         access_key: Your Application ID (Access Key).
         base_url: Optional override for API base URL.
         timeout: Request timeout in seconds (default 30.0).
         max_retries: Number of retries for failed requests (default 3).
+        retry_policy: Custom ``RetryPolicy``; overrides ``max_retries`` when given.
+        rate_limiter: Optional ``RateLimiter`` pacing requests by the quota headers.
+            Use ``RateLimiter.shared(access_key)`` to share one bucket between clients.
+        cache: Optional ``ResponseCache`` for GET responses.
+        single_flight: Optional ``SingleFlight``; identical concurrent GETs then
+            share one request and one parsed result.
+        limits: Connection pool limits (size, keep-alive count and expiry).
+        http2: Enable HTTP/2; requires ``pip install unsplash-pydantic[http2]``.
+        transport: Custom httpx transport, e.g. for proxies or testing.
+        http_client: Pre-built ``httpx.Client`` to share one connection pool
+            between several SDK clients. Pool options above are then ignored
+            and the caller remains responsible for closing it.
+        validate_responses: Set to False to build models from trusted API
+            responses without Pydantic validation. Nested objects are only
+            built, and their URL and datetime fields converted, when first
+            read; nothing is checked.
+        store: Optional ``SQLiteStore``. Parsed photos, users and collections
+            are written through to it, and ``get`` calls are answered from it
+            while its entries are fresh.
+        hooks: ``RequestHooks`` called around every request, retry, error and
+            parse, e.g. a ``MetricsCollector``.
     """
 
     def __init__(
@@ -22,19 +58,51 @@ class UnsplashClient:
         access_key: str,
         base_url: str = "https://api.unsplash.com",
         timeout: float = 30.0,
-        max_retries: int = 3
+        max_retries: int = 3,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        single_flight: Optional[SingleFlight] = None,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        transport: Optional[httpx.BaseTransport] = None,
+        http_client: Optional[httpx.Client] = None,
+        validate_responses: bool = True,
+        store: Optional["SQLiteStore"] = None,
+        hooks: Sequence[RequestHooks] = ()
     ):
         self._http = HTTPClient(
             access_key=access_key,
             base_url=base_url,
             timeout=timeout,
-            max_retries=max_retries
+            max_retries=max_retries,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            cache=cache,
+            single_flight=single_flight,
+            limits=limits,
+            http2=http2,
+            transport=transport,
+            http_client=http_client,
+            validate_responses=validate_responses,
+            store=store,
+            hooks=hooks
         )
         self.photos = PhotosResource(self._http)
         self.users = UsersResource(self._http)
         self.collections = CollectionsResource(self._http)
         self.search = SearchResource(self._http)
 
+    def close(self) -> None:
+        """Close the connection pool (unless it was passed in as ``http_client``)."""
+        self._http.close()
+
+    def __enter__(self) -> "UnsplashClient":
+        return self
+
+    def __exit__(self, exc_type: object, exc_val: object, exc_tb: object) -> None:
+        self.close()
+
 class AsyncUnsplashClient:
     """
     Asynchronous Unsplash API Client.
@@ -44,6 +112,28 @@ class AsyncUnsplashClient:
         base_url: Optional override for API base URL.
         timeout: Request timeout in seconds (default 30.0).
         max_retries: Number of retries for failed requests (default 3).
+        retry_policy: Custom ``RetryPolicy``; overrides ``max_retries`` when given.
+        rate_limiter: Optional ``AsyncRateLimiter`` pacing requests by the
+            quota headers. Use ``AsyncRateLimiter.shared(access_key)`` to share
+            one bucket between clients.
+        cache: Optional ``ResponseCache`` for GET responses.
+        single_flight: Optional ``AsyncSingleFlight``; identical concurrent GETs then
+            share one request and one parsed result.
+        limits: Connection pool limits (size, keep-alive count and expiry).
+        http2: Enable HTTP/2; requires ``pip install unsplash-pydantic[http2]``.
+        transport: Custom httpx transport, e.g. for proxies or testing.
+        http_client: Pre-built ``httpx.AsyncClient`` to share one connection pool
+            between several SDK clients. Pool options above are then ignored
+            and the caller remains responsible for closing it.
+        validate_responses: Set to False to build models from trusted API
+            responses without Pydantic validation. Nested objects are only
+            built, and their URL and datetime fields converted, when first
+            read; nothing is checked.
+        store: Optional ``SQLiteStore``. Parsed photos, users and collections
+            are written through to it, and ``get`` calls are answered from it
+            while its entries are fresh.
+        hooks: ``RequestHooks`` called around every request, retry, error and
+            parse, e.g. a ``MetricsCollector``.
     """
 
     def __init__(
@@ -51,13 +141,35 @@ class AsyncUnsplashClient:
         access_key: str,
         base_url: str = "https://api.unsplash.com",
         timeout: float = 30.0,
-        max_retries: int = 3
+        max_retries: int = 3,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[AsyncRateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        single_flight: Optional[AsyncSingleFlight] = None,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+        validate_responses: bool = True,
+        store: Optional["SQLiteStore"] = None,
+        hooks: Sequence[RequestHooks] = ()
     ):
         self._http = AsyncHTTPClient(
             access_key=access_key,
             base_url=base_url,
             timeout=timeout,
-            max_retries=max_retries
+            max_retries=max_retries,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            cache=cache,
+            single_flight=single_flight,
+            limits=limits,
+            http2=http2,
+            transport=transport,
+            http_client=http_client,
+            validate_responses=validate_responses,
+            store=store,
+            hooks=hooks
         )
         self.photos = AsyncPhotosResource(self._http)
         self.users = AsyncUsersResource(self._http)
@@ -67,5 +179,11 @@ class AsyncUnsplashClient:
     async def __aenter__(self) -> "AsyncUnsplashClient":
         return self
         
-    async def __aexit__(self, exc_type: object, exc_val: object, exc_tb: object) -> None:
+    async def aclose(self) -> None:
+        """Close the connection pool (unless it was passed in as ``http_client``)."""
         await self._http.aclose()
+
+    async def __aexit__(
+        self, exc_type: object, exc_val: object, exc_tb: object
+    ) -> None:
+        await self.aclose()
@@ -1,36 +1,126 @@
-from typing import List, Optional, Any
+import json
+import time
+from typing import Any, List, Optional, Tuple, Union
+
+# Exception's own ``args`` slot, wrapped by ``UnsplashError.args``
+_ARGS: Any = BaseException.__dict__["args"]
+
+
+def _parse_errors(body: Union[str, bytes, None]) -> List[str]:
+    """The ``errors`` array of a JSON error body, or ``[]``."""
+    if not body:
+        return []
+    try:
+        data = json.loads(body)
+    except ValueError:
+        return []
+    errors = data.get("errors") if isinstance(data, dict) else None
+    return [str(error) for error in errors] if isinstance(errors, list) else []
+
 
 class UnsplashError(Exception):
-    """Base exception for all Unsplash errors."""
-    
+    """
+    Base exception for all Unsplash errors.
+
+    The response body is kept as received and only decoded when
+    ``http_body``, ``errors``, ``message`` or ``args`` is first read, so
+    raising (and catching) errors in bulk stays cheap. All of them can still
+    be assigned like plain attributes.
+    """
+
     def __init__(
         self,
-        message: str,
+        message: Optional[str] = None,
         http_status: Optional[int] = None,
-        http_body: Optional[str] = None
+        http_body: Union[str, bytes, None] = None
     ):
-        super().__init__(message)
-        self.message = message
+        super().__init__(*(() if message is None else (message,)))
+        self._message = message
+        self._body = http_body
+        self._errors: Optional[List[str]] = None
         self.http_status = http_status
-        self.http_body = http_body
+
+    @property
+    def http_body(self) -> Optional[str]:
+        if isinstance(self._body, bytes):
+            self._body = self._body.decode("utf-8", errors="replace")
+        return self._body
+
+    @http_body.setter
+    def http_body(self, value: Optional[str]) -> None:
+        self._body = value
+
+    @property
+    def errors(self) -> List[str]:
+        """Messages from the ``errors`` array of the JSON body."""
+        if self._errors is None:
+            self._errors = _parse_errors(self._body)
+        return self._errors
+
+    @errors.setter
+    def errors(self, value: List[str]) -> None:
+        self._errors = value
+
+    @property
+    def message(self) -> str:
+        if self._message is None:
+            self._message = ", ".join(self.errors) or self.http_body or ""
+        return self._message
+
+    @message.setter
+    def message(self, value: str) -> None:
+        self._message = value
+
+    @property
+    def args(self) -> Tuple[Any, ...]:
+        # ``(message,)`` once decoded, as if it had been passed to __init__
+        return _ARGS.__get__(self) or (self.message,)
+
+    @args.setter
+    def args(self, value: Tuple[Any, ...]) -> None:
+        _ARGS.__set__(self, value)
+
+    def __str__(self) -> str:
+        return self.message
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}({self.message!r}, "
+            f"http_status={self.http_status!r})"
+        )
 
 class AuthenticationError(UnsplashError):
     """Invalid access key (401)."""
     pass
 
 class RateLimitError(UnsplashError):
-    """Rate limit exceeded (429)."""
-    
+    """
+    Rate limit exceeded (429).
+
+    ``reset_at`` is the epoch time at which a request should succeed again,
+    from ``Retry-After``. It is None when the server does not send one, since
+    the hourly quota window's reset time is not reported.
+    """
+
     def __init__(
         self,
-        message: str,
+        message: Optional[str] = None,
         limit: Optional[int] = None,
         remaining: Optional[int] = None,
+        reset_at: Optional[float] = None,
         **kwargs: Any
     ):
         super().__init__(message, **kwargs)
         self.limit = limit
         self.remaining = remaining
+        self.reset_at = reset_at
+
+    @property
+    def retry_after(self) -> Optional[float]:
+        """Seconds left until ``reset_at`` (0 once passed), or None if unknown."""
+        if self.reset_at is None:
+            return None
+        return max(0.0, self.reset_at - time.time())
 
 class NotFoundError(UnsplashError):
     """Resource not found (404)."""
@@ -38,7 +128,17 @@ class NotFoundError(UnsplashError):
 
 class ValidationError(UnsplashError):
     """Invalid request parameters (422)."""
-    
-    def __init__(self, message: str, errors: List[str], **kwargs: Any):
+
+    def __init__(
+        self,
+        message: Optional[str] = None,
+        errors: Optional[List[str]] = None,
+        **kwargs: Any
+    ):
         super().__init__(message, **kwargs)
-        self.errors = errors
+        if errors is not None:
+            self.errors = list(errors)
+
+class DownloadError(UnsplashError):
+    """An image download failed or its size was wrong (see ``photos.download_file``)."""
+    pass
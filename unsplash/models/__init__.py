@@ -1,8 +1,55 @@
-from ._base import Page, Links
-from .photo import Photo, PhotoUrls, PhotoLinks, Exif, Location, LocationPosition
-from .user import User, UserLinks, UserProfileImage
-from .collection import Collection, CollectionLinks
-from .search import SearchResults, SearchUsersResults, SearchCollectionsResults
+from typing import TYPE_CHECKING, Dict
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from ._base import Page, Links
+    from .photo import Photo, PhotoUrls, PhotoLinks, Exif, Location, LocationPosition
+    from .user import User, UserLinks, UserProfileImage
+    from .collection import Collection, CollectionLinks
+    from .search import SearchResults, SearchUsersResults, SearchCollectionsResults
+    from ._compact import (
+        CompactPhoto,
+        CompactUrls,
+        CompactLinks,
+        CompactExif,
+        CompactLocation,
+        InternPool,
+        compact,
+    )
+    from .columnar import PhotoColumns, to_columns, iter_columns
+    from .imgix import ImgixURL
+
+# imported on first access (PEP 562), see ``unsplash/__init__.py``
+_EXPORTS: Dict[str, str] = {
+    "Page": "._base",
+    "Links": "._base",
+    "Photo": ".photo",
+    "PhotoUrls": ".photo",
+    "PhotoLinks": ".photo",
+    "Exif": ".photo",
+    "Location": ".photo",
+    "LocationPosition": ".photo",
+    "User": ".user",
+    "UserLinks": ".user",
+    "UserProfileImage": ".user",
+    "Collection": ".collection",
+    "CollectionLinks": ".collection",
+    "SearchResults": ".search",
+    "SearchUsersResults": ".search",
+    "SearchCollectionsResults": ".search",
+    "CompactPhoto": "._compact",
+    "CompactUrls": "._compact",
+    "CompactLinks": "._compact",
+    "CompactExif": "._compact",
+    "CompactLocation": "._compact",
+    "InternPool": "._compact",
+    "compact": "._compact",
+    "PhotoColumns": ".columnar",
+    "to_columns": ".columnar",
+    "iter_columns": ".columnar",
+    "ImgixURL": ".imgix",
+}
 
 __all__ = [
     "Page",
@@ -21,4 +68,17 @@ __all__ = [
     "SearchResults",
     "SearchUsersResults",
     "SearchCollectionsResults",
+    "CompactPhoto",
+    "CompactUrls",
+    "CompactLinks",
+    "CompactExif",
+    "CompactLocation",
+    "InternPool",
+    "compact",
+    "PhotoColumns",
+    "to_columns",
+    "iter_columns",
+    "ImgixURL",
 ]
+
+__getattr__, __dir__ = lazy_exports(globals(), _EXPORTS)
@@ -1,6 +1,7 @@
 from datetime import datetime
-from typing import Optional, Generic, TypeVar, List
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, Optional, Generic, TypeVar, List
 from pydantic import BaseModel, ConfigDict, Field, HttpUrl
+from ._construct import materialize, unpack
 
 T = TypeVar('T')
 
@@ -10,9 +11,58 @@ class UnsplashModel(BaseModel):
         populate_by_name=True,
         str_strip_whitespace=True,
         # unknown fields are ignored to prevent breakage on API updates
-        extra="ignore" 
+        extra="ignore",
+        # validators are built on first use rather than at import time
+        defer_build=True
     )
 
+    # Trusted responses (``validate_responses=False``) build these lazily:
+    # ``construct`` keeps the raw JSON and the first read of any field builds
+    # that level. The methods below read ``__dict__`` directly, so they
+    # unpack it first.
+    __deferred__: ClassVar[bool] = True
+
+    if not TYPE_CHECKING:
+
+        def __getattr__(self, name: str) -> Any:
+            if unpack(self):
+                return getattr(self, name)
+            return super().__getattr__(name)
+
+    def __eq__(self, other: Any) -> bool:
+        unpack(self)
+        if isinstance(other, BaseModel):
+            unpack(other)
+        return super().__eq__(other)
+
+    def __iter__(self) -> Any:
+        unpack(self)
+        return super().__iter__()
+
+    def __repr_args__(self) -> Any:
+        unpack(self)
+        return super().__repr_args__()
+
+    def __copy__(self) -> Any:
+        unpack(self)
+        return super().__copy__()
+
+    def __deepcopy__(self, memo: Optional[Dict[int, Any]] = None) -> Any:
+        unpack(self)
+        return super().__deepcopy__(memo)
+
+    def __getstate__(self) -> Dict[Any, Any]:
+        unpack(self)
+        return super().__getstate__()
+
+    def model_dump(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        materialize(self)
+        return super().model_dump(*args, **kwargs)
+
+    def model_dump_json(self, *args: Any, **kwargs: Any) -> str:
+        materialize(self)
+        return super().model_dump_json(*args, **kwargs)
+
 class Page(BaseModel, Generic[T]):
     """
     Paginated response wrapper.
@@ -22,10 +72,12 @@ class Page(BaseModel, Generic[T]):
     total: int
     total_pages: int
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
-class Links(BaseModel):
+class Links(UnsplashModel):
     """Common links structure found in many objects."""
+    model_config = ConfigDict(defer_build=True)
+
     self: HttpUrl
     html: HttpUrl
     download: Optional[HttpUrl] = None
@@ -0,0 +1,265 @@
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from .photo import Photo
+from .user import User
+
+
+class CompactUrls(NamedTuple):
+    raw: str
+    full: str
+    regular: str
+    small: str
+    thumb: str
+    small_s3: Optional[str] = None
+
+
+class CompactLinks(NamedTuple):
+    self: str
+    html: str
+    download: str
+    download_location: str
+
+
+class CompactExif(NamedTuple):
+    make: Optional[str] = None
+    model: Optional[str] = None
+    name: Optional[str] = None
+    exposure_time: Optional[str] = None
+    aperture: Optional[str] = None
+    focal_length: Optional[str] = None
+    iso: Optional[int] = None
+
+
+class CompactLocation(NamedTuple):
+    name: Optional[str] = None
+    city: Optional[str] = None
+    country: Optional[str] = None
+    # ``(latitude, longitude)``, or None when the API sent no position
+    position: Optional[Tuple[Optional[float], Optional[float]]] = None
+
+
+_EMPTY: Tuple[Dict[str, Any], ...] = ()
+
+
+def _str(value: Any) -> Optional[str]:
+    return None if value is None else str(value)
+
+
+class InternPool:
+    """
+    Shares ``User`` objects and topic dicts between compact photos.
+
+    The first object seen for an id is kept; later photos by the same author
+    point at it. Use one pool per catalog so unrelated catalogs can be freed
+    independently.
+    """
+
+    def __init__(self) -> None:
+        self._users: Dict[str, User] = {}
+        self._topics: Dict[Any, Dict[str, Any]] = {}
+
+    def user(self, user: User) -> User:
+        return self._users.setdefault(user.id, user)
+
+    def topic(self, topic: Dict[str, Any]) -> Dict[str, Any]:
+        key = topic.get("id")
+        if key is None:
+            return topic
+        return self._topics.setdefault(key, topic)
+
+    @property
+    def users(self) -> int:
+        return len(self._users)
+
+
+class CompactPhoto:
+    """
+    Slotted, memory-compact form of ``Photo`` for large in-memory catalogs.
+
+    URLs are stored as plain strings in named tuples, the author ``User`` and
+    topics are interned through an ``InternPool``, and empty lists are not
+    stored at all. ``to_photo`` rebuilds an equivalent ``Photo``.
+    """
+
+    __slots__ = (
+        "id",
+        "created_at",
+        "updated_at",
+        "width",
+        "height",
+        "color",
+        "blur_hash",
+        "description",
+        "alt_description",
+        "urls",
+        "links",
+        "likes",
+        "liked_by_user",
+        "user",
+        "_current_user_collections",
+        "sponsorship",
+        "exif",
+        "location",
+        "views",
+        "downloads",
+        "_topics",
+    )
+
+    id: str
+    created_at: datetime
+    updated_at: datetime
+    width: int
+    height: int
+    color: Optional[str]
+    blur_hash: Optional[str]
+    description: Optional[str]
+    alt_description: Optional[str]
+    urls: CompactUrls
+    links: CompactLinks
+    likes: int
+    liked_by_user: bool
+    user: User
+    _current_user_collections: Tuple[Dict[str, Any], ...]
+    sponsorship: Optional[Dict[str, Any]]
+    exif: Optional[CompactExif]
+    location: Optional[CompactLocation]
+    views: Optional[int]
+    downloads: Optional[int]
+    _topics: Tuple[Dict[str, Any], ...]
+
+    @property
+    def current_user_collections(self) -> List[Dict[str, Any]]:
+        return list(self._current_user_collections)
+
+    @property
+    def topics(self) -> List[Dict[str, Any]]:
+        return list(self._topics)
+
+    @classmethod
+    def from_photo(
+        cls, photo: Photo, pool: Optional[InternPool] = None
+    ) -> "CompactPhoto":
+        """Compact ``photo``, interning its user and topics through ``pool``."""
+        self = cls.__new__(cls)
+        self.id = photo.id
+        self.created_at = photo.created_at
+        self.updated_at = photo.updated_at
+        self.width = photo.width
+        self.height = photo.height
+        self.color = photo.color
+        self.blur_hash = photo.blur_hash
+        self.description = photo.description
+        self.alt_description = photo.alt_description
+        urls = photo.urls
+        self.urls = CompactUrls(
+            str(urls.raw),
+            str(urls.full),
+            str(urls.regular),
+            str(urls.small),
+            str(urls.thumb),
+            _str(urls.small_s3),
+        )
+        links = photo.links
+        self.links = CompactLinks(
+            str(links.self),
+            str(links.html),
+            str(links.download),
+            str(links.download_location),
+        )
+        self.likes = photo.likes
+        self.liked_by_user = photo.liked_by_user
+        self.user = pool.user(photo.user) if pool is not None else photo.user
+        self._current_user_collections = tuple(photo.current_user_collections) or _EMPTY
+        self.sponsorship = photo.sponsorship
+        exif = photo.exif
+        self.exif = (
+            None
+            if exif is None
+            else CompactExif(
+                exif.make,
+                exif.model,
+                exif.name,
+                exif.exposure_time,
+                exif.aperture,
+                exif.focal_length,
+                exif.iso,
+            )
+        )
+        location = photo.location
+        if location is None:
+            self.location = None
+        else:
+            position = location.position
+            self.location = CompactLocation(
+                location.name,
+                location.city,
+                location.country,
+                None if position is None else (position.latitude, position.longitude),
+            )
+        self.views = photo.views
+        self.downloads = photo.downloads
+        topics = photo.topics
+        if pool is not None:
+            topics = [pool.topic(topic) for topic in topics]
+        self._topics = tuple(topics) or _EMPTY
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The photo as API-shaped data (the user stays a ``User`` instance)."""
+        location: Optional[Dict[str, Any]] = None
+        if self.location is not None:
+            position = self.location.position
+            location = {
+                **self.location._asdict(),
+                "position": None
+                if position is None
+                else {"latitude": position[0], "longitude": position[1]},
+            }
+        return {
+            "id": self.id,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "width": self.width,
+            "height": self.height,
+            "color": self.color,
+            "blur_hash": self.blur_hash,
+            "description": self.description,
+            "alt_description": self.alt_description,
+            "urls": self.urls._asdict(),
+            "links": self.links._asdict(),
+            "likes": self.likes,
+            "liked_by_user": self.liked_by_user,
+            "user": self.user,
+            "current_user_collections": list(self._current_user_collections),
+            "sponsorship": self.sponsorship,
+            "exif": None if self.exif is None else self.exif._asdict(),
+            "location": location,
+            "views": self.views,
+            "downloads": self.downloads,
+            "topics": list(self._topics),
+        }
+
+    def to_photo(self) -> Photo:
+        """Rebuild the validated ``Photo``; the interned ``User`` is reused as is."""
+        return Photo.model_validate(self.to_dict())
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CompactPhoto):
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"CompactPhoto(id={self.id!r}, user={self.user.username!r})"
+
+
+def compact(
+    photos: Iterable[Photo], pool: Optional[InternPool] = None
+) -> List[CompactPhoto]:
+    """Compact ``photos`` with a shared ``InternPool`` (a new one by default)."""
+    pool = pool if pool is not None else InternPool()
+    return [CompactPhoto.from_photo(photo, pool) for photo in photos]
@@ -0,0 +1,302 @@
+import sys
+from datetime import datetime
+from functools import lru_cache
+from inspect import isclass
+from operator import itemgetter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel, HttpUrl
+from pydantic.fields import FieldInfo
+from pydantic_core import Url
+
+from .._time import parse_datetime
+
+M = TypeVar("M", bound=BaseModel)
+
+if sys.version_info >= (3, 10):
+    from types import UnionType
+
+    _UNION_TYPES: Tuple[Any, ...] = (Union, UnionType)
+else:
+    _UNION_TYPES = (Union,)
+
+_Convert = Callable[[Any], Any]
+_FieldPlan = Tuple[
+    str, str, Optional[Type[BaseModel]], bool, Optional[FieldInfo], Optional[_Convert]
+]
+
+_new = object.__new__
+_setattr = object.__setattr__
+# the slot descriptors themselves, which skip ``__setattr__``'s lookups
+_set_fields_set = BaseModel.__dict__["__pydantic_fields_set__"].__set__
+_set_extra = BaseModel.__dict__["__pydantic_extra__"].__set__
+_set_private = BaseModel.__dict__["__pydantic_private__"].__set__
+
+
+if isclass(HttpUrl):
+
+    class _TrustedUrl(HttpUrl):
+        """
+        ``HttpUrl`` whose string is only parsed when the URL is first used.
+
+        Parsing costs about a microsecond per URL, more than the rest of
+        ``construct``, and a photo carries about twenty URLs of which callers
+        read a few. It equals, hashes and serializes like the validated ``HttpUrl``.
+        """
+
+        __slots__ = ("_raw", "_parsed")
+
+        def __init__(self, url: Any) -> None:
+            self._raw = str(url)
+
+        @property
+        def _url(self) -> Url:
+            try:
+                return self._parsed
+            except AttributeError:
+                self._parsed: Url = Url(self._raw)
+                return self._parsed
+
+        @_url.setter
+        def _url(self, value: Url) -> None:
+            self._parsed = value
+            self._raw = str(value)
+
+        def __eq__(self, other: Any) -> bool:
+            if not isinstance(other, HttpUrl):
+                return NotImplemented
+            return self._url == other._url
+
+        def __hash__(self) -> int:
+            return hash(self._url)
+
+    def _url(value: str) -> Any:
+        # skips the type call and __init__, as pydantic's own validator does
+        url = _TrustedUrl.__new__(_TrustedUrl)
+        url._raw = value
+        return url
+else:
+    # before pydantic 2.10, HttpUrl is an annotated pydantic_core.Url
+    _url = Url
+
+
+def _leaf(annotation: Any) -> Optional[_Convert]:
+    """Converter from the decoded JSON value for ``datetime`` and ``HttpUrl`` fields."""
+    if get_origin(annotation) in _UNION_TYPES:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        return _leaf(args[0]) if len(args) == 1 else None
+    if annotation is datetime:
+        return parse_datetime
+    if annotation == HttpUrl:
+        return _url
+    return None
+
+
+def _nested_model(annotation: Any) -> Tuple[Optional[Type[BaseModel]], bool]:
+    """Return ``(model, is_list)`` if ``annotation`` holds nested models."""
+    origin = get_origin(annotation)
+    if origin in _UNION_TYPES:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        return _nested_model(args[0]) if len(args) == 1 else (None, False)
+    if origin in (list, List):
+        item_types = get_args(annotation)
+        model, _ = _nested_model(item_types[0]) if item_types else (None, False)
+        return model, model is not None
+    if isclass(annotation) and issubclass(annotation, BaseModel):
+        return annotation, False
+    return None, False
+
+
+@lru_cache(maxsize=None)
+def _plan(model: Type[BaseModel]) -> Tuple[_FieldPlan, ...]:
+    plan = []
+    for name, field in model.model_fields.items():
+        nested, many = _nested_model(field.annotation)
+        default = None if field.is_required() else field
+        plan.append(
+            (name, field.alias or name, nested, many, default, _leaf(field.annotation))
+        )
+    return tuple(plan)
+
+
+# Key in ``__dict__`` of a constructed instance: the raw JSON object of a
+# deferred one until its first read, then None (so ``materialize`` knows to
+# look below it for deferred models).
+_RAW = "__unsplash_raw__"
+
+
+def deferrable(model: Type[BaseModel]) -> bool:
+    """Whether ``construct`` may defer building ``model`` (see ``UnsplashModel``)."""
+    return getattr(model, "__deferred__", False)
+
+
+class _Shape(NamedTuple):
+    # every field set on the instance, in field order, mapped to its default
+    # (or None when the value is copied from the payload)
+    template: Dict[str, Any]
+    present: Tuple[str, ...]
+    # the payload values of ``present``, as a tuple
+    get: Callable[[Any], Tuple[Any, ...]]
+    converted: Tuple[Tuple[str, _Convert], ...]
+    # absent fields whose default must not be shared between instances
+    fresh: Tuple[Tuple[str, FieldInfo], ...]
+
+
+@lru_cache(maxsize=256)
+def _shape(model: Type[BaseModel], keys: Tuple[str, ...]) -> _Shape:
+    """
+    How to build ``model`` from a payload with ``keys``.
+
+    Objects from one endpoint all have the same keys, so this is computed
+    once and each instance is then built with a few C-level dict operations.
+    """
+    payload = set(keys)
+    template: Dict[str, Any] = {}
+    present = []
+    converted = []
+    fresh = []
+    for name, key, nested, many, default, convert in _plan(model):
+        if key in payload:
+            template[name] = None
+            present.append((name, key))
+            if nested is not None:
+                build = _defer if deferrable(nested) else _build
+                converted.append((name, _each(build, nested, many)))
+            elif convert is not None:
+                converted.append((name, convert))
+        elif default is not None:
+            value = default.get_default(call_default_factory=True)
+            template[name] = value
+            # pydantic only copies mutable defaults
+            if default.default_factory is not None or value is not default.default:
+                fresh.append((name, default))
+    return _Shape(
+        template,
+        tuple(name for name, _ in present),
+        _getter(tuple(key for _, key in present)),
+        tuple(converted),
+        tuple(fresh),
+    )
+
+
+def _getter(keys: Tuple[str, ...]) -> Callable[[Any], Tuple[Any, ...]]:
+    """``itemgetter(*keys)`` that returns a tuple for any number of keys."""
+    if len(keys) > 1:
+        return itemgetter(*keys)
+    return lambda data: tuple(data[key] for key in keys)
+
+
+def _each(
+    build: Callable[[Type[BaseModel], Any], Any], model: Type[BaseModel], many: bool
+) -> _Convert:
+    if many:
+        return lambda value: [build(model, item) for item in value]
+    return lambda value: build(model, value)
+
+
+def construct(model: Type[M], data: Any) -> M:
+    """
+    Build ``model`` from trusted API data without validating it.
+
+    Models that support it are deferred: the instance only keeps ``data``
+    until a field is first read, and then builds that one level, with nested
+    objects deferred in turn. ``datetime`` and ``HttpUrl`` fields are then
+    converted, so values have their annotated types, but nothing is checked:
+    constraints, coercion of other fields and extra keys are skipped. Use
+    this only for payloads that come straight from the Unsplash API.
+    """
+    return _defer(model, data) if deferrable(model) else _build(model, data)
+
+
+def _defer(model: Type[M], data: Any) -> M:
+    obj: M = _new(model)
+    # the other pydantic slots stay unset: reading one unpacks ``data``
+    _setattr(obj, "__dict__", {_RAW: data})
+    return obj
+
+
+def _build(model: Type[M], data: Any) -> M:
+    values, fields_set = _values(model, data)
+    # nested models may still be deferred
+    values[_RAW] = None
+    return instantiate(model, values, fields_set)
+
+
+def _values(model: Type[BaseModel], data: Any) -> Tuple[Dict[str, Any], Set[str]]:
+    shape = _shape(model, tuple(data))
+    values = dict(shape.template)
+    values.update(zip(shape.present, shape.get(data)))
+    for name, convert in shape.converted:
+        value = values[name]
+        if value is not None:
+            values[name] = convert(value)
+    for name, default in shape.fresh:
+        values[name] = default.get_default(call_default_factory=True)
+    return values, set(shape.present)
+
+
+def unpack(obj: BaseModel) -> bool:
+    """Build the fields of a deferred instance; False if there was nothing to do."""
+    state = obj.__dict__
+    data = state.get(_RAW)
+    if data is None:
+        return False
+    values, fields_set = _values(type(obj), data)
+    if len(state) > 1:
+        # a field assigned before the first read keeps its new value
+        values.update(state)
+    values[_RAW] = None
+    _setattr(obj, "__dict__", values)
+    _set_fields_set(obj, fields_set)
+    _set_extra(obj, None)
+    _set_private(obj, None)
+    return True
+
+
+@lru_cache(maxsize=None)
+def _nested_fields(model: Type[BaseModel]) -> Tuple[str, ...]:
+    """Names of the fields of ``model`` that hold nested models."""
+    return tuple(name for name, _, nested, _, _, _ in _plan(model) if nested)
+
+
+def materialize(obj: BaseModel) -> None:
+    """Unpack a deferred instance and every deferred model below it."""
+    state = obj.__dict__
+    if _RAW not in state:
+        # validated, so nothing below it is deferred either
+        return
+    unpack(obj)
+    state = obj.__dict__
+    for name in _nested_fields(type(obj)):
+        value = state.get(name)
+        if isinstance(value, list):
+            for item in value:
+                if isinstance(item, BaseModel):
+                    materialize(item)
+        elif isinstance(value, BaseModel):
+            materialize(value)
+
+
+def instantiate(model: Type[M], values: Dict[str, Any], fields_set: Set[str]) -> M:
+    """Create ``model`` with ``values`` as its state, bypassing validation."""
+    # Same end state as ``model.model_construct`` without its per-call overhead.
+    obj = model.__new__(model)
+    _setattr(obj, "__dict__", values)
+    _setattr(obj, "__pydantic_fields_set__", fields_set)
+    _setattr(obj, "__pydantic_extra__", None)
+    _setattr(obj, "__pydantic_private__", None)
+    return obj
@@ -0,0 +1,87 @@
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, TypeVar
+
+from pydantic import BaseModel, Field, create_model
+
+from ._construct import _nested_model, _plan, instantiate
+
+M = TypeVar("M", bound=BaseModel)
+
+_Tree = Dict[str, "_Tree"]
+
+
+def _tree(fields: Sequence[str]) -> _Tree:
+    tree: _Tree = {}
+    for path in fields:
+        node = tree
+        for part in path.split("."):
+            node = node.setdefault(part, {})
+    return tree
+
+
+def _build(model: Type[BaseModel], tree: _Tree) -> Type[BaseModel]:
+    definitions: Dict[str, Any] = {}
+    for name, subtree in tree.items():
+        field = model.model_fields.get(name)
+        if field is None:
+            raise ValueError(f"{model.__name__} has no field {name!r}")
+        annotation: Any = field.annotation
+        if subtree:
+            nested, many = _nested_model(annotation)
+            if nested is None:
+                raise ValueError(f"{model.__name__}.{name} has no sub-fields")
+            annotation = _build(nested, subtree)
+            if many:
+                annotation = List[annotation]
+            if not field.is_required() or type(None) in getattr(
+                field.annotation, "__args__", ()
+            ):
+                annotation = Optional[annotation]
+
+        if field.is_required():
+            definitions[name] = (annotation, ...)
+        elif field.default_factory is not None:
+            definitions[name] = (
+                annotation,
+                Field(default_factory=field.default_factory),
+            )
+        else:
+            definitions[name] = (annotation, field.default)
+
+    return create_model(
+        f"{model.__name__}Projection", __config__=model.model_config, **definitions
+    )
+
+
+@lru_cache(maxsize=256)
+def projection(model: Type[BaseModel], fields: Tuple[str, ...]) -> Type[BaseModel]:
+    """
+    Model that only declares (and so only parses) the dotted ``fields`` of ``model``.
+
+    ``projection(Photo, ("id", "urls.small"))`` validates ``id`` and
+    ``urls.small`` and ignores everything else in the payload.
+    """
+    return _build(model, _tree(fields))
+
+
+def adopt(model: Type[M], projected: BaseModel) -> M:
+    """
+    Re-type a projected instance as ``model`` without copying or re-validating.
+
+    Only the projected fields are set; reading any other field raises
+    ``AttributeError``, and ``model_dump`` only includes the projected fields.
+    """
+    values = {}
+    state = projected.__dict__
+    for name, _, nested, many, _, _ in _plan(model):
+        if name not in state:
+            continue
+        value = state[name]
+        if nested is not None and value is not None:
+            value = (
+                [adopt(nested, item) for item in value]
+                if many
+                else adopt(nested, value)
+            )
+        values[name] = value
+    return instantiate(model, values, set(values))
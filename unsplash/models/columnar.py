@@ -0,0 +1,148 @@
+import math
+from array import array
+from datetime import datetime
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Union
+
+from .._time import timestamp
+from ._compact import CompactPhoto
+from .photo import Photo
+
+if TYPE_CHECKING:
+    import numpy
+
+PhotoLike = Union[Photo, CompactPhoto]
+
+#: Numeric columns and their ``array`` typecodes (``q`` is int64, ``d`` is float64).
+NUMERIC_COLUMNS = {
+    "width": "q",
+    "height": "q",
+    "likes": "q",
+    "downloads": "q",
+    "views": "q",
+    "created_at": "q",
+    "color": "q",
+    "latitude": "d",
+    "longitude": "d",
+}
+
+_NAN = float("nan")
+
+
+def _epoch(value: Union[datetime, str]) -> int:
+    seconds = timestamp(value)
+    assert seconds is not None
+    return math.floor(seconds)
+
+
+def _color(value: Optional[str]) -> int:
+    """``"#6E633A"`` as ``0x6E633A``, -1 when missing or malformed."""
+    if not value or value[0] != "#":
+        return -1
+    try:
+        return int(value[1:], 16)
+    except ValueError:
+        return -1
+
+
+class PhotoColumns:
+    """
+    Photos as columns: ``ids`` is a list of str, every other column is an
+    ``array.array`` of int64 or float64 and so a contiguous typed buffer.
+
+    ``created_at`` is in epoch seconds and ``color`` is the packed RGB value.
+    Missing ``downloads``, ``views`` and ``color`` are -1; missing
+    ``latitude``/``longitude`` are NaN.
+    """
+
+    __slots__ = ("ids", *NUMERIC_COLUMNS)
+
+    width: "array[int]"
+    height: "array[int]"
+    likes: "array[int]"
+    downloads: "array[int]"
+    views: "array[int]"
+    created_at: "array[int]"
+    color: "array[int]"
+    latitude: "array[float]"
+    longitude: "array[float]"
+
+    def __init__(self) -> None:
+        self.ids: List[str] = []
+        for name, typecode in NUMERIC_COLUMNS.items():
+            setattr(self, name, array(typecode))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def append(self, photo: PhotoLike) -> None:
+        self.ids.append(photo.id)
+        self.width.append(photo.width)
+        self.height.append(photo.height)
+        self.likes.append(photo.likes)
+        self.downloads.append(-1 if photo.downloads is None else photo.downloads)
+        self.views.append(-1 if photo.views is None else photo.views)
+        self.created_at.append(_epoch(photo.created_at))
+        self.color.append(_color(photo.color))
+        latitude = longitude = None
+        location = photo.location
+        if location is not None and location.position is not None:
+            position = location.position
+            if isinstance(position, tuple):
+                latitude, longitude = position
+            else:
+                latitude, longitude = position.latitude, position.longitude
+        self.latitude.append(_NAN if latitude is None else latitude)
+        self.longitude.append(_NAN if longitude is None else longitude)
+
+    def extend(self, photos: Iterable[PhotoLike]) -> None:
+        for photo in photos:
+            self.append(photo)
+
+    def columns(self) -> Dict[str, Any]:
+        """Every column by name, ``ids`` first."""
+        return {
+            "ids": self.ids,
+            **{name: getattr(self, name) for name in NUMERIC_COLUMNS},
+        }
+
+    def to_numpy(self) -> Dict[str, "numpy.ndarray[Any, Any]"]:
+        """
+        Columns as NumPy arrays. Numeric columns share memory with the buffers.
+
+        Requires the ``numpy`` extra (``pip install unsplash-pydantic[numpy]``).
+        """
+        try:
+            import numpy as np
+        except ImportError as exc:
+            raise ImportError(
+                "PhotoColumns.to_numpy requires numpy: "
+                "pip install unsplash-pydantic[numpy]"
+            ) from exc
+        result = {"ids": np.array(self.ids, dtype=object)}
+        for name, typecode in NUMERIC_COLUMNS.items():
+            dtype = np.int64 if typecode == "q" else np.float64
+            result[name] = np.frombuffer(getattr(self, name), dtype=dtype)
+        return result
+
+
+def to_columns(photos: Iterable[PhotoLike]) -> PhotoColumns:
+    """Convert a page (or any iterable) of photos into ``PhotoColumns``."""
+    columns = PhotoColumns()
+    columns.extend(photos)
+    return columns
+
+
+def iter_columns(
+    photos: Iterable[PhotoLike], batch_size: int = 10_000
+) -> Iterator[PhotoColumns]:
+    """
+    Convert a stream of photos (e.g. ``client.photos.iter_list()``) into
+    ``PhotoColumns`` batches of at most ``batch_size`` rows.
+    """
+    iterator = iter(photos)
+    while True:
+        batch = to_columns(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
@@ -0,0 +1,113 @@
+from typing import Any, Dict, Literal, Optional, Sequence, Tuple
+from urllib.parse import parse_qsl, quote
+
+Fit = Literal[
+    "clamp", "clip", "crop", "facearea", "fill", "fillmax", "max", "min", "scale"
+]
+Format = Literal["avif", "webp", "jpg", "pjpg", "png", "gif"]
+
+#: Widths used by ``srcset`` when none are given.
+DEFAULT_WIDTHS: Tuple[int, ...] = (320, 640, 960, 1280, 1920, 2560)
+
+
+def _value(value: Any) -> str:
+    if type(value) is int:
+        return str(value)
+    if isinstance(value, float):
+        return format(value, "g")
+    return quote(str(value), safe=",")
+
+
+class ImgixURL:
+    """
+    Builds resized and re-encoded variants of an Unsplash ``raw`` image URL.
+
+    The raw URL is split once; each ``url()`` call only appends the encoded
+    parameters, so building thousands of URLs per page is cheap.
+
+    Args:
+        raw: The ``photo.urls.raw`` URL (it keeps its ``ixid`` tracking parameter).
+    """
+
+    __slots__ = ("_path", "_base_params", "_prefix")
+
+    def __init__(self, raw: str):
+        path, _, query = str(raw).partition("?")
+        self._path = path
+        self._base_params: Dict[str, str] = dict(
+            parse_qsl(query, keep_blank_values=True)
+        )
+        self._prefix = f"{path}?{query}&" if query else f"{path}?"
+
+    def url(
+        self,
+        w: Optional[int] = None,
+        h: Optional[int] = None,
+        fit: Optional[Fit] = None,
+        crop: Optional[str] = None,
+        fm: Optional[Format] = None,
+        q: Optional[int] = None,
+        dpr: Optional[float] = None,
+        auto: Optional[str] = None,
+        **params: Any,
+    ) -> str:
+        """
+        URL with the given imgix parameters.
+
+        ``w``/``h`` are in CSS pixels, ``fit`` and ``crop`` control resizing,
+        ``fm`` converts the format, ``q`` sets quality (0-100) and ``dpr`` the
+        device pixel ratio. Any other imgix parameter can be passed by keyword.
+        """
+        named = (
+            ("w", w),
+            ("h", h),
+            ("fit", fit),
+            ("crop", crop),
+            ("fm", fm),
+            ("q", q),
+            ("dpr", dpr),
+            ("auto", auto),
+        )
+        for key, value in named:
+            if value is not None:
+                params[key] = value
+        if not params:
+            return self._prefix[:-1]
+        if not self._base_params.keys() & params.keys():
+            return self._prefix + "&".join(
+                f"{k}={_value(v)}" for k, v in params.items()
+            )
+        # overriding a parameter already on the raw URL: rebuild the whole query
+        merged = {**self._base_params, **params}
+        return f"{self._path}?" + "&".join(
+            f"{k}={_value(v)}" for k, v in merged.items()
+        )
+
+    def srcset(
+        self,
+        widths: Optional[Sequence[int]] = None,
+        dprs: Optional[Sequence[float]] = None,
+        **params: Any,
+    ) -> str:
+        """
+        ``srcset`` attribute value.
+
+        Pass ``widths`` for width descriptors (``... 640w``; the default is
+        ``DEFAULT_WIDTHS``), or ``dprs`` with a fixed ``w``/``h`` for density
+        descriptors (``... 2x``). Other keywords are applied to every URL.
+        """
+        if widths is not None and dprs is not None:
+            raise ValueError("Pass either widths or dprs, not both")
+        if dprs is not None:
+            return ", ".join(f"{self.url(dpr=dpr, **params)} {dpr:g}x" for dpr in dprs)
+        params.pop("w", None)
+        return ", ".join(
+            f"{self.url(w=width, **params)} {width}w"
+            for width in (widths or DEFAULT_WIDTHS)
+        )
+
+    def __str__(self) -> str:
+        return self._prefix[:-1]
+
+    def __repr__(self) -> str:
+        return f"ImgixURL({str(self)!r})"
@@ -1,7 +1,9 @@
 from datetime import datetime
+from functools import cached_property
 from typing import Optional, List, Dict, Any
 from pydantic import HttpUrl, Field
 from ._base import UnsplashModel, Links
+from .imgix import ImgixURL
 from .user import User
 
 class PhotoUrls(UnsplashModel):
@@ -12,6 +14,11 @@ class PhotoUrls(UnsplashModel):
     thumb: HttpUrl
     small_s3: Optional[HttpUrl] = None
 
+    @cached_property
+    def imgix(self) -> ImgixURL:
+        """URL builder for sized and re-encoded variants of ``raw``."""
+        return ImgixURL(str(self.raw))
+
 class PhotoLinks(Links):
     download: HttpUrl
     download_location: HttpUrl
@@ -57,3 +64,18 @@ class Photo(UnsplashModel):
     views: Optional[int] = None
     downloads: Optional[int] = None
     topics: List[Dict[str, Any]] = Field(default_factory=list)
+
+    def url(self, **params: Any) -> str:
+        """Image URL with imgix parameters, e.g. ``photo.url(w=800, fm="webp")``."""
+        return self.urls.imgix.url(**params)
+
+    def srcset(self, **params: Any) -> str:
+        """``srcset`` for this image (see ``ImgixURL.srcset``)."""
+        return self.urls.imgix.srcset(**params)
+
+    def blur_placeholder(self, width: int = 32, height: int = 32) -> Optional[bytes]:
+        """``blur_hash`` decoded to packed RGB bytes, or None if the photo has none."""
+        if not self.blur_hash:
+            return None
+        from ..blurhash import decode
+        return decode(self.blur_hash, width, height)
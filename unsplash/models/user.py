@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Optional
 from pydantic import HttpUrl
 from ._base import UnsplashModel, Links
@@ -16,6 +17,7 @@ class UserLinks(Links):
 
 class User(UnsplashModel):
     id: str
+    updated_at: Optional[datetime] = None
     username: str
     name: str
     first_name: Optional[str] = None
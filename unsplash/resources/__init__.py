@@ -1,7 +1,24 @@
-from .photos import PhotosResource, AsyncPhotosResource
-from .users import UsersResource, AsyncUsersResource
-from .collections import CollectionsResource, AsyncCollectionsResource
-from .search import SearchResource, AsyncSearchResource
+from typing import TYPE_CHECKING, Dict
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .photos import PhotosResource, AsyncPhotosResource
+    from .users import UsersResource, AsyncUsersResource
+    from .collections import CollectionsResource, AsyncCollectionsResource
+    from .search import SearchResource, AsyncSearchResource
+
+# imported on first access (PEP 562), see ``unsplash/__init__.py``
+_EXPORTS: Dict[str, str] = {
+    "PhotosResource": ".photos",
+    "AsyncPhotosResource": ".photos",
+    "UsersResource": ".users",
+    "AsyncUsersResource": ".users",
+    "CollectionsResource": ".collections",
+    "AsyncCollectionsResource": ".collections",
+    "SearchResource": ".search",
+    "AsyncSearchResource": ".search",
+}
 
 __all__ = [
     "PhotosResource",
@@ -13,3 +30,5 @@ __all__ = [
     "SearchResource",
     "AsyncSearchResource",
 ]
+
+__getattr__, __dir__ = lazy_exports(globals(), _EXPORTS)
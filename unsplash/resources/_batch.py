@@ -0,0 +1,119 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from ..errors import AuthenticationError, RateLimitError, UnsplashError
+from ._pagination import gather_pages
+
+T = TypeVar("T")
+
+DEFAULT_CONCURRENCY = 8
+
+# every remaining ID would fail the same way, so these abort the batch
+_FATAL = (AuthenticationError, RateLimitError)
+
+
+class BatchResult(Generic[T]):
+    """
+    Outcome of a bulk fetch such as ``photos.get_many``.
+
+    Attributes:
+        keys: The requested IDs, in input order.
+        results: One entry per key: the model, or None if that key failed.
+        found: Fetched models by ID, in input order.
+        errors: The ``UnsplashError`` raised for each failed ID.
+    """
+
+    __slots__ = ("keys", "results", "found", "errors")
+
+    def __init__(
+        self, keys: List[str], found: Dict[str, T], errors: Dict[str, UnsplashError]
+    ):
+        self.keys = keys
+        self.found = {key: found[key] for key in dict.fromkeys(keys) if key in found}
+        self.errors = errors
+        self.results: List[Optional[T]] = [found.get(key) for key in keys]
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    def __iter__(self) -> Iterator[T]:
+        """Iterate over the fetched models, in input order."""
+        return iter(self.found.values())
+
+    def __len__(self) -> int:
+        return len(self.found)
+
+    def __repr__(self) -> str:
+        return f"BatchResult(found={len(self.found)}, errors={len(self.errors)})"
+
+
+def fetch_many(
+    fetch: Callable[[str], T],
+    keys: Iterable[str],
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> BatchResult[T]:
+    """
+    Call ``fetch`` for every distinct key on a pool of ``concurrency`` threads.
+
+    ``UnsplashError``s are collected per key. Authentication and rate-limit
+    errors abort the batch, and requests not yet started are cancelled.
+    """
+    keys = list(keys)
+    found: Dict[str, T] = {}
+    errors: Dict[str, UnsplashError] = {}
+    executor = ThreadPoolExecutor(max_workers=max(1, concurrency))
+    try:
+        futures = {key: executor.submit(fetch, key) for key in dict.fromkeys(keys)}
+        for key, future in futures.items():
+            try:
+                found[key] = future.result()
+            except _FATAL:
+                raise
+            except UnsplashError as exc:
+                errors[key] = exc
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+    return BatchResult(keys, found, errors)
+
+
+async def afetch_many(
+    fetch: Callable[[str], Awaitable[T]],
+    keys: Iterable[str],
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> BatchResult[T]:
+    """Async ``fetch_many``: at most ``concurrency`` fetches are awaited at once."""
+    keys = list(keys)
+    unique = list(dict.fromkeys(keys))
+    found: Dict[str, T] = {}
+    errors: Dict[str, UnsplashError] = {}
+
+    async def fetch_one(index: int) -> Tuple[Optional[T], Optional[UnsplashError]]:
+        try:
+            return await fetch(unique[index]), None
+        except _FATAL:
+            raise
+        except UnsplashError as exc:
+            return None, exc
+
+    results = gather_pages(fetch_one, 0, len(unique) - 1, concurrency, ordered=False)
+    try:
+        async for index, (item, error) in results:
+            if error is not None:
+                errors[unique[index]] = error
+            else:
+                found[unique[index]] = item  # type: ignore[assignment]
+    finally:
+        await results.aclose()
+    return BatchResult(keys, found, errors)
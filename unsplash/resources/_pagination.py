@@ -0,0 +1,198 @@
+import asyncio
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+import httpx
+
+T = TypeVar("T")
+
+MAX_PER_PAGE = 30
+"""Largest ``per_page`` accepted by the Unsplash API."""
+
+PageResult = Tuple[List[T], Optional[int]]
+"""A page of items and the total page count, if the endpoint reports one."""
+
+
+def total_pages(response: httpx.Response, per_page: int) -> Optional[int]:
+    """Derive the page count of a list endpoint from its ``X-Total`` header."""
+    total = response.headers.get("X-Total")
+    if total is None or not total.isdigit():
+        return None
+    return -(-int(total) // per_page)
+
+
+def _is_last(
+    page: int,
+    result: PageResult[Any],
+    per_page: int,
+    max_pages: Optional[int],
+    start: int,
+) -> bool:
+    items, pages = result
+    if len(items) < per_page:
+        return True
+    if pages is not None and page >= pages:
+        return True
+    return max_pages is not None and page - start + 1 >= max_pages
+
+
+def paginate(
+    fetch: Callable[[int], PageResult[T]],
+    per_page: int = MAX_PER_PAGE,
+    start_page: int = 1,
+    max_pages: Optional[int] = None,
+    prefetch: bool = False,
+) -> Iterator[T]:
+    """
+    Yield items page by page until the last page is reached.
+
+    Iteration stops on an empty or short page, once ``total_pages`` is reached,
+    or after ``max_pages`` pages. With ``prefetch`` the next page is requested
+    on a worker thread while the caller consumes the current one.
+    """
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    pending: Optional["Future[PageResult[T]]"] = None
+    page = start_page
+    try:
+        result = fetch(page)
+        while True:
+            last = _is_last(page, result, per_page, max_pages, start_page)
+            if executor is not None and not last:
+                pending = executor.submit(fetch, page + 1)
+            yield from result[0]
+            if last:
+                return
+            page += 1
+            if pending is not None:
+                result, pending = pending.result(), None
+            else:
+                result = fetch(page)
+    finally:
+        if pending is not None:
+            pending.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+async def apaginate(
+    fetch: Callable[[int], Awaitable[PageResult[T]]],
+    per_page: int = MAX_PER_PAGE,
+    start_page: int = 1,
+    max_pages: Optional[int] = None,
+    prefetch: bool = False,
+) -> AsyncIterator[T]:
+    """Async variant of ``paginate``; ``prefetch`` fetches the next page in a task."""
+    pending: Optional["asyncio.Future[PageResult[T]]"] = None
+    page = start_page
+    try:
+        result = await fetch(page)
+        while True:
+            last = _is_last(page, result, per_page, max_pages, start_page)
+            if prefetch and not last:
+                pending = asyncio.ensure_future(fetch(page + 1))
+            for item in result[0]:
+                yield item
+            if last:
+                return
+            page += 1
+            if pending is not None:
+                result, pending = await pending, None
+            else:
+                result = await fetch(page)
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
+async def gather_pages(
+    fetch: Callable[[int], Awaitable[T]],
+    first_page: int,
+    last_page: int,
+    concurrency: int = 5,
+    ordered: bool = True,
+) -> AsyncGenerator[Tuple[int, T], None]:
+    """
+    Fetch ``first_page..last_page`` concurrently and yield ``(page, result)``.
+
+    At most ``concurrency`` requests are in flight at once. With ``ordered``
+    results are yielded in page order, otherwise as soon as each completes.
+    Outstanding requests are cancelled if the consumer stops early or a fetch
+    fails.
+    """
+    pages = iter(range(first_page, last_page + 1))
+    window: Deque[Tuple[int, "asyncio.Future[T]"]] = deque()
+    running: Dict["asyncio.Future[T]", int] = {}
+
+    def schedule() -> None:
+        while len(window) + len(running) < concurrency:
+            page = next(pages, None)
+            if page is None:
+                return
+            task = asyncio.ensure_future(fetch(page))
+            if ordered:
+                window.append((page, task))
+            else:
+                running[task] = page
+
+    try:
+        schedule()
+        if ordered:
+            while window:
+                page, task = window[0]
+                result = await task
+                window.popleft()
+                schedule()
+                yield page, result
+        else:
+            while running:
+                done, _ = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    page = running.pop(task)
+                    schedule()
+                    yield page, task.result()
+    finally:
+        for task in [t for _, t in window] + list(running):
+            task.cancel()
+
+
+async def fan_out(
+    fetch: Callable[[int], Awaitable[PageResult[T]]],
+    max_pages: Optional[int] = None,
+    concurrency: int = 5,
+    ordered: bool = True,
+) -> AsyncIterator[T]:
+    """
+    Yield every item of a paginated endpoint, fetching pages concurrently.
+
+    The first page is fetched alone to learn ``total_pages``; the remaining
+    pages are then requested through ``gather_pages``.
+    """
+    items, pages = await fetch(1)
+    for item in items:
+        yield item
+    if not items or pages is None:
+        return
+    last_page = pages if max_pages is None else min(pages, max_pages)
+    remaining = gather_pages(fetch, 2, last_page, concurrency, ordered)
+    try:
+        async for _, (items, _) in remaining:
+            for item in items:
+                yield item
+    finally:
+        await remaining.aclose()
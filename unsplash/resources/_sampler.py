@@ -0,0 +1,279 @@
+import asyncio
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, Optional, Sequence, Tuple
+
+from ..errors import NotFoundError
+from ..models import Photo
+from ._pagination import MAX_PER_PAGE
+
+if TYPE_CHECKING:
+    from .photos import AsyncPhotosResource, PhotosResource
+
+# (query, orientation, collections, topics, username)
+Filters = Tuple[
+    Optional[str], Optional[str], Tuple[str, ...], Tuple[str, ...], Optional[str]
+]
+
+DEFAULT_LOW_WATERMARK = 10
+
+
+def _filters(
+    query: Optional[str],
+    orientation: Optional[str],
+    collections: Optional[Sequence[str]],
+    topics: Optional[Sequence[str]],
+    username: Optional[str],
+) -> Filters:
+    return (query, orientation, tuple(collections or ()), tuple(topics or ()), username)
+
+
+def _params(filters: Filters) -> Dict[str, Any]:
+    query, orientation, collections, topics, username = filters
+    return {
+        "query": query,
+        "orientation": orientation,
+        "collections": list(collections) or None,
+        "topics": list(topics) or None,
+        "username": username,
+    }
+
+
+def _consume_error(task: "asyncio.Task[None]") -> None:
+    # a failed background refill is retried by the next sample(); only a
+    # caller waiting on a cold pool sees its error
+    if not task.cancelled():
+        task.exception()
+
+
+class _Pools:
+    """Per-filter photo pools shared by the sync and async samplers."""
+
+    def __init__(self, pool_size: int, low_watermark: int):
+        if not 0 <= low_watermark < pool_size <= MAX_PER_PAGE:
+            raise ValueError(f"Need 0 <= low_watermark < pool_size <= {MAX_PER_PAGE}")
+        self.pool_size = pool_size
+        self.low_watermark = low_watermark
+        self.pools: Dict[Filters, Deque[Photo]] = {}
+
+    def take(self, filters: Filters) -> Tuple[Optional[Photo], bool]:
+        """Pop a photo (None if the pool is empty) and whether a refill is needed."""
+        pool = self.pools.get(filters)
+        if not pool:
+            return None, True
+        return pool.popleft(), len(pool) < self.low_watermark
+
+    def add(self, filters: Filters, photos: List[Photo]) -> None:
+        pool = self.pools.setdefault(filters, deque())
+        # the API may repeat a photo between calls; keep the pool free of duplicates
+        ids = {photo.id for photo in pool}
+        pool.extend(photo for photo in photos if photo.id not in ids)
+        if not pool:
+            # without this a cold sample() would refill forever
+            raise NotFoundError("No photos match these filters")
+
+    def size(self, filters: Filters) -> int:
+        return len(self.pools.get(filters, ()))
+
+
+class RandomPhotoSampler:
+    """
+    Serves random photos from in-memory pools, one pool per filter set.
+
+    ``sample()`` pops a photo in O(1). When a pool drops below
+    ``low_watermark`` it is refilled with one ``/photos/random?count=``
+    request on a background thread, so steady-state calls never wait on the
+    API. Only a cold (or exhausted) pool makes the caller wait for its refill.
+    Safe to share between threads. Create it with ``client.photos.sampler()``.
+
+    Args:
+        photos: The client's ``photos`` resource.
+        pool_size: Photos fetched per refill (at most 30, the default).
+        low_watermark: Pool size below which a refill starts (default 10).
+    """
+
+    def __init__(
+        self,
+        photos: "PhotosResource",
+        pool_size: int = MAX_PER_PAGE,
+        low_watermark: int = DEFAULT_LOW_WATERMARK,
+    ):
+        self._photos = photos
+        self._pools = _Pools(pool_size, low_watermark)
+        self._lock = threading.Lock()
+        self._pending: Dict[Filters, "Future[None]"] = {}
+        self._executor = ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="unsplash-sampler"
+        )
+
+    def sample(
+        self,
+        query: Optional[str] = None,
+        orientation: Optional[str] = None,
+        collections: Optional[Sequence[str]] = None,
+        topics: Optional[Sequence[str]] = None,
+        username: Optional[str] = None,
+    ) -> Photo:
+        """A random photo matching the filters (same filters as ``photos.random``)."""
+        filters = _filters(query, orientation, collections, topics, username)
+        while True:
+            with self._lock:
+                photo, low = self._pools.take(filters)
+                pending = self._pending.get(filters)
+                if low and pending is None:
+                    pending = self._pending[filters] = self._executor.submit(
+                        self._refill, filters
+                    )
+            if photo is not None:
+                return photo
+            # cold pool: wait for the refill, raising its error if it failed
+            assert pending is not None
+            pending.result()
+
+    def prefill(
+        self,
+        query: Optional[str] = None,
+        orientation: Optional[str] = None,
+        collections: Optional[Sequence[str]] = None,
+        topics: Optional[Sequence[str]] = None,
+        username: Optional[str] = None,
+    ) -> None:
+        """Fill the pool for these filters now, e.g. at startup."""
+        self._refill(
+            _filters(query, orientation, collections, topics, username), pending=False
+        )
+
+    def size(
+        self,
+        query: Optional[str] = None,
+        orientation: Optional[str] = None,
+        collections: Optional[Sequence[str]] = None,
+        topics: Optional[Sequence[str]] = None,
+        username: Optional[str] = None,
+    ) -> int:
+        """Photos currently pooled for the given filters."""
+        with self._lock:
+            return self._pools.size(
+                _filters(query, orientation, collections, topics, username)
+            )
+
+    def _refill(self, filters: Filters, pending: bool = True) -> None:
+        try:
+            photos = self._photos.random(
+                count=self._pools.pool_size, **_params(filters)
+            )
+            with self._lock:
+                self._pools.add(
+                    filters, photos if isinstance(photos, list) else [photos]
+                )
+        finally:
+            if pending:
+                with self._lock:
+                    self._pending.pop(filters, None)
+
+    def close(self) -> None:
+        """Stop the refill threads; pooled photos can no longer be replenished."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self) -> "RandomPhotoSampler":
+        return self
+
+    def __exit__(self, exc_type: object, exc_val: object, exc_tb: object) -> None:
+        self.close()
+
+
+class AsyncRandomPhotoSampler:
+    """
+    Async ``RandomPhotoSampler``: refills run as asyncio tasks on the running loop.
+
+    Args:
+        photos: The async client's ``photos`` resource.
+        pool_size: Photos fetched per refill (at most 30, the default).
+        low_watermark: Pool size below which a refill starts (default 10).
+    """
+
+    def __init__(
+        self,
+        photos: "AsyncPhotosResource",
+        pool_size: int = MAX_PER_PAGE,
+        low_watermark: int = DEFAULT_LOW_WATERMARK,
+    ):
+        self._photos = photos
+        self._pools = _Pools(pool_size, low_watermark)
+        self._pending: Dict[Filters, "asyncio.Task[None]"] = {}
+
+    async def sample(
+        self,
+        query: Optional[str] = None,
+        orientation: Optional[str] = None,
+        collections: Optional[Sequence[str]] = None,
+        topics: Optional[Sequence[str]] = None,
+        username: Optional[str] = None,
+    ) -> Photo:
+        """A random photo matching the filters (same filters as ``photos.random``)."""
+        filters = _filters(query, orientation, collections, topics, username)
+        while True:
+            photo, low = self._pools.take(filters)
+            pending = self._pending.get(filters)
+            if low and pending is None:
+                pending = self._pending[filters] = asyncio.ensure_future(
+                    self._refill(filters)
+                )
+                pending.add_done_callback(_consume_error)
+            if photo is not None:
+                return photo
+            assert pending is not None
+            # shielded: a cancelled caller must not cancel a refill others wait on
+            await asyncio.shield(pending)
+
+    async def prefill(
+        self,
+        query: Optional[str] = None,
+        orientation: Optional[str] = None,
+        collections: Optional[Sequence[str]] = None,
+        topics: Optional[Sequence[str]] = None,
+        username: Optional[str] = None,
+    ) -> None:
+        """Fill the pool for these filters now, e.g. at startup."""
+        await self._refill(
+            _filters(query, orientation, collections, topics, username), pending=False
+        )
+
+    def size(
+        self,
+        query: Optional[str] = None,
+        orientation: Optional[str] = None,
+        collections: Optional[Sequence[str]] = None,
+        topics: Optional[Sequence[str]] = None,
+        username: Optional[str] = None,
+    ) -> int:
+        """Photos currently pooled for the given filters."""
+        return self._pools.size(
+            _filters(query, orientation, collections, topics, username)
+        )
+
+    async def _refill(self, filters: Filters, pending: bool = True) -> None:
+        try:
+            photos = await self._photos.random(
+                count=self._pools.pool_size, **_params(filters)
+            )
+            self._pools.add(filters, photos if isinstance(photos, list) else [photos])
+        finally:
+            if pending:
+                self._pending.pop(filters, None)
+
+    async def aclose(self) -> None:
+        """Cancel refills still in flight."""
+        tasks = list(self._pending.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def __aenter__(self) -> "AsyncRandomPhotoSampler":
+        return self
+
+    async def __aexit__(
+        self, exc_type: object, exc_val: object, exc_tb: object
+    ) -> None:
+        await self.aclose()
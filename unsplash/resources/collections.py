@@ -1,5 +1,10 @@
-from typing import List, Optional, TYPE_CHECKING, Dict, Any
+from typing import (
+    List, Optional, Sequence, TYPE_CHECKING, Dict, Any, Iterable, Iterator,
+    AsyncIterator
+)
 from ..models import Collection, Photo
+from ._batch import DEFAULT_CONCURRENCY, BatchResult, fetch_many, afetch_many
+from ._pagination import MAX_PER_PAGE, PageResult, paginate, apaginate, total_pages
 
 if TYPE_CHECKING:
     from .._client_base import HTTPClient, AsyncHTTPClient
@@ -12,8 +17,19 @@ class CollectionsResource:
     
     def get(self, collection_id: str) -> Collection:
         """Get a single collection."""
+        stored = self._client.stored(Collection, collection_id)
+        if stored is not None:
+            return stored
         response = self._client.request("GET", f"/collections/{collection_id}")
-        return Collection.model_validate(response.json())
+        return self._client.parse(response, Collection)
+
+    def get_many(
+        self,
+        collection_ids: Iterable[str],
+        concurrency: int = DEFAULT_CONCURRENCY
+    ) -> BatchResult[Collection]:
+        """Fetch several collections concurrently, collecting per-ID failures."""
+        return fetch_many(lambda key: self.get(key), collection_ids, concurrency)
     
     def list(
         self,
@@ -21,36 +37,88 @@ class CollectionsResource:
         per_page: int = 10
     ) -> List[Collection]:
         """List all collections."""
+        items, _ = self._list_page(page, per_page)
+        return items
+
+    def iter_list(
+        self,
+        per_page: int = MAX_PER_PAGE,
+        max_pages: Optional[int] = None,
+        prefetch: bool = False
+    ) -> Iterator[Collection]:
+        """Iterate over all collections, fetching pages on demand."""
+        return paginate(
+            lambda page: self._list_page(page, per_page),
+            per_page=per_page,
+            max_pages=max_pages,
+            prefetch=prefetch
+        )
+
+    def _list_page(self, page: int, per_page: int) -> PageResult[Collection]:
         response = self._client.request(
             "GET",
             "/collections",
             params={"page": page, "per_page": per_page}
         )
-        return [Collection.model_validate(item) for item in response.json()]
+        items = self._client.parse_many(response, Collection)
+        return items, total_pages(response, per_page)
     
     def photos(
         self,
         collection_id: str,
         page: int = 1,
         per_page: int = 10,
-        orientation: Optional[str] = None
+        orientation: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None
     ) -> List[Photo]:
         """Get photos from a collection."""
         params: Dict[str, Any] = {"page": page, "per_page": per_page}
         if orientation:
             params["orientation"] = orientation
-            
+
+        items, _ = self._photos_page(collection_id, params, fields)
+        return items
+
+    def iter_photos(
+        self,
+        collection_id: str,
+        orientation: Optional[str] = None,
+        per_page: int = MAX_PER_PAGE,
+        max_pages: Optional[int] = None,
+        prefetch: bool = False,
+        fields: Optional[Sequence[str]] = None
+    ) -> Iterator[Photo]:
+        """Iterate over all photos in a collection, fetching pages on demand."""
+        params: Dict[str, Any] = {"per_page": per_page}
+        if orientation:
+            params["orientation"] = orientation
+        return paginate(
+            lambda page: self._photos_page(
+                collection_id, {**params, "page": page}, fields
+            ),
+            per_page=per_page,
+            max_pages=max_pages,
+            prefetch=prefetch
+        )
+
+    def _photos_page(
+        self,
+        collection_id: str,
+        params: Dict[str, Any],
+        fields: Optional[Sequence[str]] = None
+    ) -> PageResult[Photo]:
         response = self._client.request(
             "GET",
             f"/collections/{collection_id}/photos",
             params=params
         )
-        return [Photo.model_validate(item) for item in response.json()]
+        items = self._client.parse_many(response, Photo, fields)
+        return items, total_pages(response, params["per_page"])
 
     def related(self, collection_id: str) -> List[Collection]:
         """Get related collections."""
         response = self._client.request("GET", f"/collections/{collection_id}/related")
-        return [Collection.model_validate(item) for item in response.json()]
+        return self._client.parse_many(response, Collection)
 
 
 class AsyncCollectionsResource:
@@ -61,8 +129,19 @@ class AsyncCollectionsResource:
     
     async def get(self, collection_id: str) -> Collection:
         """Get a single collection."""
+        stored = self._client.stored(Collection, collection_id)
+        if stored is not None:
+            return stored
         response = await self._client.request("GET", f"/collections/{collection_id}")
-        return Collection.model_validate(response.json())
+        return self._client.parse(response, Collection)
+
+    async def get_many(
+        self,
+        collection_ids: Iterable[str],
+        concurrency: int = DEFAULT_CONCURRENCY
+    ) -> BatchResult[Collection]:
+        """Fetch several collections concurrently, collecting per-ID failures."""
+        return await afetch_many(lambda key: self.get(key), collection_ids, concurrency)
     
     async def list(
         self,
@@ -70,33 +149,85 @@ class AsyncCollectionsResource:
         per_page: int = 10
     ) -> List[Collection]:
         """List all collections."""
+        items, _ = await self._list_page(page, per_page)
+        return items
+
+    def iter_list(
+        self,
+        per_page: int = MAX_PER_PAGE,
+        max_pages: Optional[int] = None,
+        prefetch: bool = False
+    ) -> AsyncIterator[Collection]:
+        """Iterate over all collections, fetching pages on demand."""
+        return apaginate(
+            lambda page: self._list_page(page, per_page),
+            per_page=per_page,
+            max_pages=max_pages,
+            prefetch=prefetch
+        )
+
+    async def _list_page(self, page: int, per_page: int) -> PageResult[Collection]:
         response = await self._client.request(
             "GET",
             "/collections",
             params={"page": page, "per_page": per_page}
         )
-        return [Collection.model_validate(item) for item in response.json()]
+        items = self._client.parse_many(response, Collection)
+        return items, total_pages(response, per_page)
     
     async def photos(
         self,
         collection_id: str,
         page: int = 1,
         per_page: int = 10,
-        orientation: Optional[str] = None
+        orientation: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None
     ) -> List[Photo]:
         """Get photos from a collection."""
         params: Dict[str, Any] = {"page": page, "per_page": per_page}
         if orientation:
             params["orientation"] = orientation
-            
+
+        items, _ = await self._photos_page(collection_id, params, fields)
+        return items
+
+    def iter_photos(
+        self,
+        collection_id: str,
+        orientation: Optional[str] = None,
+        per_page: int = MAX_PER_PAGE,
+        max_pages: Optional[int] = None,
+        prefetch: bool = False,
+        fields: Optional[Sequence[str]] = None
+    ) -> AsyncIterator[Photo]:
+        """Iterate over all photos in a collection, fetching pages on demand."""
+        params: Dict[str, Any] = {"per_page": per_page}
+        if orientation:
+            params["orientation"] = orientation
+        return apaginate(
+            lambda page: self._photos_page(
+                collection_id, {**params, "page": page}, fields
+            ),
+            per_page=per_page,
+            max_pages=max_pages,
+            prefetch=prefetch
+        )
+
+    async def _photos_page(
+        self,
+        collection_id: str,
+        params: Dict[str, Any],
+        fields: Optional[Sequence[str]] = None
+    ) -> PageResult[Photo]:
         response = await self._client.request(
             "GET",
             f"/collections/{collection_id}/photos",
             params=params
         )
-        return [Photo.model_validate(item) for item in response.json()]
+        items = self._client.parse_many(response, Photo, fields)
+        return items, total_pages(response, params["per_page"])
 
     async def related(self, collection_id: str) -> List[Collection]:
         """Get related collections."""
         response = await self._client.request("GET", f"/collections/{collection_id}/related")
-        return [Collection.model_validate(item) for item in response.json()]
+        return self._client.parse_many(response, Collection)
@@ -1,5 +1,14 @@
-from typing import List, Optional, Union, TYPE_CHECKING, Dict, Any
+from pathlib import Path
+from typing import (
+    List, Optional, Sequence, Union, TYPE_CHECKING, Dict, Any, Iterable, Iterator,
+    AsyncIterator, Mapping
+)
 from ..models import Photo
+from .._download import DEFAULT_CHUNK_SIZE, PathLike, image_url
+from .._incremental import SyncState, check_bounded, incremental, aincremental
+from ._batch import DEFAULT_CONCURRENCY, BatchResult, fetch_many, afetch_many
+from ._sampler import DEFAULT_LOW_WATERMARK, RandomPhotoSampler, AsyncRandomPhotoSampler
+from ._pagination import MAX_PER_PAGE, PageResult, paginate, apaginate, total_pages
 
 if TYPE_CHECKING:
     from .._client_base import HTTPClient, AsyncHTTPClient
@@ -10,18 +19,75 @@ class PhotosResource:
     def __init__(self, client: "HTTPClient"):
         self._client = client
     
-    def get(self, photo_id: str) -> Photo:
-        """Retrieve a single photo."""
+    def get(self, photo_id: str, fields: Optional[Sequence[str]] = None) -> Photo:
+        """Retrieve a single photo, optionally parsing only ``fields``."""
+        if fields is None:
+            stored = self._client.stored(Photo, photo_id)
+            if stored is not None:
+                return stored
         response = self._client.request("GET", f"/photos/{photo_id}")
-        return Photo.model_validate(response.json())
+        return self._client.parse(response, Photo, fields)
+
+    def get_many(
+        self,
+        photo_ids: Iterable[str],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        fields: Optional[Sequence[str]] = None
+    ) -> BatchResult[Photo]:
+        """Fetch several photos concurrently, collecting per-ID failures."""
+        return fetch_many(lambda key: self.get(key, fields), photo_ids, concurrency)
     
     def list(
         self,
         page: int = 1,
         per_page: int = 10,
-        order_by: str = "latest"
+        order_by: str = "latest",
+        fields: Optional[Sequence[str]] = None
     ) -> List[Photo]:
         """List photos from editorial feed."""
+        items, _ = self._list_page(page, per_page, order_by, fields)
+        return items
+
+    def iter_list(
+        self,
+        order_by: str = "latest",
+        per_page: int = MAX_PER_PAGE,
+        max_pages: Optional[int] = None,
+        prefetch: bool = False,
+        fields: Optional[Sequence[str]] = None
+    ) -> Iterator[Photo]:
+        """Iterate over the editorial feed, fetching pages on demand."""
+        return paginate(
+            lambda page: self._list_page(page, per_page, order_by, fields),
+            per_page=per_page,
+            max_pages=max_pages,
+            prefetch=prefetch
+        )
+
+    def sync(
+        self,
+        state: SyncState,
+        per_page: int = MAX_PER_PAGE,
+        max_pages: Optional[int] = None
+    ) -> Iterator[Photo]:
+        """
+        Yield editorial photos published since the last sync, newest first.
+
+        Pagination stops at the first photo ``state`` has already seen, and
+        photos pushed onto the next page by new arrivals are not repeated.
+        ``state`` advances once the iterator is exhausted. An empty ``state``
+        needs ``max_pages``, or it would walk the entire listing.
+        """
+        check_bounded(state, max_pages)
+        return incremental(self.iter_list("latest", per_page, max_pages), state)
+
+    def _list_page(
+        self,
+        page: int,
+        per_page: int,
+        order_by: str,
+        fields: Optional[Sequence[str]] = None
+    ) -> PageResult[Photo]:
         response = self._client.request(
             "GET",
             "/photos",
@@ -31,7 +97,8 @@ class PhotosResource:
                 "order_by": order_by
             }
         )
-        return [Photo.model_validate(item) for item in response.json()]
+        items = self._client.parse_many(response, Photo, fields)
+        return items, total_pages(response, per_page)
     
     def random(
         self,
@@ -52,11 +119,19 @@ class PhotosResource:
         if count: params["count"] = count
         
         response = self._client.request("GET", "/photos/random", params=params)
-        data = response.json()
-        
-        if isinstance(data, list):
-            return [Photo.model_validate(item) for item in data]
-        return Photo.model_validate(data)
+
+        # the API answers with an array whenever ``count`` is sent
+        if count:
+            return self._client.parse_many(response, Photo)
+        return self._client.parse(response, Photo)
+
+    def sampler(
+        self,
+        pool_size: int = MAX_PER_PAGE,
+        low_watermark: int = DEFAULT_LOW_WATERMARK
+    ) -> RandomPhotoSampler:
+        """Pooled ``random()`` for hot paths; see ``RandomPhotoSampler``."""
+        return RandomPhotoSampler(self, pool_size, low_watermark)
     
     def track_download(self, photo_id: str) -> str:
         """Track photo download (required by API guidelines)."""
@@ -73,6 +148,61 @@ class PhotosResource:
         photo = self.get(photo_id)
         return str(photo.urls.full)
 
+    def download_file(
+        self,
+        photo: Union[Photo, str],
+        path: PathLike,
+        size: str = "full",
+        params: Optional[Mapping[str, Any]] = None,
+        track: bool = True,
+        overwrite: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Path:
+        """
+        Stream a photo's image to disk and return the file path.
+
+        ``path`` is a file, or an existing directory to save ``<photo id>.jpg`` in.
+        ``size`` picks the ``photo.urls`` variant and ``params`` adds imgix
+        parameters such as ``{"w": 2400}``. Partial files are resumed with HTTP
+        Range requests and the final size is checked against the server's.
+        An existing file is kept unless ``overwrite`` is set; otherwise the
+        download is tracked first, as the API guidelines require.
+        """
+        if isinstance(photo, str):
+            photo = self.get(photo)
+        target = Path(path)
+        if target.is_dir():
+            target = target / f"{photo.id}.jpg"
+        if target.exists() and not overwrite:
+            return target
+        url = image_url(photo, size, params)
+        if track:
+            self.track_download(photo.id)
+        return self._client.download(url, target, chunk_size)
+
+    def download_files(
+        self,
+        photos: Iterable[Union[Photo, str]],
+        directory: PathLike,
+        size: str = "full",
+        params: Optional[Mapping[str, Any]] = None,
+        track: bool = True,
+        overwrite: bool = False,
+        concurrency: int = 4
+    ) -> BatchResult[Path]:
+        """Download several photos into ``directory``, ``concurrency`` at a time."""
+        Path(directory).mkdir(parents=True, exist_ok=True)
+        by_id = {
+            photo if isinstance(photo, str) else photo.id: photo for photo in photos
+        }
+        return fetch_many(
+            lambda key: self.download_file(
+                by_id[key], directory, size, params, track, overwrite
+            ),
+            by_id,
+            concurrency
+        )
+
 
 class AsyncPhotosResource:
     """Async handle all photo-related endpoints."""
@@ -80,18 +210,77 @@ class AsyncPhotosResource:
     def __init__(self, client: "AsyncHTTPClient"):
         self._client = client
     
-    async def get(self, photo_id: str) -> Photo:
-        """Retrieve a single photo."""
+    async def get(self, photo_id: str, fields: Optional[Sequence[str]] = None) -> Photo:
+        """Retrieve a single photo, optionally parsing only ``fields``."""
+        if fields is None:
+            stored = self._client.stored(Photo, photo_id)
+            if stored is not None:
+                return stored
         response = await self._client.request("GET", f"/photos/{photo_id}")
-        return Photo.model_validate(response.json())
+        return self._client.parse(response, Photo, fields)
+
+    async def get_many(
+        self,
+        photo_ids: Iterable[str],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        fields: Optional[Sequence[str]] = None
+    ) -> BatchResult[Photo]:
+        """Fetch several photos concurrently, collecting per-ID failures."""
+        return await afetch_many(
+            lambda key: self.get(key, fields), photo_ids, concurrency
+        )
     
     async def list(
         self,
         page: int = 1,
         per_page: int = 10,
-        order_by: str = "latest"
+        order_by: str = "latest",
+        fields: Optional[Sequence[str]] = None
     ) -> List[Photo]:
         """List photos from editorial feed."""
+        items, _ = await self._list_page(page, per_page, order_by, fields)
+        return items
+
+    def iter_list(
+        self,
+        order_by: str = "latest",
+        per_page: int = MAX_PER_PAGE,
+        max_pages: Optional[int] = None,
+        prefetch: bool = False,
+        fields: Optional[Sequence[str]] = None
+    ) -> AsyncIterator[Photo]:
+        """Iterate over the editorial feed, fetching pages on demand."""
+        return apaginate(
+            lambda page: self._list_page(page, per_page, order_by, fields),
+            per_page=per_page,
+            max_pages=max_pages,
+            prefetch=prefetch
+        )
+
+    def sync(
+        self,
+        state: SyncState,
+        per_page: int = MAX_PER_PAGE,
+        max_pages: Optional[int] = None
+    ) -> AsyncIterator[Photo]:
+        """
+        Yield editorial photos published since the last sync, newest first.
+
+        Pagination stops at the first photo ``state`` has already seen, and
+        photos pushed onto the next page by new arrivals are not repeated.
+        ``state`` advances once the iterator is exhausted. An empty ``state``
+        needs ``max_pages``, or it would walk the entire listing.
+        """
+        check_bounded(state, max_pages)
+        return aincremental(self.iter_list("latest", per_page, max_pages), state)
+
+    async def _list_page(
+        self,
+        page: int,
+        per_page: int,
+        order_by: str,
+        fields: Optional[Sequence[str]] = None
+    ) -> PageResult[Photo]:
         response = await self._client.request(
             "GET",
             "/photos",
@@ -101,7 +290,8 @@ class AsyncPhotosResource:
                 "order_by": order_by
             }
         )
-        return [Photo.model_validate(item) for item in response.json()]
+        items = self._client.parse_many(response, Photo, fields)
+        return items, total_pages(response, per_page)
     
     async def random(
         self,
@@ -122,11 +312,19 @@ class AsyncPhotosResource:
         if count: params["count"] = count
         
         response = await self._client.request("GET", "/photos/random", params=params)
-        data = response.json()
-        
-        if isinstance(data, list):
-            return [Photo.model_validate(item) for item in data]
-        return Photo.model_validate(data)
+
+        # the API answers with an array whenever ``count`` is sent
+        if count:
+            return self._client.parse_many(response, Photo)
+        return self._client.parse(response, Photo)
+
+    def sampler(
+        self,
+        pool_size: int = MAX_PER_PAGE,
+        low_watermark: int = DEFAULT_LOW_WATERMARK
+    ) -> AsyncRandomPhotoSampler:
+        """Pooled ``random()`` for hot paths; see ``AsyncRandomPhotoSampler``."""
+        return AsyncRandomPhotoSampler(self, pool_size, low_watermark)
     
     async def track_download(self, photo_id: str) -> str:
         """Track photo download (required by API guidelines)."""
@@ -142,3 +340,58 @@ class AsyncPhotosResource:
         
         photo = await self.get(photo_id)
         return str(photo.urls.full)
+
+    async def download_file(
+        self,
+        photo: Union[Photo, str],
+        path: PathLike,
+        size: str = "full",
+        params: Optional[Mapping[str, Any]] = None,
+        track: bool = True,
+        overwrite: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Path:
+        """
+        Stream a photo's image to disk and return the file path.
+
+        ``path`` is a file, or an existing directory to save ``<photo id>.jpg`` in.
+        ``size`` picks the ``photo.urls`` variant and ``params`` adds imgix
+        parameters such as ``{"w": 2400}``. Partial files are resumed with HTTP
+        Range requests and the final size is checked against the server's.
+        An existing file is kept unless ``overwrite`` is set; otherwise the
+        download is tracked first, as the API guidelines require.
+        """
+        if isinstance(photo, str):
+            photo = await self.get(photo)
+        target = Path(path)
+        if target.is_dir():
+            target = target / f"{photo.id}.jpg"
+        if target.exists() and not overwrite:
+            return target
+        url = image_url(photo, size, params)
+        if track:
+            await self.track_download(photo.id)
+        return await self._client.download(url, target, chunk_size)
+
+    async def download_files(
+        self,
+        photos: Iterable[Union[Photo, str]],
+        directory: PathLike,
+        size: str = "full",
+        params: Optional[Mapping[str, Any]] = None,
+        track: bool = True,
+        overwrite: bool = False,
+        concurrency: int = 4
+    ) -> BatchResult[Path]:
+        """Download several photos into ``directory``, ``concurrency`` at a time."""
+        Path(directory).mkdir(parents=True, exist_ok=True)
+        by_id = {
+            photo if isinstance(photo, str) else photo.id: photo for photo in photos
+        }
+        return await afetch_many(
+            lambda key: self.download_file(
+                by_id[key], directory, size, params, track, overwrite
+            ),
+            by_id,
+            concurrency
+        )
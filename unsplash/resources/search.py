@@ -1,9 +1,22 @@
-from typing import Optional, TYPE_CHECKING, Dict, Any
-from ..models import SearchResults, SearchUsersResults, SearchCollectionsResults
+from typing import (
+    List, Optional, Sequence, TYPE_CHECKING, Dict, Any, Iterator, AsyncIterator
+)
+from ..models import (
+    Photo, User, Collection, SearchResults, SearchUsersResults, SearchCollectionsResults
+)
+from ._pagination import MAX_PER_PAGE, PageResult, paginate, apaginate, fan_out
 
 if TYPE_CHECKING:
     from .._client_base import HTTPClient, AsyncHTTPClient
 
+
+def _results_fields(fields: Optional[Sequence[str]]) -> Optional[List[str]]:
+    """Project ``fields`` of each photo while keeping the result totals."""
+    if not fields:
+        return None
+    return ["total", "total_pages", *(f"results.{field}" for field in fields)]
+
+
 class SearchResource:
     """Handle search endpoints."""
     
@@ -19,7 +32,8 @@ class SearchResource:
         color: Optional[str] = None,
         order_by: Optional[str] = None,
         collections: Optional[str] = None,
-        content_filter: Optional[str] = None
+        content_filter: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None
     ) -> SearchResults:
         """Search photos."""
         params: Dict[str, Any] = {
@@ -34,7 +48,32 @@ class SearchResource:
         if content_filter: params["content_filter"] = content_filter
 
         response = self._client.request("GET", "/search/photos", params=params)
-        return SearchResults.model_validate(response.json())
+        return self._client.parse(response, SearchResults, _results_fields(fields))
+
+    def iter_photos(
+        self,
+        query: str,
+        orientation: Optional[str] = None,
+        color: Optional[str] = None,
+        order_by: Optional[str] = None,
+        collections: Optional[str] = None,
+        content_filter: Optional[str] = None,
+        per_page: int = MAX_PER_PAGE,
+        max_pages: Optional[int] = None,
+        prefetch: bool = False,
+        fields: Optional[Sequence[str]] = None
+    ) -> Iterator[Photo]:
+        """Iterate over all photo search results, fetching pages on demand."""
+        def fetch(page: int) -> PageResult[Photo]:
+            results = self.photos(
+                query, page, per_page, orientation, color, order_by, collections,
+                content_filter, fields
+            )
+            return results.results, results.total_pages
+
+        return paginate(
+            fetch, per_page=per_page, max_pages=max_pages, prefetch=prefetch
+        )
 
     def users(
         self,
@@ -49,7 +88,23 @@ class SearchResource:
             "per_page": per_page
         }
         response = self._client.request("GET", "/search/users", params=params)
-        return SearchUsersResults.model_validate(response.json())
+        return self._client.parse(response, SearchUsersResults)
+
+    def iter_users(
+        self,
+        query: str,
+        per_page: int = MAX_PER_PAGE,
+        max_pages: Optional[int] = None,
+        prefetch: bool = False
+    ) -> Iterator[User]:
+        """Iterate over all user search results, fetching pages on demand."""
+        def fetch(page: int) -> PageResult[User]:
+            results = self.users(query, page, per_page)
+            return results.results, results.total_pages
+
+        return paginate(
+            fetch, per_page=per_page, max_pages=max_pages, prefetch=prefetch
+        )
 
     def collections(
         self,
@@ -64,7 +119,23 @@ class SearchResource:
             "per_page": per_page
         }
         response = self._client.request("GET", "/search/collections", params=params)
-        return SearchCollectionsResults.model_validate(response.json())
+        return self._client.parse(response, SearchCollectionsResults)
+
+    def iter_collections(
+        self,
+        query: str,
+        per_page: int = MAX_PER_PAGE,
+        max_pages: Optional[int] = None,
+        prefetch: bool = False
+    ) -> Iterator[Collection]:
+        """Iterate over all collection search results, fetching pages on demand."""
+        def fetch(page: int) -> PageResult[Collection]:
+            results = self.collections(query, page, per_page)
+            return results.results, results.total_pages
+
+        return paginate(
+            fetch, per_page=per_page, max_pages=max_pages, prefetch=prefetch
+        )
 
 
 class AsyncSearchResource:
@@ -82,7 +153,8 @@ class AsyncSearchResource:
         color: Optional[str] = None,
         order_by: Optional[str] = None,
         collections: Optional[str] = None,
-        content_filter: Optional[str] = None
+        content_filter: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None
     ) -> SearchResults:
         """Search photos."""
         params: Dict[str, Any] = {
@@ -97,7 +169,64 @@ class AsyncSearchResource:
         if content_filter: params["content_filter"] = content_filter
 
         response = await self._client.request("GET", "/search/photos", params=params)
-        return SearchResults.model_validate(response.json())
+        return self._client.parse(response, SearchResults, _results_fields(fields))
+
+    def iter_photos(
+        self,
+        query: str,
+        orientation: Optional[str] = None,
+        color: Optional[str] = None,
+        order_by: Optional[str] = None,
+        collections: Optional[str] = None,
+        content_filter: Optional[str] = None,
+        per_page: int = MAX_PER_PAGE,
+        max_pages: Optional[int] = None,
+        prefetch: bool = False,
+        fields: Optional[Sequence[str]] = None
+    ) -> AsyncIterator[Photo]:
+        """Iterate over all photo search results, fetching pages on demand."""
+        async def fetch(page: int) -> PageResult[Photo]:
+            results = await self.photos(
+                query, page, per_page, orientation, color, order_by, collections,
+                content_filter, fields
+            )
+            return results.results, results.total_pages
+
+        return apaginate(
+            fetch, per_page=per_page, max_pages=max_pages, prefetch=prefetch
+        )
+
+    def photos_all(
+        self,
+        query: str,
+        orientation: Optional[str] = None,
+        color: Optional[str] = None,
+        order_by: Optional[str] = None,
+        collections: Optional[str] = None,
+        content_filter: Optional[str] = None,
+        per_page: int = MAX_PER_PAGE,
+        max_pages: Optional[int] = None,
+        concurrency: int = 5,
+        ordered: bool = True,
+        fields: Optional[Sequence[str]] = None
+    ) -> AsyncIterator[Photo]:
+        """
+        Yield all photo search results, fetching pages concurrently.
+
+        Page 1 reports ``total_pages``; the remaining pages are then fetched with
+        at most ``concurrency`` requests in flight. Set ``ordered=False`` to get
+        results in completion order instead of page order.
+        """
+        async def fetch(page: int) -> PageResult[Photo]:
+            results = await self.photos(
+                query, page, per_page, orientation, color, order_by, collections,
+                content_filter, fields
+            )
+            return results.results, results.total_pages
+
+        return fan_out(
+            fetch, max_pages=max_pages, concurrency=concurrency, ordered=ordered
+        )
 
     async def users(
         self,
@@ -112,7 +241,40 @@ class AsyncSearchResource:
             "per_page": per_page
         }
         response = await self._client.request("GET", "/search/users", params=params)
-        return SearchUsersResults.model_validate(response.json())
+        return self._client.parse(response, SearchUsersResults)
+
+    def iter_users(
+        self,
+        query: str,
+        per_page: int = MAX_PER_PAGE,
+        max_pages: Optional[int] = None,
+        prefetch: bool = False
+    ) -> AsyncIterator[User]:
+        """Iterate over all user search results, fetching pages on demand."""
+        async def fetch(page: int) -> PageResult[User]:
+            results = await self.users(query, page, per_page)
+            return results.results, results.total_pages
+
+        return apaginate(
+            fetch, per_page=per_page, max_pages=max_pages, prefetch=prefetch
+        )
+
+    def users_all(
+        self,
+        query: str,
+        per_page: int = MAX_PER_PAGE,
+        max_pages: Optional[int] = None,
+        concurrency: int = 5,
+        ordered: bool = True
+    ) -> AsyncIterator[User]:
+        """Yield all user search results, fetching pages concurrently."""
+        async def fetch(page: int) -> PageResult[User]:
+            results = await self.users(query, page, per_page)
+            return results.results, results.total_pages
+
+        return fan_out(
+            fetch, max_pages=max_pages, concurrency=concurrency, ordered=ordered
+        )
 
     async def collections(
         self,
@@ -127,4 +289,37 @@ class AsyncSearchResource:
             "per_page": per_page
         }
         response = await self._client.request("GET", "/search/collections", params=params)
-        return SearchCollectionsResults.model_validate(response.json())
+        return self._client.parse(response, SearchCollectionsResults)
+
+    def iter_collections(
+        self,
+        query: str,
+        per_page: int = MAX_PER_PAGE,
+        max_pages: Optional[int] = None,
+        prefetch: bool = False
+    ) -> AsyncIterator[Collection]:
+        """Iterate over all collection search results, fetching pages on demand."""
+        async def fetch(page: int) -> PageResult[Collection]:
+            results = await self.collections(query, page, per_page)
+            return results.results, results.total_pages
+
+        return apaginate(
+            fetch, per_page=per_page, max_pages=max_pages, prefetch=prefetch
+        )
+
+    def collections_all(
+        self,
+        query: str,
+        per_page: int = MAX_PER_PAGE,
+        max_pages: Optional[int] = None,
+        concurrency: int = 5,
+        ordered: bool = True
+    ) -> AsyncIterator[Collection]:
+        """Yield all collection search results, fetching pages concurrently."""
+        async def fetch(page: int) -> PageResult[Collection]:
+            results = await self.collections(query, page, per_page)
+            return results.results, results.total_pages
+
+        return fan_out(
+            fetch, max_pages=max_pages, concurrency=concurrency, ordered=ordered
+        )
@@ -1,5 +1,11 @@
-from typing import List, Optional, Union, TYPE_CHECKING, Dict, Any, cast
+from typing import (
+    List, Optional, Sequence, Union, TYPE_CHECKING, Dict, Any, cast, Iterable, Iterator,
+    AsyncIterator
+)
 from ..models import User, Photo, Collection
+from .._incremental import SyncState, check_bounded, incremental, aincremental
+from ._batch import DEFAULT_CONCURRENCY, BatchResult, fetch_many, afetch_many
+from ._pagination import MAX_PER_PAGE, PageResult, paginate, apaginate, total_pages
 
 if TYPE_CHECKING:
     from .._client_base import HTTPClient, AsyncHTTPClient
@@ -12,8 +18,19 @@ class UsersResource:
     
     def get(self, username: str) -> User:
         """Get public details on a user."""
+        stored = self._client.stored(User, username)
+        if stored is not None:
+            return stored
         response = self._client.request("GET", f"/users/{username}")
-        return User.model_validate(response.json())
+        return self._client.parse(response, User)
+
+    def get_many(
+        self,
+        usernames: Iterable[str],
+        concurrency: int = DEFAULT_CONCURRENCY
+    ) -> BatchResult[User]:
+        """Fetch several users concurrently, collecting per-ID failures."""
+        return fetch_many(lambda key: self.get(key), usernames, concurrency)
     
     def portfolio(self, username: str) -> str:
         """Retrieve a user's portfolio link."""
@@ -29,7 +46,8 @@ class UsersResource:
         stats: bool = False,
         resolution: str = "days",
         quantity: int = 30,
-        orientation: Optional[str] = None
+        orientation: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None
     ) -> List[Photo]:
         """Get a user's photos."""
         params: Dict[str, Any] = {
@@ -43,17 +61,58 @@ class UsersResource:
             params["quantity"] = quantity
         if orientation:
             params["orientation"] = orientation
-            
-        response = self._client.request("GET", f"/users/{username}/photos", params=params)
-        return [Photo.model_validate(item) for item in response.json()]
-    
+
+        items, _ = self._photo_page(f"/users/{username}/photos", params, fields)
+        return items
+
+    def iter_photos(
+        self,
+        username: str,
+        order_by: str = "latest",
+        orientation: Optional[str] = None,
+        per_page: int = MAX_PER_PAGE,
+        max_pages: Optional[int] = None,
+        prefetch: bool = False,
+        fields: Optional[Sequence[str]] = None
+    ) -> Iterator[Photo]:
+        """Iterate over all of a user's photos, fetching pages on demand."""
+        params: Dict[str, Any] = {"per_page": per_page, "order_by": order_by}
+        if orientation:
+            params["orientation"] = orientation
+        return paginate(
+            lambda page: self._photo_page(
+                f"/users/{username}/photos", {**params, "page": page}, fields
+            ),
+            per_page=per_page,
+            max_pages=max_pages,
+            prefetch=prefetch
+        )
+
+
+    def sync_photos(
+        self,
+        username: str,
+        state: SyncState,
+        per_page: int = MAX_PER_PAGE,
+        max_pages: Optional[int] = None
+    ) -> Iterator[Photo]:
+        """Yield a user's photos uploaded since the last sync (see ``photos.sync``)."""
+        check_bounded(state, max_pages)
+        return incremental(
+            self.iter_photos(
+                username, "latest", per_page=per_page, max_pages=max_pages
+            ),
+            state
+        )
+
     def likes(
         self,
         username: str,
         page: int = 1,
         per_page: int = 10,
         order_by: str = "latest",
-        orientation: Optional[str] = None
+        orientation: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None
     ) -> List[Photo]:
         """Get a user's liked photos."""
         params: Dict[str, Any] = {
@@ -64,8 +123,31 @@ class UsersResource:
         if orientation:
             params["orientation"] = orientation
 
-        response = self._client.request("GET", f"/users/{username}/likes", params=params)
-        return [Photo.model_validate(item) for item in response.json()]
+        items, _ = self._photo_page(f"/users/{username}/likes", params, fields)
+        return items
+
+    def iter_likes(
+        self,
+        username: str,
+        order_by: str = "latest",
+        orientation: Optional[str] = None,
+        per_page: int = MAX_PER_PAGE,
+        max_pages: Optional[int] = None,
+        prefetch: bool = False,
+        fields: Optional[Sequence[str]] = None
+    ) -> Iterator[Photo]:
+        """Iterate over all of a user's liked photos, fetching pages on demand."""
+        params: Dict[str, Any] = {"per_page": per_page, "order_by": order_by}
+        if orientation:
+            params["orientation"] = orientation
+        return paginate(
+            lambda page: self._photo_page(
+                f"/users/{username}/likes", {**params, "page": page}, fields
+            ),
+            per_page=per_page,
+            max_pages=max_pages,
+            prefetch=prefetch
+        )
     
     def collections(
         self,
@@ -74,18 +156,52 @@ class UsersResource:
         per_page: int = 10
     ) -> List[Collection]:
         """Get a user's collections."""
-        params = {
-            "page": page,
-            "per_page": per_page
-        }
-        response = self._client.request("GET", f"/users/{username}/collections", params=params)
-        return [Collection.model_validate(item) for item in response.json()]
+        items, _ = self._collection_page(username, page, per_page)
+        return items
+
+    def iter_collections(
+        self,
+        username: str,
+        per_page: int = MAX_PER_PAGE,
+        max_pages: Optional[int] = None,
+        prefetch: bool = False
+    ) -> Iterator[Collection]:
+        """Iterate over all of a user's collections, fetching pages on demand."""
+        return paginate(
+            lambda page: self._collection_page(username, page, per_page),
+            per_page=per_page,
+            max_pages=max_pages,
+            prefetch=prefetch
+        )
 
     def statistics(self, username: str) -> Dict[str, Any]: # TODO: Define Statistics model if needed
         """Get a user's statistics."""
         response = self._client.request("GET", f"/users/{username}/statistics")
         return cast(Dict[str, Any], response.json())
 
+    def _photo_page(
+        self,
+        path: str,
+        params: Dict[str, Any],
+        fields: Optional[Sequence[str]] = None
+    ) -> PageResult[Photo]:
+        response = self._client.request("GET", path, params=params)
+        items = self._client.parse_many(response, Photo, fields)
+        return items, total_pages(response, params["per_page"])
+
+    def _collection_page(
+        self, username: str, page: int, per_page: int
+    ) -> PageResult[Collection]:
+        params = {
+            "page": page,
+            "per_page": per_page
+        }
+        response = self._client.request(
+            "GET", f"/users/{username}/collections", params=params
+        )
+        items = self._client.parse_many(response, Collection)
+        return items, total_pages(response, per_page)
+
 
 class AsyncUsersResource:
     """Async handle user-related endpoints."""
@@ -95,8 +211,19 @@ class AsyncUsersResource:
     
     async def get(self, username: str) -> User:
         """Get public details on a user."""
+        stored = self._client.stored(User, username)
+        if stored is not None:
+            return stored
         response = await self._client.request("GET", f"/users/{username}")
-        return User.model_validate(response.json())
+        return self._client.parse(response, User)
+
+    async def get_many(
+        self,
+        usernames: Iterable[str],
+        concurrency: int = DEFAULT_CONCURRENCY
+    ) -> BatchResult[User]:
+        """Fetch several users concurrently, collecting per-ID failures."""
+        return await afetch_many(lambda key: self.get(key), usernames, concurrency)
     
     async def portfolio(self, username: str) -> str:
         """Retrieve a user's portfolio link."""
@@ -112,7 +239,8 @@ class AsyncUsersResource:
         stats: bool = False,
         resolution: str = "days",
         quantity: int = 30,
-        orientation: Optional[str] = None
+        orientation: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None
     ) -> List[Photo]:
         """Get a user's photos."""
         params: Dict[str, Any] = {
@@ -126,17 +254,58 @@ class AsyncUsersResource:
             params["quantity"] = quantity
         if orientation:
             params["orientation"] = orientation
-            
-        response = await self._client.request("GET", f"/users/{username}/photos", params=params)
-        return [Photo.model_validate(item) for item in response.json()]
-    
+
+        items, _ = await self._photo_page(f"/users/{username}/photos", params, fields)
+        return items
+
+    def iter_photos(
+        self,
+        username: str,
+        order_by: str = "latest",
+        orientation: Optional[str] = None,
+        per_page: int = MAX_PER_PAGE,
+        max_pages: Optional[int] = None,
+        prefetch: bool = False,
+        fields: Optional[Sequence[str]] = None
+    ) -> AsyncIterator[Photo]:
+        """Iterate over all of a user's photos, fetching pages on demand."""
+        params: Dict[str, Any] = {"per_page": per_page, "order_by": order_by}
+        if orientation:
+            params["orientation"] = orientation
+        return apaginate(
+            lambda page: self._photo_page(
+                f"/users/{username}/photos", {**params, "page": page}, fields
+            ),
+            per_page=per_page,
+            max_pages=max_pages,
+            prefetch=prefetch
+        )
+
+
+    def sync_photos(
+        self,
+        username: str,
+        state: SyncState,
+        per_page: int = MAX_PER_PAGE,
+        max_pages: Optional[int] = None
+    ) -> AsyncIterator[Photo]:
+        """Yield a user's photos uploaded since the last sync (see ``photos.sync``)."""
+        check_bounded(state, max_pages)
+        return aincremental(
+            self.iter_photos(
+                username, "latest", per_page=per_page, max_pages=max_pages
+            ),
+            state
+        )
+
     async def likes(
         self,
         username: str,
         page: int = 1,
         per_page: int = 10,
         order_by: str = "latest",
-        orientation: Optional[str] = None
+        orientation: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None
     ) -> List[Photo]:
         """Get a user's liked photos."""
         params: Dict[str, Any] = {
@@ -147,8 +316,31 @@ class AsyncUsersResource:
         if orientation:
             params["orientation"] = orientation
 
-        response = await self._client.request("GET", f"/users/{username}/likes", params=params)
-        return [Photo.model_validate(item) for item in response.json()]
+        items, _ = await self._photo_page(f"/users/{username}/likes", params, fields)
+        return items
+
+    def iter_likes(
+        self,
+        username: str,
+        order_by: str = "latest",
+        orientation: Optional[str] = None,
+        per_page: int = MAX_PER_PAGE,
+        max_pages: Optional[int] = None,
+        prefetch: bool = False,
+        fields: Optional[Sequence[str]] = None
+    ) -> AsyncIterator[Photo]:
+        """Iterate over all of a user's liked photos, fetching pages on demand."""
+        params: Dict[str, Any] = {"per_page": per_page, "order_by": order_by}
+        if orientation:
+            params["orientation"] = orientation
+        return apaginate(
+            lambda page: self._photo_page(
+                f"/users/{username}/likes", {**params, "page": page}, fields
+            ),
+            per_page=per_page,
+            max_pages=max_pages,
+            prefetch=prefetch
+        )
     
     async def collections(
         self,
@@ -157,14 +349,48 @@ class AsyncUsersResource:
         per_page: int = 10
     ) -> List[Collection]:
         """Get a user's collections."""
-        params = {
-            "page": page,
-            "per_page": per_page
-        }
-        response = await self._client.request("GET", f"/users/{username}/collections", params=params)
-        return [Collection.model_validate(item) for item in response.json()]
+        items, _ = await self._collection_page(username, page, per_page)
+        return items
+
+    def iter_collections(
+        self,
+        username: str,
+        per_page: int = MAX_PER_PAGE,
+        max_pages: Optional[int] = None,
+        prefetch: bool = False
+    ) -> AsyncIterator[Collection]:
+        """Iterate over all of a user's collections, fetching pages on demand."""
+        return apaginate(
+            lambda page: self._collection_page(username, page, per_page),
+            per_page=per_page,
+            max_pages=max_pages,
+            prefetch=prefetch
+        )
 
     async def statistics(self, username: str) -> Dict[str, Any]: # TODO: Define Statistics model if needed
         """Get a user's statistics."""
         response = await self._client.request("GET", f"/users/{username}/statistics")
         return cast(Dict[str, Any], response.json())
+
+    async def _photo_page(
+        self,
+        path: str,
+        params: Dict[str, Any],
+        fields: Optional[Sequence[str]] = None
+    ) -> PageResult[Photo]:
+        response = await self._client.request("GET", path, params=params)
+        items = self._client.parse_many(response, Photo, fields)
+        return items, total_pages(response, params["per_page"])
+
+    async def _collection_page(
+        self, username: str, page: int, per_page: int
+    ) -> PageResult[Collection]:
+        params = {
+            "page": page,
+            "per_page": per_page
+        }
+        response = await self._client.request(
+            "GET", f"/users/{username}/collections", params=params
+        )
+        items = self._client.parse_many(response, Collection)
+        return items, total_pages(response, per_page)